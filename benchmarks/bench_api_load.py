@@ -0,0 +1,219 @@
+#!/usr/bin/env python3
+"""
+Load-test the snapshot endpoints of api_server before and after precompiling.
+
+Serves synthetic clustering/layout data (L2 clusters of L1 clusters of
+memories) from two uvicorn servers in subprocesses:
+- before: handlers build the dict and JSONResponse serializes it per request
+  (the previous handler bodies, via api_server's build_* functions)
+- after: api_server's own handlers, returning precompiled bytes
+
+A small asyncio HTTP/1.1 keep-alive client then drives each endpoint for a
+fixed time with a number of concurrent connections and reports req/s and
+latency. Response bodies of both servers are compared first.
+
+Usage:
+    python benchmarks/bench_api_load.py
+    python benchmarks/bench_api_load.py --memories 50000 --l2 200 --connections 64 --seconds 10
+"""
+
+import argparse
+import asyncio
+import gzip
+import json
+import random
+import socket
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+CATEGORIES = ["decision", "cce_decision_log", "cce_research", "cce_failed_approach",
+              "cce_success_log", "cce_system", "cce", "architecture", "slack"]
+
+
+def synthetic_snapshot(n_memories, n_l2, l1_per_l2=12, seed=0):
+    """clustering_data and layout_data shaped like cluster_memories / compute_layout output."""
+    rng = random.Random(seed)
+    l1, l2, l1_pos, l2_pos = {}, {}, {}, {}
+    next_l1 = 0
+    for c2 in range(n_l2):
+        ids = list(range(next_l1, next_l1 + rng.randint(1, 2 * l1_per_l2)))
+        next_l1 += len(ids)
+        for c1 in ids:
+            l1[str(c1)] = {"label": f"Topic {c1}", "size": rng.randint(1, 200),
+                           "dominant_category": rng.choice(CATEGORIES)}
+            l1_pos[str(c1)] = {"x": rng.uniform(-500, 500), "y": rng.uniform(-500, 500)}
+        l2[str(c2)] = {"label": f"Theme {c2}", "total_size": sum(l1[str(c)]["size"] for c in ids),
+                       "dominant_category": rng.choice(CATEGORIES), "l1_clusters": ids}
+        l2_pos[str(c2)] = {"x": rng.uniform(-1000, 1000), "y": rng.uniform(-1000, 1000)}
+    clustering = {"memories": [{"id": f"m{i}"} for i in range(n_memories)], "clusters": {"l1": l1, "l2": l2}}
+    layout = {"positions": {"l1_clusters": l1_pos, "l2_clusters": l2_pos}}
+    return clustering, layout
+
+
+def serve(mode, port, n_memories, n_l2):
+    """Subprocess entry: load the synthetic snapshot and serve it."""
+    import uvicorn
+    import api_server
+
+    clustering, layout = synthetic_snapshot(n_memories, n_l2)
+    snap = api_server.Snapshot("bench", clustering, layout)
+    api_server.snapshot = snap
+    api_server.load_data = lambda: snap  # startup would look for real data files
+    if mode == "after":
+        api_server.precompile_responses(snap)
+        app = api_server.app
+    else:
+        from fastapi import FastAPI, HTTPException
+        app = FastAPI()
+
+        @app.get("/api/overview")
+        async def overview():
+            return api_server.build_overview(snap)
+
+        @app.get("/api/l2/{cluster_id}")
+        async def l2_detail(cluster_id: str):
+            if cluster_id not in clustering["clusters"]["l2"]:
+                raise HTTPException(status_code=404)
+            return api_server.build_l2_detail(snap, cluster_id)
+
+        @app.get("/api/clusters/{level}")
+        async def clusters(level: str):
+            return api_server.build_clusters(snap, level)
+
+        @app.get("/api/stats")
+        async def stats():
+            return api_server.build_stats(snap)
+
+        @app.get("/api/visualization-options")
+        async def options():
+            return api_server.VISUALIZATION_OPTIONS
+
+    uvicorn.run(app, host="127.0.0.1", port=port, log_level="warning", access_log=False)
+
+
+def free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+async def request(reader, writer, path, gzip_ok):
+    """One keep-alive GET; returns (status, decoded body)."""
+    accept = "Accept-Encoding: gzip\r\n" if gzip_ok else ""
+    writer.write(f"GET {path} HTTP/1.1\r\nHost: bench\r\n{accept}\r\n".encode())
+    head = await reader.readuntil(b"\r\n\r\n")
+    lines = head.decode().split("\r\n")
+    headers = dict(line.lower().split(": ", 1) for line in lines[1:] if ": " in line)
+    body = await reader.readexactly(int(headers.get("content-length", 0)))
+    if headers.get("content-encoding") == "gzip":
+        body = gzip.decompress(body)
+    return int(lines[0].split()[1]), body
+
+
+async def fetch(port, path, gzip_ok=False):
+    reader, writer = await asyncio.open_connection("127.0.0.1", port)
+    try:
+        return await request(reader, writer, path, gzip_ok)
+    finally:
+        writer.close()
+
+
+async def drive(port, paths, connections, seconds, gzip_ok):
+    """Round-robin paths over keep-alive connections; returns (requests, latencies)."""
+    deadline = time.perf_counter() + seconds
+    latencies = []
+
+    async def worker(offset):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        i = offset
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, paths[i % len(paths)], gzip_ok)
+            latencies.append(time.perf_counter() - start)
+            if status != 200:
+                raise RuntimeError(f"{paths[i % len(paths)]}: HTTP {status}")
+            i += 1
+        writer.close()
+
+    await asyncio.gather(*(worker(c) for c in range(connections)))
+    return latencies
+
+
+async def wait_ready(port, timeout=30):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            await fetch(port, "/api/stats")
+            return
+        except OSError:
+            if time.perf_counter() > deadline:
+                raise
+            await asyncio.sleep(0.1)
+
+
+async def run(args):
+    ports = {mode: free_port() for mode in ("before", "after")}
+    servers = [subprocess.Popen([sys.executable, __file__, "--serve", mode, "--port", str(port),
+                                 "--memories", str(args.memories), "--l2", str(args.l2)])
+               for mode, port in ports.items()]
+    try:
+        for port in ports.values():
+            await wait_ready(port)
+
+        _, layout = synthetic_snapshot(args.memories, args.l2)
+        l2_ids = list(layout["positions"]["l2_clusters"])
+        endpoints = {
+            "/api/overview": ["/api/overview"],
+            "/api/l2/{id}": [f"/api/l2/{c}" for c in l2_ids],
+            "/api/clusters/l1": ["/api/clusters/l1"],
+            "/api/stats": ["/api/stats"],
+            "/api/visualization-options": ["/api/visualization-options"],
+        }
+
+        mismatches = 0
+        for paths in endpoints.values():
+            for path in paths[:20]:
+                bodies = [json.loads((await fetch(port, path, gzip_ok=True))[1]) for port in ports.values()]
+                mismatches += bodies[0] != bodies[1]
+        print(f"Snapshot: {args.memories:,} memories, {args.l2} L2 clusters; "
+              f"{args.connections} connections x {args.seconds}s per run; body mismatches: {mismatches}\n")
+
+        print(f"{'endpoint':<28} {'mode':<7} {'req/s':>9} {'p50':>8} {'p99':>8}")
+        for name, paths in endpoints.items():
+            rates = {}
+            for mode, port in ports.items():
+                latencies = await drive(port, paths, args.connections, args.seconds, args.gzip)
+                latencies.sort()
+                rates[mode] = len(latencies) / args.seconds
+                print(f"{name:<28} {mode:<7} {rates[mode]:>9,.0f} "
+                      f"{latencies[len(latencies) // 2] * 1e3:>6.2f}ms {latencies[int(len(latencies) * 0.99)] * 1e3:>6.2f}ms")
+            print(f"{'':<28} {'':<7} {rates['after'] / rates['before']:>8.1f}x")
+    finally:
+        for server in servers:
+            server.terminate()
+            server.wait()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load-test precompiled snapshot endpoints")
+    parser.add_argument("--memories", type=int, default=20000)
+    parser.add_argument("--l2", type=int, default=100, help="L2 clusters (each with ~12 L1 clusters)")
+    parser.add_argument("--connections", type=int, default=32)
+    parser.add_argument("--seconds", type=float, default=5)
+    parser.add_argument("--gzip", action="store_true", help="Send Accept-Encoding: gzip")
+    parser.add_argument("--serve", choices=["before", "after"], help=argparse.SUPPRESS)
+    parser.add_argument("--port", type=int, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.serve:
+        serve(args.serve, args.port, args.memories, args.l2)
+    else:
+        asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
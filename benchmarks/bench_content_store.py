@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""
+Benchmark the block-compressed content store (src/content_store.py).
+
+Writes a store for synthetic memory texts (templated decision / research
+logs with varying names, ids and numbers) into a temporary directory and
+reports:
+- size on disk against the raw texts and against the same 64 KB blocks
+  compressed without a trained dictionary
+- lookup latency for random ids (mostly block misses) and for ids read
+  cluster by cluster (neighbouring positions, mostly LRU hits)
+
+Every text read back is compared to the original to confirm they match.
+
+Usage:
+    python benchmarks/bench_content_store.py
+    python benchmarks/bench_content_store.py --memories 200000 --cache-blocks 64
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import content_store  # noqa: E402
+
+TEMPLATES = [
+    "Decision: {team} will {verb} the {system} {noun} before {month}. Rationale: {noun} latency on "
+    "{system} reached {n}ms at p99 and {person} measured {m}% of requests retrying. Ticket {ticket}.",
+    "Research log ({person}): compared {system} and {other} for {noun} workloads. {system} handled "
+    "{n} req/s on {m} cores; {other} stalled after {k} minutes. Follow up in {ticket}.",
+    "Failed approach: tried to {verb} {noun} in {system} with {other}. Rolled back on {month} {k} "
+    "after {n} errors. {person}: do not retry without a {noun} budget.",
+    "Success log: {team} shipped {system} {noun} v{k}.{m}. {n} tenants migrated, zero incidents. "
+    "Owner {person}, tracking {ticket}.",
+]
+WORDS = {
+    "team": ["platform", "data", "growth", "infra", "search", "billing"],
+    "verb": ["migrate", "shard", "cache", "deprecate", "rewrite", "batch", "index"],
+    "system": ["Zeus", "Athena", "Atlas", "Postgres", "Redis", "Kafka", "pgvector", "Sigma"],
+    "other": ["DuckDB", "ClickHouse", "SQLite", "Elastic", "Faiss", "Milvus"],
+    "noun": ["ingest", "embedding", "query", "export", "session", "snapshot", "layout", "webhook"],
+    "month": ["January", "March", "May", "July", "September", "November"],
+    "person": ["Ana", "Bo", "Chidi", "Dana", "Eitan", "Farah", "Goro", "Hana"],
+}
+
+
+def synthetic_texts(n, seed=0):
+    rng = random.Random(seed)
+    texts = []
+    for i in range(n):
+        parts = [rng.choice(TEMPLATES).format(
+            n=rng.randint(10, 20000), m=rng.randint(1, 99), k=rng.randint(1, 60),
+            ticket=f"ATH-{rng.randint(100, 9999)}", **{key: rng.choice(values) for key, values in WORDS.items()})
+            for _ in range(rng.randint(1, 6))]
+        texts.append(f"[{i}] " + " ".join(parts))
+    return texts
+
+
+def blocks_without_dictionary(texts, block_size, level):
+    """Stored bytes for the same blocks compressed without a dictionary."""
+    import zstandard as zstd
+
+    compressor = zstd.ZstdCompressor(level=level)
+    total, block = 0, bytearray()
+    for text in texts:
+        block += text.encode("utf-8")
+        if len(block) >= block_size:
+            total += len(compressor.compress(bytes(block)))
+            block = bytearray()
+    return total + (len(compressor.compress(bytes(block))) if block else 0)
+
+
+def timed_lookups(store, texts, positions):
+    start = time.perf_counter()
+    mismatches = sum(store.get(i) != texts[i] for i in positions)
+    return (time.perf_counter() - start) / len(positions), mismatches
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the block-compressed content store")
+    parser.add_argument("--memories", type=int, default=50000)
+    parser.add_argument("--lookups", type=int, default=20000)
+    parser.add_argument("--cache-blocks", type=int, default=content_store.DEFAULT_CACHE_BLOCKS)
+    parser.add_argument("--cluster-size", type=int, default=50, help="Neighbouring positions read per cluster")
+    args = parser.parse_args()
+
+    texts = synthetic_texts(args.memories)
+    ids = [f"m{i}" for i in range(args.memories)]
+    raw = sum(len(text.encode("utf-8")) for text in texts)
+
+    with tempfile.TemporaryDirectory() as directory:
+        start = time.perf_counter()
+        stats = content_store.write_content_store(directory, ids, texts)
+        write_time = time.perf_counter() - start
+        plain = blocks_without_dictionary(texts, content_store.BLOCK_SIZE, content_store.COMPRESSION_LEVEL)
+
+        print(f"Corpus: {args.memories:,} texts, {raw / 1e6:.1f}MB raw, {stats['blocks']} blocks; "
+              f"written in {write_time:.2f}s\n")
+        print(f"{'blocks, no dictionary':<28} {plain / 1e6:>7.2f}MB  {raw / plain:>5.1f}x")
+        stored = stats["stored_bytes"] + stats["dictionary_bytes"]
+        print(f"{'blocks + trained dictionary':<28} {stored / 1e6:>7.2f}MB  {raw / stored:>5.1f}x  "
+              f"(dictionary {stats['dictionary_bytes'] / 1e3:.0f}KB)\n")
+
+        rng = random.Random(1)
+        random_positions = [rng.randrange(args.memories) for _ in range(args.lookups)]
+        clustered_positions = []
+        while len(clustered_positions) < args.lookups:
+            first = rng.randrange(args.memories - args.cluster_size)
+            clustered_positions.extend(range(first, first + args.cluster_size))
+
+        for label, positions in (("random ids", random_positions), ("cluster by cluster", clustered_positions)):
+            store = content_store.ContentStore(directory, cache_blocks=args.cache_blocks)
+            per_lookup, mismatches = timed_lookups(store, texts, positions)
+            print(f"{label:<28} {per_lookup * 1e6:>7.1f}us/lookup  "
+                  f"hit rate {store.hits / (store.hits + store.misses):>5.1%}  mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of the offline pipeline and the API on synthetic data.
+
+For each corpus size, runs every stage as its own process, the way they
+run in production, and records wall time and peak RSS:
+- generate: synthetic_memories.py writes a fixture (reused when one with
+  the same size and seed is already in the work directory)
+- cluster: cluster_memories.py --fixture (k-NN graph, Leiden, content store)
+- layout: compute_layout.py on the clustering results
+- api: api_server under uvicorn on the resulting snapshot; time until the
+  snapshot is loaded, then req/s, p50 and p99 per endpoint from a
+  keep-alive client (bench_api_load's)
+
+A stage that fails is recorded with the tail of its log and the later
+stages of that size are skipped. The JSON report carries the commit it was
+run at, so reports from two commits can be compared with --compare.
+
+The k-NN step compares every memory with every other, so 1M memories
+takes hours and tens of GB; the default sizes stop at 100k.
+
+Usage:
+    python benchmarks/bench_end_to_end.py
+    python benchmarks/bench_end_to_end.py --sizes 10000 100000 1000000 --report output/bench/e2e.json
+    python benchmarks/bench_end_to_end.py --baseline output/bench/e2e_main.json
+    python benchmarks/bench_end_to_end.py --compare output/bench/e2e_main.json output/bench/e2e.json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+SRC = ROOT / "src"
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+from bench_api_load import drive, fetch, free_port  # noqa: E402
+
+REPORT_VERSION = 1
+SAMPLE_PATHS = 50  # Distinct ids per parameterized endpoint
+
+
+def git_commit() -> dict:
+    def git(*args):
+        return subprocess.run(["git", *args], cwd=ROOT, capture_output=True, text=True).stdout.strip()
+    return {"commit": git("rev-parse", "HEAD") or None, "dirty": bool(git("status", "--porcelain", "--", "src"))}
+
+
+def wait_rusage(process: subprocess.Popen):
+    """Reap the process; returns (exit code, peak RSS in MB) of that child alone."""
+    _, status, usage = os.wait4(process.pid, 0)
+    process.returncode = os.waitstatus_to_exitcode(status)
+    # ru_maxrss is KB on Linux, bytes on macOS
+    peak = usage.ru_maxrss / (1e6 if sys.platform == "darwin" else 1e3)
+    return process.returncode, round(peak, 1)
+
+
+def run_stage(name: str, cmd: list, log_path: Path, cwd: Path = ROOT) -> dict:
+    cmd = [str(c) for c in cmd]
+    print(f"  {name:<9} {' '.join(cmd[1:])}")
+    start = time.perf_counter()
+    with open(log_path, "w") as log:
+        process = subprocess.Popen(cmd, cwd=cwd, stdout=log, stderr=subprocess.STDOUT)
+        code, peak = wait_rusage(process)
+    result = {"seconds": round(time.perf_counter() - start, 2), "peak_rss_mb": peak}
+    if code != 0:
+        lines = log_path.read_text(errors="replace").strip().splitlines()
+        result["error"] = lines[-1] if lines else f"exit code {code}"
+        print(f"            failed: {result['error']}")
+    else:
+        print(f"            {result['seconds']:.1f}s, peak RSS {peak:,.0f}MB")
+    return result
+
+
+def endpoint_paths(snapshot_dir: Path, seed: int = 0) -> dict:
+    """A sample of real paths per endpoint from the snapshot's clustering results."""
+    with open(snapshot_dir / "clustering_results.json") as f:
+        clustering = json.load(f)
+    rng = random.Random(seed)
+
+    def sample(values):
+        values = list(values)
+        return rng.sample(values, min(SAMPLE_PATHS, len(values)))
+
+    memories = clustering["memories"]
+    words = sorted({word for m in sample(memories) for word in m.get("content_preview", "").split()[:3]
+                    if word.isalpha() and len(word) > 3})
+    return {
+        "/api/overview": ["/api/overview"],
+        "/api/l2/{id}": [f"/api/l2/{c}" for c in sample(clustering["clusters"]["l2"])],
+        "/api/l1/{id}?limit=100": [f"/api/l1/{c}?limit=100" for c in sample(clustering["clusters"]["l1"])],
+        "/api/memory/{id}": [f"/api/memory/{m['id']}" for m in sample(memories)],
+        "/api/search?q=...": [f"/api/search?q={word}&limit=50" for word in words] or ["/api/search?q=a"],
+    }
+
+
+async def wait_loaded(port: int, timeout: float):
+    deadline = time.perf_counter() + timeout
+    while True:
+        try:
+            _, body = await fetch(port, "/health")
+            if json.loads(body).get("data_loaded"):
+                return
+        except OSError:
+            pass
+        if time.perf_counter() > deadline:
+            raise TimeoutError(f"snapshot not loaded after {timeout:.0f}s")
+        await asyncio.sleep(0.2)
+
+
+def run_api(snapshot_dir: Path, log_path: Path, args) -> dict:
+    port = free_port()
+    env = {**os.environ, "ATHENA_SNAPSHOT_DIR": str(snapshot_dir), "ATHENA_SNAPSHOT_POLL_SECONDS": "0"}
+    print(f"  api       uvicorn on :{port}, {args.connections} connections x {args.seconds}s per endpoint")
+    start = time.perf_counter()
+    with open(log_path, "w") as log:
+        server = subprocess.Popen([sys.executable, "-m", "uvicorn", "api_server:app", "--app-dir", str(SRC),
+                                   "--port", str(port), "--log-level", "warning", "--no-access-log"],
+                                  cwd=ROOT, env=env, stdout=log, stderr=subprocess.STDOUT)
+    result = {}
+    try:
+        asyncio.run(wait_loaded(port, args.startup_timeout))
+        result["startup_seconds"] = round(time.perf_counter() - start, 2)
+        result["endpoints"] = {}
+        for name, paths in endpoint_paths(snapshot_dir).items():
+            latencies = asyncio.run(drive(port, paths, args.connections, args.seconds, False))
+            latencies.sort()
+            if not latencies:
+                result["endpoints"][name] = {"error": "no requests completed"}
+                print(f"            {name:<26} no requests completed")
+                continue
+            result["endpoints"][name] = {
+                "req_s": round(len(latencies) / args.seconds, 1),
+                "p50_ms": round(latencies[len(latencies) // 2] * 1e3, 2),
+                "p99_ms": round(latencies[int(len(latencies) * 0.99)] * 1e3, 2),
+            }
+            print(f"            {name:<26} {result['endpoints'][name]['req_s']:>9,.0f} req/s  "
+                  f"p50 {result['endpoints'][name]['p50_ms']:>7.2f}ms  p99 {result['endpoints'][name]['p99_ms']:>7.2f}ms")
+    except (OSError, RuntimeError, TimeoutError) as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+        print(f"            failed: {result['error']}")
+    finally:
+        server.terminate()
+        _, result["peak_rss_mb"] = wait_rusage(server)
+    print(f"            startup {result.get('startup_seconds', '-')}s, peak RSS {result['peak_rss_mb']:,.0f}MB")
+    return result
+
+
+def directory_mb(path: Path) -> float:
+    return round(sum(f.stat().st_size for f in path.iterdir() if f.is_file()) / 1e6, 1)
+
+
+def fixture_ready(fixture_dir: Path, size: int, seed: int) -> bool:
+    try:
+        with open(fixture_dir / "manifest.json") as f:
+            manifest = json.load(f)
+    except (OSError, ValueError):
+        return False
+    return manifest.get("count") == size and manifest.get("seed") == seed
+
+
+def benchmark_size(size: int, work_dir: Path, args) -> dict:
+    print(f"\n{size:,} memories")
+    fixture_dir = work_dir / f"fixture_{size}"
+    snapshot_dir = work_dir / f"snapshot_{size}"
+    logs = work_dir / "logs"
+    logs.mkdir(parents=True, exist_ok=True)
+    snapshot_dir.mkdir(parents=True, exist_ok=True)
+    python = sys.executable
+
+    stages = {}
+    if fixture_ready(fixture_dir, size, args.seed) and not args.regenerate:
+        print(f"  generate  reusing {fixture_dir}")
+        stages["generate"] = {"reused": True}
+    else:
+        stages["generate"] = run_stage("generate", [python, SRC / "synthetic_memories.py", "--memories", size,
+                                                    "--output", fixture_dir, "--seed", args.seed],
+                                       logs / f"generate_{size}.log")
+    pipeline = [
+        ("cluster", [python, SRC / "cluster_memories.py", "--fixture", fixture_dir, "--limit", size,
+                     "--output-dir", snapshot_dir]),
+        ("layout", [python, SRC / "compute_layout.py", "--data-dir", snapshot_dir]),
+    ]
+    for name, cmd in pipeline:
+        if any("error" in stage for stage in stages.values()):
+            stages[name] = {"skipped": True}
+            continue
+        stages[name] = run_stage(name, cmd, logs / f"{name}_{size}.log")
+
+    result = {"stages": stages, "fixture_mb": directory_mb(fixture_dir) if fixture_dir.exists() else None}
+    if any("error" in stage for stage in stages.values()):
+        result["api"] = {"skipped": True}
+    else:
+        result["snapshot_mb"] = directory_mb(snapshot_dir)
+        result["api"] = run_api(snapshot_dir, logs / f"api_{size}.log", args)
+    return result
+
+
+def flatten(report: dict) -> dict:
+    """"<size> <stage> <metric>" -> value, for comparing reports."""
+    values = {}
+    for size, result in report["sizes"].items():
+        for stage, metrics in result["stages"].items():
+            for metric in ("seconds", "peak_rss_mb"):
+                if metric in metrics:
+                    values[f"{size} {stage} {metric}"] = metrics[metric]
+        api = result.get("api", {})
+        for metric in ("startup_seconds", "peak_rss_mb"):
+            if metric in api:
+                values[f"{size} api {metric}"] = api[metric]
+        for endpoint, metrics in api.get("endpoints", {}).items():
+            for metric, value in metrics.items():
+                if metric != "error":
+                    values[f"{size} {endpoint} {metric}"] = value
+    return values
+
+
+def compare(base: dict, new: dict):
+    print(f"\n{'metric':<52} {'base':>10} {'new':>10} {'change':>8}")
+    print(f"{'(commit)':<52} {(base.get('commit') or '-')[:10]:>10} {(new.get('commit') or '-')[:10]:>10}")
+    old_values, new_values = flatten(base), flatten(new)
+    for key in list(dict.fromkeys([*old_values, *new_values])):
+        old, value = old_values.get(key), new_values.get(key)
+        change = f"{(value - old) / old:+.0%}" if old and value is not None else ""
+        print(f"{key:<52} {old if old is not None else '-':>10} {value if value is not None else '-':>10} {change:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="End-to-end pipeline + API benchmark on synthetic data")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10000, 100000])
+    parser.add_argument("--work-dir", default="output/bench/e2e", help="Fixtures, snapshots and stage logs")
+    parser.add_argument("--report", default="output/bench/e2e_report.json")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--regenerate", action="store_true", help="Rewrite fixtures even if present")
+    parser.add_argument("--connections", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=5, help="Load per endpoint")
+    parser.add_argument("--startup-timeout", type=float, default=900, help="Seconds to wait for the API to load")
+    parser.add_argument("--baseline", help="Report to compare this run against")
+    parser.add_argument("--compare", nargs=2, metavar=("BASE", "NEW"), help="Compare two reports and exit")
+    args = parser.parse_args()
+
+    if args.compare:
+        with open(args.compare[0]) as f, open(args.compare[1]) as g:
+            compare(json.load(f), json.load(g))
+        return
+
+    work_dir = Path(args.work_dir).resolve()
+    report = {
+        "version": REPORT_VERSION,
+        "generated_at": datetime.now().isoformat(),
+        **git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "settings": {"seed": args.seed, "connections": args.connections, "seconds_per_endpoint": args.seconds},
+        "sizes": {},
+    }
+    for size in args.sizes:
+        report["sizes"][str(size)] = benchmark_size(size, work_dir, args)
+
+    report_path = Path(args.report)
+    report_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(report_path, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nReport written to {report_path}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(json.load(f), report)
+
+
+if __name__ == "__main__":
+    main()
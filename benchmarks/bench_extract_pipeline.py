@@ -0,0 +1,120 @@
+#!/usr/bin/env python3
+"""
+Benchmark the extract_zeus_data node-building and edge-generation pipeline.
+
+Feeds synthetic decision/memory rows (same column layout as the SQL queries)
+through build_nodes and every offline edge generator, reporting wall time per
+stage so scaling can be checked at 1k, 10k and 100k nodes. Similarity edges
+are covered separately by bench_similarity.py; database fetches are not timed.
+
+Usage:
+    python benchmarks/bench_extract_pipeline.py
+    python benchmarks/bench_extract_pipeline.py --sizes 1000 10000 100000
+"""
+
+import argparse
+import random
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import extract_zeus_data as ezd  # noqa: E402
+
+MEMORY_SOURCES = [
+    'cce_decision_log', 'cce_research', 'cce_failed_approach', 'cce_success_log',
+    'cce_system', 'cce', 'cce-learning', 'slack',
+]
+PROJECTS = ['athena', 'atlas', 'zeus', 'eclipse', 'canadian-tire', 'osfi', 'seattle-orcas', '']
+WORDS = ("decided use pgvector index cluster leiden layout embedding memory graph "
+         "lori marshall mike deployment azure container refactor api schema").split()
+
+
+def synthetic_rows(n, seed=0):
+    """Generate decision and memory rows newest-first, split like --max-nodes."""
+    rng = random.Random(seed)
+    n_decisions, n_memories = ezd.split_node_budget(n)
+    now = datetime.now(timezone.utc)
+
+    def text():
+        return " ".join(rng.choice(WORDS) for _ in range(rng.randint(20, 120)))
+
+    decisions = []
+    for i in range(n_decisions):
+        decisions.append((
+            f"d-{i}", text(), text(), rng.random(), f"agent-{rng.randint(0, 40)}",
+            now - timedelta(minutes=7 * i),
+        ))
+
+    memories = []
+    for i in range(n_memories):
+        metadata = {
+            "category": rng.choice(ezd.SAFE_CATEGORIES + [None]),
+            "agent_id": f"agent-{rng.randint(0, 40)}",
+            "project": rng.choice(PROJECTS),
+        }
+        if i > 0 and rng.random() < 0.05:
+            metadata["related_memory"] = f"m-{rng.randint(0, i - 1)}"
+        memories.append((
+            f"m-{i}", text(), rng.choice(MEMORY_SOURCES), metadata,
+            now - timedelta(minutes=5 * i),
+        ))
+    return decisions, memories
+
+
+def run(n):
+    decisions, memories = synthetic_rows(n)
+    timings = {}
+
+    start = time.perf_counter()
+    nodes, node_ids, node_metadata = ezd.build_nodes(decisions, memories)
+    timings["build_nodes"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    edges, edge_set = ezd.generate_metadata_edges(nodes, node_ids, node_metadata)
+    timings["metadata"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    edges += ezd.generate_temporal_edges(node_ids, node_metadata, edge_set)
+    timings["temporal"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    edges += ezd.generate_hub_edges(nodes, edge_set)
+    timings["hub"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    contrib_nodes, contrib_edges = ezd.generate_contributor_nodes_and_edges(
+        nodes, node_ids, node_metadata, edge_set)
+    edges += contrib_edges
+    timings["contributor"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    hierarchy_nodes, hierarchy_edges = ezd.generate_hierarchy_nodes_and_edges(
+        nodes, node_ids, node_metadata, edge_set)
+    edges += hierarchy_edges
+    timings["hierarchy"] = time.perf_counter() - start
+
+    return len(nodes), len(edges), timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark extract_zeus_data edge generation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    args = parser.parse_args()
+
+    results = []
+    for n in args.sizes:
+        print(f"\n--- {n:,} nodes ---")
+        results.append((n,) + run(n))
+
+    stages = list(results[0][3].keys())
+    print("\n" + "=" * 60)
+    print(f"{'nodes':>8} {'edges':>9} " + " ".join(f"{s:>11}" for s in stages) + f" {'total':>9}")
+    for n, _, n_edges, timings in results:
+        cols = " ".join(f"{timings[s]:>10.3f}s" for s in stages)
+        print(f"{n:>8} {n_edges:>9} {cols} {sum(timings.values()):>8.2f}s")
+
+
+if __name__ == "__main__":
+    main()
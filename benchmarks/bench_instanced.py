@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+Build FPS comparison pages for the generate_3d instanced rendering mode.
+
+For each size, writes the same synthetic graph (see bench_layout) twice:
+once with per-object rendering (a Three.js object per node and per link)
+and once with --instanced (one InstancedMesh for nodes, one for halos and
+one LineSegments buffer for links). Open the pages in a browser and read
+the "fps · draw calls" counter in the toolbar, or the
+"[Athena] N fps, M draw calls" console line logged after five seconds.
+
+Usage:
+    python benchmarks/bench_instanced.py
+    python benchmarks/bench_instanced.py --sizes 5000 20000 50000 --output-dir output/bench --precompute-layout
+"""
+
+import argparse
+import math
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+import generate_3d as g3d  # noqa: E402
+from bench_layout import GROUPS, synthetic_graph  # noqa: E402
+
+EDGE_TYPES = ["similar", "same_category", "references"]
+
+
+def synthetic_input(n):
+    """bench_layout's graph in generate_3d's input format."""
+    nodes, links = synthetic_graph(n)
+    return {
+        "metadata": {"title": f"Instanced benchmark ({n:,} nodes)"},
+        "groups": {group: {"color": color, "label": group}
+                   for group, color in zip(GROUPS, ["#3182ce", "#2f855a", "#9f7aea", "#e53e3e", "#ed8936", "#4fd1c5", "#d69e2e"])},
+        "nodes": [{"id": node["id"], "label": node["id"], "group": node["group"], "tier": node["tier"]} for node in nodes],
+        "edges": [dict(link, type=EDGE_TYPES[i % len(EDGE_TYPES)]) for i, link in enumerate(links)],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Write per-object vs instanced pages for FPS comparison")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[5000, 20000, 50000])
+    parser.add_argument("--output-dir", default="output/bench")
+    parser.add_argument("--precompute-layout", action="store_true",
+                        help="Measure a settled graph instead of one running the force simulation")
+    args = parser.parse_args()
+
+    output_dir = Path(args.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    print(f"{'nodes':>8} {'links':>8} {'mode':<11} {'draw calls*':>12} {'html':>9} {'build':>8}  page")
+    for n in args.sizes:
+        data = synthetic_input(n)
+        for instanced in (False, True):
+            start = time.perf_counter()
+            html = g3d.generate_html(data, data["metadata"]["title"], precompute_layout=args.precompute_layout,
+                                     instanced=instanced)
+            build_time = time.perf_counter() - start
+            mode = "instanced" if instanced else "per-object"
+            page = output_dir / f"instanced_{n}_{mode}.html"
+            page.write_text(html)
+            # Nodes and links only: per-object pages draw logo labels in pages
+            # of 192 nodes plus one line per link; tier rings add a few more
+            calls = 3 if instanced else math.ceil(n / 192) + len(data["edges"])
+            print(f"{n:>8} {len(data['edges']):>8} {mode:<11} {calls:>12,} {len(html) / 1e6:>7.1f}MB "
+                  f"{build_time:>7.1f}s  {page}")
+    print("\n* expected node + link draw calls; open each page to read fps and actual draw calls")
+
+
+if __name__ == "__main__":
+    main()
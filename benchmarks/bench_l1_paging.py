@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark paging through a large L1 cluster in api_server.
+
+Builds a synthetic snapshot with one big L1 cluster among many small ones
+and walks the big cluster page by page:
+- the previous offset paging (filter every memory, then slice, per page)
+- cursor paging over the snapshot's per-cluster member arrays
+- the ndjson and columnar streams: time to the first batch and in total
+
+Pages of both walks are compared to confirm they match.
+
+Usage:
+    python benchmarks/bench_l1_paging.py
+    python benchmarks/bench_l1_paging.py --memories 500000 --cluster-size 50000 --limit 1000
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import api_server  # noqa: E402
+
+BIG_CLUSTER = 0
+
+
+def synthetic_snapshot(n_memories, cluster_size, n_clusters=2000, seed=0):
+    rng = random.Random(seed)
+    big = set(rng.sample(range(n_memories), cluster_size))
+    memories = [{
+        "id": f"m{i}",
+        "content_preview": f"memory {i}",
+        "category": "cce_research",
+        "cluster_l1": BIG_CLUSTER if i in big else rng.randrange(1, n_clusters),
+        "cluster_l2": 0,
+    } for i in range(n_memories)]
+    positions = {m["id"]: {"x": rng.uniform(-500, 500), "y": rng.uniform(-500, 500)} for m in memories}
+    clustering = {"memories": memories, "clusters": {"l1": {}, "l2": {}}}
+    return api_server.Snapshot("bench", clustering, {"positions": {"memories": positions}})
+
+
+def legacy_page(snap, cluster_id, limit, offset):
+    """Previous /api/l1 page: scan all memories for the cluster, then slice."""
+    cluster_id_int = int(cluster_id)
+    memory_positions = snap.layout_data['positions']['memories']
+    cluster_memories = [m for m in snap.clustering_data['memories'] if m.get('cluster_l1') == cluster_id_int]
+    page = cluster_memories[offset:offset + limit]
+    return [api_server.l1_memory_record(m, memory_positions) for m in page], offset + limit < len(cluster_memories)
+
+
+def l1(snap, **params):
+    defaults = {"limit": 100, "offset": 0, "cursor": None, "format": "json", "batch_size": 1000}
+    return asyncio.run(api_server.get_l1_memories(str(BIG_CLUSTER), snap=snap, **{**defaults, **params}))
+
+
+async def read_stream(response):
+    """(seconds to header + first batch, seconds to the end, bytes) of a StreamingResponse."""
+    start = time.perf_counter()
+    first, size = None, 0
+    async for chunk in response.body_iterator:
+        size += len(chunk)
+        if first is None and size > len(chunk):
+            first = time.perf_counter() - start
+    return first, time.perf_counter() - start, size
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark /api/l1 paging")
+    parser.add_argument("--memories", type=int, default=200000)
+    parser.add_argument("--cluster-size", type=int, default=50000)
+    parser.add_argument("--limit", type=int, default=1000)
+    args = parser.parse_args()
+
+    snap = synthetic_snapshot(args.memories, args.cluster_size)
+    pages = -(-args.cluster_size // args.limit)
+    print(f"Snapshot: {args.memories:,} memories, L1 cluster of {args.cluster_size:,}, "
+          f"{pages} pages of {args.limit}\n")
+
+    start = time.perf_counter()
+    old, offset, more = [], 0, True
+    while more:
+        rows, more = legacy_page(snap, BIG_CLUSTER, args.limit, offset)
+        old.extend(rows)
+        offset += args.limit
+    old_time = time.perf_counter() - start
+    print(f"{'offset paging (scan per page)':<34} {old_time:>8.3f}s  {old_time / pages * 1e3:>7.2f}ms/page")
+
+    start = time.perf_counter()
+    new, cursor = [], None
+    while True:
+        page = l1(snap, limit=args.limit, cursor=cursor)
+        new.extend(page["memories"])
+        cursor = page["next_cursor"]
+        if not cursor:
+            break
+    new_time = time.perf_counter() - start
+    print(f"{'cursor paging (member arrays)':<34} {new_time:>8.3f}s  {new_time / pages * 1e3:>7.2f}ms/page")
+    print(f"  speedup {old_time / new_time:.1f}x, rows {len(new):,}, mismatches: {int(old != new)}\n")
+
+    for fmt in api_server.STREAM_FORMATS:
+        first, total, size = asyncio.run(read_stream(l1(snap, format=fmt)))
+        print(f"{fmt + ' stream':<34} first batch {first * 1e3:>6.2f}ms, all {total:.3f}s, {size / 1e6:.1f}MB")
+
+
+if __name__ == "__main__":
+    main()
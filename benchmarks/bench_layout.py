@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Benchmark offline layout precomputation in generate_3d.
+
+Builds synthetic graphs shaped like the Zeus knowledge graph (tiers, groups,
+clustered links) and times compute_layouts, which produces the force,
+layered, spherical and cylinder positions embedded by --precompute-layout.
+With those positions the viewer renders with zero simulation ticks, so this
+offline time replaces the in-browser warm-up entirely.
+
+Usage:
+    python benchmarks/bench_layout.py
+    python benchmarks/bench_layout.py --sizes 1000 10000 50000 --iterations 300
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import generate_3d as g3d  # noqa: E402
+
+GROUPS = ["decision", "cce_research", "cce_success_log", "cce_failed_approach", "cce", "slack", "project"]
+
+
+def synthetic_graph(n, edges_per_node=2.5, n_clusters=40, seed=0):
+    """Nodes/links in the viewer's format with mostly intra-cluster links."""
+    rng = random.Random(seed)
+    cluster = [rng.randrange(n_clusters) for _ in range(n)]
+    members = {}
+    for i, c in enumerate(cluster):
+        members.setdefault(c, []).append(i)
+
+    nodes = [{"id": f"n{i}", "group": rng.choice(GROUPS), "tier": rng.randint(0, 5)} for i in range(n)]
+    links = []
+    for _ in range(int(n * edges_per_node)):
+        a = rng.randrange(n)
+        b = rng.choice(members[cluster[a]]) if rng.random() < 0.9 else rng.randrange(n)
+        if a != b:
+            links.append({"source": f"n{a}", "target": f"n{b}"})
+    return nodes, links
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark generate_3d layout precomputation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--iterations", type=int, default=g3d.FORCE_ITERATIONS)
+    args = parser.parse_args()
+
+    print(f"{'nodes':>8} {'links':>8} {'force':>9} {'others':>8} {'payload':>10} {'link len p50':>13}")
+    for n in args.sizes:
+        nodes, links = synthetic_graph(n)
+
+        start = time.perf_counter()
+        index = {node["id"]: i for i, node in enumerate(nodes)}
+        sources = [index[l["source"]] for l in links]
+        targets = [index[l["target"]] for l in links]
+        force = g3d.compute_force_layout(n, sources, targets, iterations=args.iterations)
+        force_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        layouts = g3d.compute_layouts(nodes, links, iterations=1)
+        other_time = time.perf_counter() - start
+
+        payload = len(json.dumps([{name: layouts[name][i] for name in g3d.LAYOUT_NAMES} for i in range(n)]))
+        link_len = np.median(np.linalg.norm(force[sources] - force[targets], axis=1))
+        print(f"{n:>8} {len(links):>8} {force_time:>8.2f}s {other_time:>7.2f}s {payload / 1e6:>8.2f}MB {link_len:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
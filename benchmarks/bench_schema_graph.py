@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Benchmark schema graph building in generate_schema_graph.
+
+Builds a synthetic Power BI-style schema (tables, column chunks, measure
+chunks, with *_id columns referencing other tables) and times:
+- chunk decoding (decode_schema_rows)
+- create_graph_json with the previous columns x tables reference scan
+- create_graph_json with the hashed reference lookup
+- create_table_graphs, the column-level sub-graph per table
+
+Edges of the old and new reference inference are compared to confirm
+they match.
+
+Usage:
+    python benchmarks/bench_schema_graph.py
+    python benchmarks/bench_schema_graph.py --tables 2000 --columns 50000
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import generate_schema_graph as gsg  # noqa: E402
+
+WORDS = ("order line campaign flight spend client vendor region store product "
+         "channel budget invoice media audience partner account date").split()
+CHUNK_COLUMNS = 200
+
+
+def synthetic_schema_rows(n_tables, n_columns, n_measures, seed=0):
+    """Raw rows as fetch_schema_rows returns them for one schema."""
+    rng = random.Random(seed)
+    tables = []
+    while len(tables) < n_tables:
+        name = " ".join(rng.choice(WORDS).title() for _ in range(rng.randint(1, 3)))
+        tables.append(name if name not in tables else f"{name} {len(tables)}")
+
+    columns = []
+    for i in range(n_columns):
+        table = rng.choice(tables)
+        if rng.random() < 0.15:
+            ref = rng.choice(tables).lower().replace(" ", "_")
+            name = f"{ref}_id" if rng.random() < 0.7 else f"{ref.replace('_', '')}id"
+        else:
+            name = f"{rng.choice(WORDS)}_{rng.choice(WORDS)}_{i}"
+        columns.append({"column_name": name, "column_locator": f"'{table}'[{name}]"})
+    measures = [{"column_locator": f"'{rng.choice(tables)}'[Measure {i}]"} for i in range(n_measures)]
+
+    main = {"schema": {"definition": {"tables": tables}, "capacity_options": {"dataset_name": "Synthetic"}}}
+    return {
+        "main": json.dumps(main),
+        "columns": [json.dumps({"columns": columns[i:i + CHUNK_COLUMNS]})
+                    for i in range(0, len(columns), CHUNK_COLUMNS)],
+        "measures": [json.dumps({"measures": measures[i:i + CHUNK_COLUMNS]})
+                     for i in range(0, len(measures), CHUNK_COLUMNS)],
+    }
+
+
+def legacy_reference_edges(tables, columns):
+    """Previous inference: every column tested against every table name."""
+    edges = []
+    for col in columns:
+        col_name = col.get('column_name', '').lower()
+        locator = col.get('column_locator', '')
+        if "'" in locator:
+            source_table = locator.split("'")[1]
+            source_id = f"table_{source_table.lower().replace(' ', '_').replace('(', '').replace(')', '')}"
+            for table_name in tables:
+                table_lower = table_name.lower().replace(' ', '_')
+                if f"{table_lower}_id" in col_name or f"{table_lower}id" in col_name:
+                    target_id = f"table_{table_lower.replace('(', '').replace(')', '')}"
+                    if source_id != target_id:
+                        edges.append({"source": source_id, "target": target_id, "type": "references"})
+    return edges
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark schema graph building")
+    parser.add_argument("--tables", type=int, default=2000)
+    parser.add_argument("--columns", type=int, default=50000)
+    parser.add_argument("--measures", type=int, default=5000)
+    args = parser.parse_args()
+
+    rows = synthetic_schema_rows(args.tables, args.columns, args.measures)
+    print(f"Schema: {args.tables:,} tables, {args.columns:,} columns, {args.measures:,} measures, "
+          f"{len(rows['columns']) + len(rows['measures'])} chunks\n")
+
+    start = time.perf_counter()
+    schema_data = gsg.decode_schema_rows(rows)
+    print(f"{'decode chunks':<32} {time.perf_counter() - start:>8.3f}s")
+
+    tables = schema_data["main"]["schema"]["definition"]["tables"]
+    start = time.perf_counter()
+    old = legacy_reference_edges(tables, schema_data["columns"])
+    old_time = time.perf_counter() - start
+    print(f"{'references (columns x tables)':<32} {old_time:>8.3f}s")
+
+    start = time.perf_counter()
+    graph = gsg.create_graph_json(schema_data, "Synthetic")
+    new_time = time.perf_counter() - start
+    new = [edge for edge in graph["edges"] if edge["type"] == "references"]
+    print(f"{'create_graph_json (hashed)':<32} {new_time:>8.3f}s")
+    print(f"  {len(new):,} reference edges, mismatches: {int(old != new)}, "
+          f"{len(graph['nodes']):,} nodes")
+
+    start = time.perf_counter()
+    table_graphs = gsg.create_table_graphs(schema_data, "Synthetic", "synthetic_tables")
+    sub_time = time.perf_counter() - start
+    sizes = sorted(len(json.dumps(g)) for g in table_graphs.values())
+    print(f"{'create_table_graphs':<32} {sub_time:>8.3f}s")
+    print(f"  {len(table_graphs):,} sub-graphs, {sum(len(g['nodes']) for g in table_graphs.values()):,} nodes, "
+          f"median {sizes[len(sizes) // 2] / 1e3:.1f}KB, max {sizes[-1] / 1e3:.1f}KB")
+
+
+if __name__ == "__main__":
+    main()
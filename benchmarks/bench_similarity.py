@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""
+Benchmark similarity edge extraction strategies.
+
+Offline (default): times the local NumPy top-k kernel against a full
+all-pairs similarity matrix (what the pairwise SQL self-join computes) on
+synthetic clustered 1024-dim embeddings.
+
+Live (--live): times generate_similarity_edges in each mode against the Zeus
+database using the N most recent memories that have embeddings.
+
+Usage:
+    python benchmarks/bench_similarity.py
+    python benchmarks/bench_similarity.py --sizes 500 5000 50000
+    python benchmarks/bench_similarity.py --live --sizes 500 5000
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+import extract_zeus_data as ezd  # noqa: E402
+
+DIMENSIONS = 1024
+ALL_PAIRS_MAX_NODES = 10000  # Full N x N matrix beyond this needs > 400 MB
+
+
+def synthetic_embeddings(n, n_clusters=50, noise=0.35, seed=0):
+    """Clustered vectors so the threshold produces a realistic edge count."""
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((n_clusters, DIMENSIONS)).astype(np.float32)
+    labels = rng.integers(0, n_clusters, size=n)
+    vectors = centers[labels] + noise * rng.standard_normal((n, DIMENSIONS)).astype(np.float32)
+    return vectors
+
+
+def all_pairs(embeddings, threshold):
+    """Reference: every pairwise similarity, like the SQL self-join."""
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    normalized = embeddings / norms
+    sims = normalized @ normalized.T
+    rows, cols = np.nonzero(np.triu(sims > threshold, k=1))
+    return len(rows)
+
+
+def run_offline(sizes, k, threshold):
+    print(f"{'nodes':>8} {'local top-k':>12} {'pairs':>8} {'all-pairs':>12} {'pairs':>8}")
+    for n in sizes:
+        embeddings = synthetic_embeddings(n)
+        ids = [f"m{i}" for i in range(n)]
+
+        start = time.perf_counter()
+        pairs = ezd.topk_similar_pairs(ids, embeddings, k=k, threshold=threshold)
+        local_time = time.perf_counter() - start
+
+        if n <= ALL_PAIRS_MAX_NODES:
+            start = time.perf_counter()
+            full_pairs = all_pairs(embeddings, threshold)
+            full_time = f"{time.perf_counter() - start:.3f}s"
+        else:
+            full_pairs, full_time = "-", "skipped"
+
+        print(f"{n:>8} {local_time:>11.3f}s {len(pairs):>8} {full_time:>12} {full_pairs:>8}")
+
+
+def run_live(sizes, k, threshold):
+    conn = ezd.psycopg2.connect(**ezd.conn_params)
+    cur = conn.cursor()
+    print(f"{'nodes':>8} {'mode':>10} {'time':>10} {'edges':>8}")
+    for n in sizes:
+        cur.execute("""
+            SELECT memory_id::text FROM zeus_core.memories
+            WHERE tenant_id = %s AND embedding_voyage IS NOT NULL
+            ORDER BY created_at DESC
+            LIMIT %s
+        """, (ezd.TENANT_ID, n))
+        node_ids = {row[0] for row in cur.fetchall()}
+        node_metadata = {nid: {"type": "memory"} for nid in node_ids}
+
+        for mode in ezd.SIMILARITY_MODES:
+            if mode == "pairwise" and n > ALL_PAIRS_MAX_NODES:
+                print(f"{n:>8} {mode:>10} {'skipped':>10}")
+                continue
+            start = time.perf_counter()
+            edges = ezd.generate_similarity_edges(
+                cur, node_ids, node_metadata, set(),
+                similarity_threshold=threshold, max_edges=n * k, mode=mode, k=k,
+            )
+            print(f"{n:>8} {mode:>10} {time.perf_counter() - start:>9.2f}s {len(edges):>8}")
+    cur.close()
+    conn.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark similarity edge extraction")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[500, 5000, 20000, 50000])
+    parser.add_argument("--k", type=int, default=ezd.SIMILARITY_TOP_K)
+    parser.add_argument("--threshold", type=float, default=0.85)
+    parser.add_argument("--live", action="store_true", help="Benchmark against the Zeus database")
+    args = parser.parse_args()
+
+    if args.live:
+        run_live(args.sizes, args.k, args.threshold)
+    else:
+        run_offline(args.sizes, args.k, args.threshold)
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,7 @@
 # This script:
 # 1. Extracts latest decisions and CCE memories from Zeus Memory
 # 2. Generates similarity edges using pgvector embeddings
-# 3. Creates 3D visualization HTML
+# 3. Rebuilds every visualization whose input or generator changed (build_all.py)
 # 4. Commits and pushes to trigger GitHub Actions deployment
 #
 # Schedule: Daily at 4 AM (after batch embedder completes)
@@ -25,9 +25,19 @@ if [ -f "$SCRIPT_DIR/venv/bin/activate" ]; then
 fi
 
 # Step 1: Extract Zeus data (queries embedded memories for similarity edges)
-echo "$LOG_PREFIX Step 1: Extracting Zeus data..."
-python3 src/extract_zeus_data.py \
-    --output data/examples/zeus_decision_graph.json
+# Daily runs merge only rows newer than the saved watermark; Sundays (or
+# FULL_REGEN=1) rebuild from scratch to re-apply the node budget and refresh
+# ingestion counts.
+if [ "${FULL_REGEN:-0}" = "1" ] || [ "$(date +%u)" = "7" ]; then
+    echo "$LOG_PREFIX Step 1: Extracting Zeus data (full rebuild)..."
+    python3 src/extract_zeus_data.py \
+        --output data/examples/zeus_decision_graph.json
+else
+    echo "$LOG_PREFIX Step 1: Extracting Zeus data (incremental)..."
+    python3 src/extract_zeus_data.py \
+        --incremental \
+        --output data/examples/zeus_decision_graph.json
+fi
 
 # Check if extraction produced output
 if [ ! -f "data/examples/zeus_decision_graph.json" ]; then
@@ -39,11 +49,11 @@ NODE_COUNT=$(python3 -c "import json; print(len(json.load(open('data/examples/ze
 EDGE_COUNT=$(python3 -c "import json; print(len(json.load(open('data/examples/zeus_decision_graph.json'))['edges']))")
 echo "$LOG_PREFIX Extracted $NODE_COUNT nodes and $EDGE_COUNT edges"
 
-# Step 2: Generate 3D visualization HTML
-echo "$LOG_PREFIX Step 2: Generating 3D visualization..."
-python3 src/generate_3d.py \
-    --input data/examples/zeus_decision_graph.json \
-    --output output/html/zeus_decision_graph.html
+# Step 2: Regenerate visualizations listed in build_manifest.json
+# Up-to-date outputs are skipped by content hash; the rest render in parallel.
+# zeus_decision_graph.html uses --split-data (hashed assets in output/html/data/)
+echo "$LOG_PREFIX Step 2: Regenerating visualizations..."
+python3 src/build_all.py
 
 if [ ! -f "output/html/zeus_decision_graph.html" ]; then
     echo "$LOG_PREFIX ERROR: Failed to generate zeus_decision_graph.html"
@@ -53,14 +63,15 @@ fi
 echo "$LOG_PREFIX Generated HTML: $(wc -c < output/html/zeus_decision_graph.html) bytes"
 
 # Step 3: Check for changes
-if git diff --quiet data/examples/zeus_decision_graph.json output/html/zeus_decision_graph.html 2>/dev/null; then
+if git diff --quiet data/examples/zeus_decision_graph.json 2>/dev/null \
+    && [ -z "$(git status --porcelain output/html)" ]; then
     echo "$LOG_PREFIX No changes detected, skipping commit"
     exit 0
 fi
 
 # Step 4: Commit and push
 echo "$LOG_PREFIX Step 4: Committing changes..."
-git add data/examples/zeus_decision_graph.json output/html/zeus_decision_graph.html
+git add data/examples/zeus_decision_graph.json output/html
 git commit -m "Auto-regenerate Zeus decision graph - $(date '+%Y-%m-%d %H:%M')
 
 Nodes: $NODE_COUNT
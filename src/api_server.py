@@ -13,16 +13,32 @@ Deployment:
     - Container: gunicorn api_server:app -k uvicorn.workers.UvicornWorker -b 0.0.0.0:8080
 """
 
+import asyncio
+import base64
+import bisect
+import gzip
+import hashlib
+import hmac
 import json
 import os
+import re
+import threading
 import time
+from array import array
+from collections import OrderedDict
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
-from fastapi import FastAPI, HTTPException, Query
+from typing import Callable, Literal, Optional
+from fastapi import Depends, FastAPI, HTTPException, Query, Request
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import JSONResponse, FileResponse, Response, StreamingResponse
 from fastapi.staticfiles import StaticFiles
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
+
+from content_store import CONTENT_STORE_BIN, CONTENT_STORE_INDEX, BLOCK_SIZE, ContentStore, ids_digest
+from request_metrics import MetricsMiddleware, RequestMetrics
+from sampling_profiler import ProfileMiddleware, StackSampler
 
 
 # TTL cache for expensive DB-backed endpoints
@@ -45,10 +61,99 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Latency, sizes, cache hit rates, query and snapshot load timings (/metrics);
+# requests slower than ATHENA_SLOW_REQUEST_MS are sampled with their stages
+request_metrics = RequestMetrics(
+    slow_seconds=float(os.getenv("ATHENA_SLOW_REQUEST_MS", "1000")) / 1e3,
+    slow_samples=int(os.getenv("ATHENA_SLOW_REQUEST_SAMPLES", "100")),
+)
+
+PROFILE_MAX_SECONDS = 60
+
+
+def admin_authorized(authorization: str) -> bool:
+    """Whether an Authorization header carries ATHENA_ADMIN_TOKEN (never, when it is unset)."""
+    token = os.getenv("ATHENA_ADMIN_TOKEN")
+    return bool(token) and hmac.compare_digest(authorization.encode(), f"Bearer {token}".encode())
+
+
+# Requests sent with "X-Profile: collapsed|speedscope" by an admin are sampled
+# while they run and answered with the profile (see sampling_profiler.py)
+app.add_middleware(ProfileMiddleware, authorized=admin_authorized, max_seconds=PROFILE_MAX_SECONDS)
+# Added last so it is outermost: timings include CORS and profiling overhead
+app.add_middleware(MetricsMiddleware, metrics=request_metrics)
+
+
+# Snapshot files produced by the offline pipeline, hot-reloaded when they change
+SNAPSHOT_FILES = ("clustering_results.json", "layout_results.json", "metrics_results.json")
+SNAPSHOT_POLL_SECONDS = float(os.getenv("ATHENA_SNAPSHOT_POLL_SECONDS", "30"))  # 0 disables the watcher
+# Optional full contents next to them (see content_store.py); previews are served without it
+CONTENT_CACHE_BLOCKS = int(os.getenv("ATHENA_CONTENT_CACHE_BLOCKS", "256"))  # decompressed 64 KB blocks
+
+# Per-tenant snapshots (<snapshot dir>/tenants/<tenant>/) are loaded on demand
+TENANT_CACHE_MB = float(os.getenv("ATHENA_TENANT_CACHE_MB", "1024"))
+TENANT_IDLE_SECONDS = float(os.getenv("ATHENA_TENANT_IDLE_SECONDS", "1800"))
+SNAPSHOT_MEMORY_FACTOR = 3  # parsed JSON takes roughly 2-3x its file size in memory
+TENANT_ID_PATTERN = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
 
-# Global data storage (loaded once on startup)
-clustering_data = None
-layout_data = None
+
+class Snapshot:
+    """One immutable version of the clustering, layout and metrics data.
+
+    Handlers receive one through request_snapshot and use only that object,
+    so a reload swapping in a new one never mixes versions within a request.
+    """
+
+    def __init__(self, version: str = "none", clustering_data: Optional[dict] = None,
+                 layout_data: Optional[dict] = None, metrics_data: Optional[dict] = None,
+                 sources: Optional[dict] = None, content_store: Optional[ContentStore] = None):
+        self.version = version  # content hash of the snapshot files
+        self.clustering_data = clustering_data
+        self.layout_data = layout_data
+        self.metrics_data = metrics_data
+        # Pre-sort once so top-k and paging are simple slices
+        self.metrics_order = {
+            name: sorted(range(len(values)), key=values.__getitem__, reverse=True)
+            for name, values in metrics_data.get('metrics', {}).items()
+        } if metrics_data else {}  # metric name -> indices sorted by descending value
+        # L1 cluster id -> ascending indices into memories, the keys of /api/l1 cursors
+        self.l1_members = {}
+        self.memory_index = {}  # memory id -> index into memories
+        for i, mem in enumerate(clustering_data.get('memories', []) if clustering_data else []):
+            self.memory_index[mem['id']] = i
+            members = self.l1_members.get(mem.get('cluster_l1'))
+            if members is None:
+                members = self.l1_members[mem.get('cluster_l1')] = array('l')
+            members.append(i)
+        self.sources = sources or {}  # file name -> (mtime_ns, size) when read
+        self.content_store = content_store
+        self.loaded_at = time.time()
+        self.responses = {}  # filled by precompile_responses()
+
+    def content(self, index: int) -> str:
+        """Full text of memories[index], or its preview without a content store."""
+        if self.content_store is not None:
+            return self.content_store.get(index)
+        return self.clustering_data['memories'][index].get('content_preview', '')
+
+
+snapshot = Snapshot()
+_reload_lock = threading.Lock()
+
+# Cluster colors by dominant category; the overview and L2 detail fall
+# back to different defaults
+CATEGORY_COLORS = {
+    "decision": "#1a365d",
+    "cce_decision_log": "#2f855a",
+    "cce_research": "#3182ce",
+    "cce_failed_approach": "#e53e3e",
+    "cce_success_log": "#38a169",
+    "cce_system": "#805ad5",
+    "cce": "#d69e2e",
+    "architecture": "#dd6b20",
+}
+L2_DEFAULT_COLOR = "#718096"
+L1_DEFAULT_COLOR = "#4299e1"
 
 
 def get_data_dir() -> Path:
@@ -81,34 +186,339 @@ def get_static_dir() -> Path:
     return Path("./static")
 
 
-def load_data():
-    """Load clustering and layout data on startup."""
-    global clustering_data, layout_data
+def json_bytes(obj) -> bytes:
+    """Serialize like FastAPI's JSONResponse, for responses assembled from cached bytes."""
+    return json.dumps(obj, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
 
-    data_dir = get_data_dir()
-    print(f"Loading data from: {data_dir}")
 
-    clustering_path = data_dir / "clustering_results.json"
-    layout_path = data_dir / "layout_results.json"
+class GraphDocument:
+    """One parsed graph JSON file (navigator, schema or table sub-graph).
 
-    if clustering_path.exists():
-        with open(clustering_path, 'r') as f:
-            clustering_data = json.load(f)
-        print(f"Loaded clustering data: {len(clustering_data.get('memories', []))} memories")
-    else:
-        print(f"Warning: {clustering_path} not found")
+    Holds the node-id index and the serialized forms of the document and of
+    derived response parts, so requests only assemble bytes.
+    """
 
-    if layout_path.exists():
-        with open(layout_path, 'r') as f:
-            layout_data = json.load(f)
-        print(f"Loaded layout data: {len(layout_data.get('positions', {}).get('memories', {}))} memory positions")
-    else:
-        print(f"Warning: {layout_path} not found")
+    def __init__(self, path: Path, version: tuple, data: dict):
+        self.path = path
+        self.version = version  # (mtime_ns, size) the document was parsed at
+        self.data = data
+        self.nodes_by_id = {node.get("id"): node for node in data.get("nodes", [])}
+        self.graph_json = json_bytes(data)
+        self._fragments = {}
+
+    def fragment(self, key: str, build: Callable[[dict], object]) -> bytes:
+        """Serialized build(data), computed once per document version.
+
+        Keys must come from a bounded set (code constants or ids in nodes_by_id).
+        """
+        body = self._fragments.get(key)
+        if body is None:
+            body = self._fragments[key] = json_bytes(build(self.data))
+        return body
+
+
+class GraphDocumentCache:
+    """Graph JSON files parsed once and reparsed when their mtime or size changes.
+
+    get() stats and parses synchronously; endpoints call load(), which runs
+    it in the threadpool so file I/O and json parsing stay off the event loop.
+    """
+
+    def __init__(self):
+        self._documents = {}
+        self._lock = threading.Lock()
+
+    def get(self, path: Path) -> Optional[GraphDocument]:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            self._documents.pop(path, None)
+            return None
+        version = (stat.st_mtime_ns, stat.st_size)
+        document = self._documents.get(path)
+        if document is not None and document.version == version:
+            request_metrics.cache_result("graph_document", True)
+            return document
+        request_metrics.cache_result("graph_document", False)
+        with self._lock:
+            # Another request may have reparsed it while we waited
+            document = self._documents.get(path)
+            if document is None or document.version != version:
+                with open(path, 'r') as f:
+                    document = GraphDocument(path, version, json.load(f))
+                self._documents[path] = document
+            return document
+
+    async def load(self, path: Path) -> Optional[GraphDocument]:
+        return await run_in_threadpool(self.get, path)
+
+
+graph_documents = GraphDocumentCache()
+
+
+def get_navigator_file() -> Path:
+    return get_data_dir() / "examples" / "aldc_ecosystem_navigator.json"
+
+
+def get_snapshot_dir() -> Path:
+    return Path(os.getenv("ATHENA_SNAPSHOT_DIR", get_data_dir()))
+
+
+def snapshot_sources(snapshot_dir: Path) -> dict:
+    """(mtime_ns, size) of each snapshot file present."""
+    sources = {}
+    for name in SNAPSHOT_FILES + (CONTENT_STORE_INDEX, CONTENT_STORE_BIN):
+        try:
+            stat = (snapshot_dir / name).stat()
+        except FileNotFoundError:
+            continue
+        sources[name] = (stat.st_mtime_ns, stat.st_size)
+    return sources
+
+
+def read_snapshot(snapshot_dir: Path, scope: str = "default") -> Snapshot:
+    """Parse and index the snapshot files and precompile its responses.
+
+    Raises OSError / ValueError on unreadable files. The load time is
+    recorded under scope ("default" or "tenant").
+    """
+    print(f"Loading data from: {snapshot_dir}")
+    start = time.perf_counter()
+    sources = snapshot_sources(snapshot_dir)
+    digest = hashlib.sha256()
+    data = {}
+    for name in SNAPSHOT_FILES:
+        if name not in sources:
+            print(f"Warning: {snapshot_dir / name} not found")
+            continue
+        raw = (snapshot_dir / name).read_bytes()
+        digest.update(name.encode())
+        digest.update(raw)
+        data[name] = json.loads(raw)
+
+    content_store = None
+    if CONTENT_STORE_INDEX in sources and "clustering_results.json" in data:
+        raw = (snapshot_dir / CONTENT_STORE_INDEX).read_bytes()
+        digest.update(CONTENT_STORE_INDEX.encode())
+        digest.update(raw)
+        content_store = open_content_store(snapshot_dir, json.loads(raw), data["clustering_results.json"])
+
+    new = Snapshot(
+        version=digest.hexdigest()[:12] if data else "none",
+        clustering_data=data.get("clustering_results.json"),
+        layout_data=data.get("layout_results.json"),
+        metrics_data=data.get("metrics_results.json"),
+        sources=sources,
+        content_store=content_store,
+    )
+    if new.clustering_data is not None:
+        print(f"Loaded clustering data: {len(new.clustering_data.get('memories', []))} memories")
+    if new.layout_data is not None:
+        print(f"Loaded layout data: {len(new.layout_data.get('positions', {}).get('memories', {}))} memory positions")
+    if new.metrics_data is not None:
+        print(f"Loaded metrics data: {len(new.metrics_data.get('ids', []))} nodes, metrics={list(new.metrics_order)}")
+    if new.content_store is not None:
+        print(f"Loaded content store: {new.content_store.count} memories in {new.content_store.stats()['blocks']} blocks")
+    precompile_responses(new)
+    request_metrics.observe_snapshot_load(scope, time.perf_counter() - start)
+    return new
+
+
+def open_content_store(snapshot_dir: Path, index: dict, clustering_data: dict) -> Optional[ContentStore]:
+    """The snapshot's content store, or None (serving previews) if it can't be used.
+
+    A store written for a different clustering run is ignored rather than
+    serving another memory's text.
+    """
+    try:
+        store = ContentStore(snapshot_dir, index, cache_blocks=CONTENT_CACHE_BLOCKS)
+    except ImportError:
+        print("Warning: zstandard not installed, serving content previews only")
+        return None
+    except (OSError, ValueError, KeyError) as e:
+        print(f"Warning: content store in {snapshot_dir} unreadable, serving previews only: {e}")
+        return None
+    ids = [mem['id'] for mem in clustering_data.get('memories', [])]
+    if store.count != len(ids) or store.ids_sha256 != ids_digest(ids):
+        print(f"Warning: content store in {snapshot_dir} doesn't match clustering_results.json, "
+              f"serving previews only")
+        return None
+    return store
+
+
+def load_data() -> Snapshot:
+    """Load the snapshot files and make them the current snapshot.
+
+    Runs on startup, from the snapshot watcher and from /admin/reload, always
+    off the event loop. Requests already running finish on the old snapshot.
+    """
+    global snapshot
+
+    with _reload_lock:
+        new = read_snapshot(get_snapshot_dir())
+        previous = snapshot
+        snapshot = new
+    print(f"Snapshot version {previous.version} -> {new.version}")
+    return new
+
+
+def watch_snapshot(stop: threading.Event):
+    """Reload when the snapshot files change.
+
+    A change is only loaded once the files look the same on two consecutive
+    polls, so a regen still writing them isn't picked up half-way. A
+    version that fails to load is not retried until the files change again.
+    """
+    seen = failed = None
+    while not stop.wait(SNAPSHOT_POLL_SECONDS):
+        tenant_snapshots.evict()
+        current = snapshot_sources(get_snapshot_dir())
+        if current == snapshot.sources or current == failed:
+            seen = current
+            continue
+        if current != seen:
+            seen = current
+            continue
+        try:
+            load_data()
+        except (OSError, ValueError) as e:
+            failed = current
+            print(f"Warning: snapshot reload failed, still serving {snapshot.version}: {e}")
+
+
+def snapshot_memory_estimate(snap: Snapshot) -> float:
+    """Rough resident bytes of a snapshot: parsed JSON plus a full block cache."""
+    parsed = sum(size for name, (_, size) in snap.sources.items() if name != CONTENT_STORE_BIN)
+    blocks = CONTENT_CACHE_BLOCKS * BLOCK_SIZE if snap.content_store is not None else 0
+    return parsed * SNAPSHOT_MEMORY_FACTOR + blocks
+
+
+class TenantSnapshots:
+    """Per-tenant snapshots, loaded from <snapshot dir>/tenants/<tenant>/ on first use.
+
+    Kept in LRU order within a memory budget, estimated from file sizes.
+    Tenants idle for longer than idle_seconds are dropped. A tenant whose
+    files changed is reloaded on its next request; if the new files don't
+    parse, its previous snapshot keeps serving.
+    """
+
+    def __init__(self, budget_bytes: float, idle_seconds: float):
+        self.budget_bytes = budget_bytes
+        self.idle_seconds = idle_seconds
+        self._entries = OrderedDict()  # tenant -> {"snapshot", "bytes", "last_used"}, oldest first
+        self._lock = threading.Lock()
+        self._load_locks = {}  # tenant -> lock, so a tenant is parsed once however many requests wait
+
+    def _cached(self, tenant: str, sources: dict) -> Optional[Snapshot]:
+        with self._lock:
+            entry = self._entries.get(tenant)
+            if entry is None or entry["snapshot"].sources != sources:
+                return None
+            entry["last_used"] = time.time()
+            self._entries.move_to_end(tenant)
+            return entry["snapshot"]
+
+    def get(self, tenant: str) -> Optional[Snapshot]:
+        """The tenant's current snapshot, or None for an unknown tenant."""
+        if not TENANT_ID_PATTERN.match(tenant):
+            return None
+        tenant_dir = get_snapshot_dir() / "tenants" / tenant
+        sources = snapshot_sources(tenant_dir)
+        if not sources:
+            with self._lock:
+                self._entries.pop(tenant, None)
+            return None
+        snap = self._cached(tenant, sources)
+        request_metrics.cache_result("tenant_snapshot", snap is not None)
+        if snap is not None:
+            return snap
+
+        with self._lock:
+            load_lock = self._load_locks.setdefault(tenant, threading.Lock())
+        with load_lock:
+            snap = self._cached(tenant, sources)
+            if snap is not None:
+                return snap
+            try:
+                snap = read_snapshot(tenant_dir, scope="tenant")
+            except (OSError, ValueError) as e:
+                with self._lock:
+                    entry = self._entries.get(tenant)
+                if entry is None:
+                    raise
+                print(f"Warning: reload of tenant {tenant} failed, still serving {entry['snapshot'].version}: {e}")
+                return entry["snapshot"]
+            with self._lock:
+                self._entries[tenant] = {
+                    "snapshot": snap,
+                    "bytes": snapshot_memory_estimate(snap),
+                    "last_used": time.time(),
+                }
+                self._entries.move_to_end(tenant)
+                self._evict(keep=tenant)
+            return snap
+
+    def evict(self):
+        """Drop idle tenants; also run periodically by the snapshot watcher."""
+        with self._lock:
+            self._evict()
+
+    def _evict(self, keep: Optional[str] = None):
+        now = time.time()
+        total = sum(entry["bytes"] for entry in self._entries.values())
+        for tenant in list(self._entries):
+            entry = self._entries[tenant]
+            idle = now - entry["last_used"] > self.idle_seconds
+            if tenant == keep or not (idle or total > self.budget_bytes):
+                continue
+            del self._entries[tenant]
+            total -= entry["bytes"]
+            print(f"Evicted tenant {tenant} snapshot {entry['snapshot'].version} "
+                  f"({'idle' if idle else 'over budget'}, ~{entry['bytes'] / 1e6:.1f}MB)")
+
+    async def load(self, tenant: str) -> Optional[Snapshot]:
+        return await run_in_threadpool(self.get, tenant)
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {
+                "loaded": {tenant: entry["snapshot"].version for tenant, entry in self._entries.items()},
+                "estimated_mb": round(sum(entry["bytes"] for entry in self._entries.values()) / 1e6, 1),
+                "budget_mb": round(self.budget_bytes / 1e6, 1),
+            }
+
+
+tenant_snapshots = TenantSnapshots(TENANT_CACHE_MB * 1e6, TENANT_IDLE_SECONDS)
+
+
+async def request_snapshot(request: Request) -> Snapshot:
+    """Snapshot a request reads: the tenant's under /api/t/{tenant}/..., else the default one."""
+    tenant = request.path_params.get("tenant")
+    if tenant is None:
+        return snapshot
+    try:
+        with request_metrics.stage("tenant_snapshot"):
+            snap = await tenant_snapshots.load(tenant)
+    except (OSError, ValueError):
+        raise HTTPException(status_code=503, detail=f"Snapshot for tenant {tenant} could not be loaded")
+    if snap is None:
+        raise HTTPException(status_code=404, detail=f"Unknown tenant {tenant}")
+    return snap
+
+
+_watcher_stop = threading.Event()
 
 
 @app.on_event("startup")
 async def startup():
-    load_data()
+    await run_in_threadpool(load_data)
+    if SNAPSHOT_POLL_SECONDS > 0:
+        threading.Thread(target=watch_snapshot, args=(_watcher_stop,), name="snapshot-watcher", daemon=True).start()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    _watcher_stop.set()
 
 
 # Response models
@@ -148,6 +558,16 @@ class MemoriesResponse(BaseModel):
     memories: list[MemoryInfo]
 
 
+MEMORY_BATCH_MAX = 5000
+
+
+class MemoryBatchRequest(BaseModel):
+    ids: list[str] = Field(..., max_length=MEMORY_BATCH_MAX)
+    # positions: id, x, y, clusters; previews: + category and 200-char preview;
+    # full: + whole content, source and created_at (as /api/memory/{id})
+    fields: Literal["positions", "previews", "full"] = "previews"
+
+
 # Endpoints
 
 @app.get("/")
@@ -400,6 +820,28 @@ async def viz_mrx_eclipse():
     raise HTTPException(status_code=404, detail="MRX Eclipse Vision not found")
 
 
+# Content-hashed assets written by generate_3d.py --split-data
+VIZ_ASSET_TYPES = {".js": "application/javascript", ".gz": "application/gzip"}
+
+
+@app.get("/viz/data/{asset_name}")
+async def viz_data_asset(asset_name: str):
+    """Serve split-data viewer scripts and graph payloads.
+
+    File names carry a content hash, so they can be cached indefinitely.
+    """
+    static_dir = get_static_dir()
+    asset_file = static_dir / "data" / asset_name
+    media_type = VIZ_ASSET_TYPES.get(asset_file.suffix)
+    if media_type is None or asset_file.parent != static_dir / "data" or not asset_file.exists():
+        raise HTTPException(status_code=404, detail="Visualization asset not found")
+    return FileResponse(
+        asset_file,
+        media_type=media_type,
+        headers={"Cache-Control": "public, max-age=31536000, immutable"}
+    )
+
+
 @app.get("/api")
 async def api_info():
     """API info endpoint."""
@@ -411,6 +853,9 @@ async def api_info():
             "/api/l2/{cluster_id}": "L1 clusters within an L2 cluster",
             "/api/l1/{cluster_id}": "Memories within an L1 cluster",
             "/api/memory/{memory_id}": "Single memory details",
+            "/api/memories/batch": "Many memories by id, columnar (POST)",
+            "/api/centrality": "Precomputed centrality metrics (paginated)",
+            "/api/t/{tenant}/...": "Any of the above (and clusters, search, stats) for one tenant",
         }
     }
 
@@ -425,106 +870,205 @@ async def favicon():
 @app.get("/health")
 async def health():
     """Health check endpoint."""
+    snap = snapshot
     return {
         "status": "healthy",
-        "data_loaded": clustering_data is not None and layout_data is not None,
-        "memories_count": len(clustering_data.get('memories', [])) if clustering_data else 0,
+        "data_loaded": snap.clustering_data is not None and snap.layout_data is not None,
+        "memories_count": len(snap.clustering_data.get('memories', [])) if snap.clustering_data else 0,
+        "snapshot_version": snap.version,
+        "snapshot_loaded_at": datetime.fromtimestamp(snap.loaded_at, timezone.utc).isoformat(),
+        "content_store": snap.content_store.stats() if snap.content_store is not None else None,
+        "tenants": tenant_snapshots.summary(),
     }
 
 
-@app.get("/api/overview")
-async def get_overview():
+def require_admin(request: Request):
+    """404 while admin endpoints are disabled (no ATHENA_ADMIN_TOKEN), 401 on a wrong token."""
+    if not os.getenv("ATHENA_ADMIN_TOKEN"):
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not admin_authorized(request.headers.get("authorization", "")):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+@app.post("/admin/reload")
+async def admin_reload(request: Request):
     """
-    Get L2 cluster overview for zoomed-out view.
-    Returns all L2 clusters with their positions, sizes, and colors.
+    Reload the snapshot files now instead of waiting for the watcher.
+    Requires "Authorization: Bearer $ATHENA_ADMIN_TOKEN"; disabled when unset.
     """
-    if not clustering_data or not layout_data:
-        raise HTTPException(status_code=503, detail="Data not loaded")
+    require_admin(request)
+
+    previous = snapshot.version
+    try:
+        new = await run_in_threadpool(load_data)
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=500, detail=f"Reload failed, still serving {previous}: {e}")
+    return {
+        "previous_version": previous,
+        "snapshot_version": new.version,
+        "memories_count": len(new.clustering_data.get('memories', [])) if new.clustering_data else 0,
+    }
+
+
+@app.post("/admin/profile")
+async def admin_profile(
+    request: Request,
+    seconds: float = Query(10, gt=0, le=PROFILE_MAX_SECONDS),
+    format: Literal["collapsed", "speedscope"] = "collapsed",
+    interval_ms: float = Query(5, ge=1, le=100),
+):
+    """
+    Sample every thread of this worker for the given seconds and return the
+    profile as collapsed stacks or speedscope JSON.
+    Requires "Authorization: Bearer $ATHENA_ADMIN_TOKEN"; disabled when unset.
+    With several workers, only the one that took the request is profiled.
+    """
+    require_admin(request)
+    sampler = StackSampler(interval_ms / 1e3).start()
+    try:
+        await asyncio.sleep(seconds)
+    finally:
+        profile = await run_in_threadpool(sampler.stop)
+    body, content_type = await run_in_threadpool(profile.render, format)
+    return Response(body, media_type=content_type, headers={"X-Profile-Samples": str(profile.samples)})
+
+
+def point_in_time_metrics() -> dict:
+    """Gauges read at scrape time from the current snapshot and caches."""
+    snap = snapshot
+    gauges = {
+        f'athena_snapshot_info{{version="{snap.version}"}}': 1,
+        "athena_snapshot_age_seconds": round(time.time() - snap.loaded_at, 1),
+        "athena_tenant_snapshots_loaded": len(tenant_snapshots.summary()["loaded"]),
+    }
+    if snap.content_store is not None:
+        stats = snap.content_store.stats()
+        gauges["athena_content_store_block_hits"] = stats["hits"]
+        gauges["athena_content_store_block_misses"] = stats["misses"]
+        gauges["athena_content_store_blocks_cached"] = stats["cached_blocks"]
+    return gauges
+
+
+@app.get("/metrics")
+async def metrics():
+    """Request, cache, query and snapshot load metrics in Prometheus text format."""
+    return Response(request_metrics.render_prometheus(point_in_time_metrics()),
+                    media_type="text/plain; version=0.0.4; charset=utf-8")
+
+
+@app.get("/metrics/summary")
+async def metrics_summary():
+    """
+    The same metrics as JSON: per-route latency percentiles (estimated from
+    histogram buckets), cache hit rates, query timings and recent slow requests.
+    """
+    summary = request_metrics.summary()
+    summary["snapshot_version"] = snapshot.version
+    if snapshot.content_store is not None:
+        stats = snapshot.content_store.stats()
+        lookups = stats["hits"] + stats["misses"]
+        summary["caches"]["content_blocks"] = {
+            "hit": stats["hits"],
+            "miss": stats["misses"],
+            "hit_rate": round(stats["hits"] / lookups, 4) if lookups else None,
+        }
+    return summary
+
+
+class PrecompiledResponse:
+    """A JSON response rendered once: body, gzipped body and ETag."""
+
+    # Below this size gzip saves too little to be worth it (GZipMiddleware's default)
+    GZIP_MIN_SIZE = 500
 
-    l2_clusters = clustering_data.get('clusters', {}).get('l2', {})
-    l2_positions = layout_data.get('positions', {}).get('l2_clusters', {})
-
-    # Color palette for L2 clusters based on dominant category
-    category_colors = {
-        "decision": "#1a365d",
-        "cce_decision_log": "#2f855a",
-        "cce_research": "#3182ce",
-        "cce_failed_approach": "#e53e3e",
-        "cce_success_log": "#38a169",
-        "cce_system": "#805ad5",
-        "cce": "#d69e2e",
-        "architecture": "#dd6b20",
-        "default": "#718096",
+    def __init__(self, content, version: str):
+        self.body = json_bytes(content)
+        self.etag = f'"{version}-{hashlib.sha256(self.body).hexdigest()[:16]}"'
+        self.gzip_body = gzip.compress(self.body, compresslevel=6, mtime=0) \
+            if len(self.body) >= self.GZIP_MIN_SIZE else None
+
+    def respond(self, request: Request) -> Response:
+        if self.gzip_body is not None and "gzip" in request.headers.get("accept-encoding", ""):
+            # Each encoding is its own representation, so it gets its own tag
+            body, headers = self.gzip_body, {"ETag": f'{self.etag[:-1]}-gzip"', "Content-Encoding": "gzip"}
+        else:
+            body, headers = self.body, {"ETag": self.etag}
+        headers["Vary"] = "Accept-Encoding"
+        not_modified = headers["ETag"] in request.headers.get("if-none-match", "")
+        request_metrics.cache_result("etag", not_modified)
+        if not_modified:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
+
+
+def precompile_responses(snap: Snapshot):
+    """Render every response derived only from the snapshot into snap.responses.
+
+    Keys: "overview", "l2:<id>", "clusters:<level>", "stats", "visualization-options".
+    """
+    start = time.perf_counter()
+    responses = {
+        "stats": PrecompiledResponse(build_stats(snap), snap.version),
+        "visualization-options": PrecompiledResponse(VISUALIZATION_OPTIONS, snap.version),
     }
+    if snap.clustering_data:
+        for level in ("l1", "l2"):
+            responses[f"clusters:{level}"] = PrecompiledResponse(build_clusters(snap, level), snap.version)
+        if snap.layout_data:
+            responses["overview"] = PrecompiledResponse(build_overview(snap), snap.version)
+            for cluster_id in snap.clustering_data.get('clusters', {}).get('l2', {}):
+                responses[f"l2:{cluster_id}"] = PrecompiledResponse(build_l2_detail(snap, cluster_id), snap.version)
+    snap.responses = responses
+    print(f"Precompiled {len(responses)} responses "
+          f"({sum(len(r.body) for r in responses.values()) / 1e3:.0f}KB) in {time.perf_counter() - start:.2f}s")
+
+
+def build_overview(snap: Snapshot) -> dict:
+    l2_clusters = snap.clustering_data.get('clusters', {}).get('l2', {})
+    l2_positions = snap.layout_data.get('positions', {}).get('l2_clusters', {})
 
     clusters = []
     for cluster_id, info in l2_clusters.items():
         pos = l2_positions.get(cluster_id, {"x": 0, "y": 0})
         # Determine color based on dominant category
         dominant_cat = info.get("dominant_category", "default")
-        color = category_colors.get(dominant_cat, category_colors["default"])
         clusters.append({
             "id": cluster_id,
             "x": pos.get("x", 0),
             "y": pos.get("y", 0),
             "size": info.get("total_size", info.get("size", 1)),
             "label": info.get("label", f"Cluster {cluster_id}"),
-            "color": color,
+            "color": CATEGORY_COLORS.get(dominant_cat, L2_DEFAULT_COLOR),
         })
 
     return {
         "total_clusters": len(clusters),
-        "total_memories": len(clustering_data.get('memories', [])),
+        "total_memories": len(snap.clustering_data.get('memories', [])),
         "clusters": clusters
     }
 
 
-@app.get("/api/l2/{cluster_id}")
-async def get_l2_detail(cluster_id: str):
-    """
-    Get L1 clusters within a specific L2 cluster.
-    Used when zooming into an L2 cluster.
-    """
-    if not clustering_data or not layout_data:
-        raise HTTPException(status_code=503, detail="Data not loaded")
-
-    l2_clusters = clustering_data.get('clusters', {}).get('l2', {})
-    l1_clusters = clustering_data.get('clusters', {}).get('l1', {})
-    l1_positions = layout_data.get('positions', {}).get('l1_clusters', {})
-
-    if cluster_id not in l2_clusters:
-        raise HTTPException(status_code=404, detail=f"L2 cluster {cluster_id} not found")
+def build_l2_detail(snap: Snapshot, cluster_id: str) -> dict:
+    l2_clusters = snap.clustering_data.get('clusters', {}).get('l2', {})
+    l1_clusters = snap.clustering_data.get('clusters', {}).get('l1', {})
+    l1_positions = snap.layout_data.get('positions', {}).get('l1_clusters', {})
 
     l2_info = l2_clusters[cluster_id]
     l1_ids = l2_info.get('l1_clusters', [])
 
-    # Color palette for L1 clusters
-    category_colors = {
-        "decision": "#1a365d",
-        "cce_decision_log": "#2f855a",
-        "cce_research": "#3182ce",
-        "cce_failed_approach": "#e53e3e",
-        "cce_success_log": "#38a169",
-        "cce_system": "#805ad5",
-        "cce": "#d69e2e",
-        "architecture": "#dd6b20",
-        "default": "#4299e1",
-    }
-
     clusters = []
     for l1_id in l1_ids:
         l1_id_str = str(l1_id)
         l1_info = l1_clusters.get(l1_id_str, {})
         pos = l1_positions.get(l1_id_str, {"x": 0, "y": 0})
         dominant_cat = l1_info.get("dominant_category", "default")
-        color = category_colors.get(dominant_cat, category_colors["default"])
         clusters.append({
             "id": l1_id_str,
             "x": pos.get("x", 0),
             "y": pos.get("y", 0),
             "size": l1_info.get("size", 1),
             "label": l1_info.get("label", f"L1-{l1_id}"),
-            "color": color,
+            "color": CATEGORY_COLORS.get(dominant_cat, L1_DEFAULT_COLOR),
         })
 
     return {
@@ -534,90 +1078,172 @@ async def get_l2_detail(cluster_id: str):
     }
 
 
+@app.get("/api/overview")
+@app.get("/api/t/{tenant}/overview")
+async def get_overview(request: Request, snap: Snapshot = Depends(request_snapshot)):
+    """
+    Get L2 cluster overview for zoomed-out view.
+    Returns all L2 clusters with their positions, sizes, and colors.
+    """
+    response = snap.responses.get("overview")
+    if response is None:
+        raise HTTPException(status_code=503, detail="Data not loaded")
+    return response.respond(request)
+
+
+@app.get("/api/l2/{cluster_id}")
+@app.get("/api/t/{tenant}/l2/{cluster_id}")
+async def get_l2_detail(cluster_id: str, request: Request, snap: Snapshot = Depends(request_snapshot)):
+    """
+    Get L1 clusters within a specific L2 cluster.
+    Used when zooming into an L2 cluster.
+    """
+    responses = snap.responses
+    if "overview" not in responses:
+        raise HTTPException(status_code=503, detail="Data not loaded")
+
+    response = responses.get(f"l2:{cluster_id}")
+    if response is None:
+        raise HTTPException(status_code=404, detail=f"L2 cluster {cluster_id} not found")
+    return response.respond(request)
+
+
+# Streaming formats for /api/l1 and /api/search: one JSON object per line,
+# either a memory per line or a batch of column arrays per line
+STREAM_FORMATS = ("ndjson", "columnar")
+
+
+def encode_cursor(snap: Snapshot, key: int) -> str:
+    """Opaque cursor: the index of the last memory returned, in this snapshot version."""
+    return base64.urlsafe_b64encode(json_bytes({"v": snap.version, "k": key})).rstrip(b"=").decode()
+
+
+def decode_cursor(snap: Snapshot, cursor: str) -> int:
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+        version, key = payload["v"], int(payload["k"])
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if version != snap.version:
+        raise HTTPException(status_code=410, detail="Data was reloaded since this cursor was issued; start again")
+    return key
+
+
+def stream_rows(header: dict, rows, format: str, batch_size: int):
+    """NDJSON body: the header line, then rows (one per line or columnar batches).
+
+    Yields one chunk per batch: StreamingResponse pulls each chunk through
+    the threadpool, which is too costly per row.
+    """
+    yield json_bytes({**header, "format": format}) + b"\n"
+    batch = []
+    for row in rows:
+        batch.append(row)
+        if len(batch) < batch_size:
+            continue
+        yield encode_batch(batch, format)
+        batch = []
+    if batch:
+        yield encode_batch(batch, format)
+
+
+def encode_batch(batch: list, format: str) -> bytes:
+    if format == "ndjson":
+        return b"".join(json_bytes(row) + b"\n" for row in batch)
+    columns = {key: [row[key] for row in batch] for key in batch[0]}
+    return json_bytes({"count": len(batch), "columns": columns}) + b"\n"
+
+
+def l1_memory_record(mem: dict, memory_positions: dict) -> dict:
+    pos = memory_positions.get(mem['id'], {"x": 0, "y": 0})
+    return {
+        "id": mem['id'],
+        "x": pos.get("x", 0),
+        "y": pos.get("y", 0),
+        "content_preview": mem.get('content_preview', '')[:200],
+        "category": mem.get('category', 'general'),
+        "cluster_l1": mem.get('cluster_l1'),
+        "cluster_l2": mem.get('cluster_l2'),
+    }
+
+
 @app.get("/api/l1/{cluster_id}")
+@app.get("/api/t/{tenant}/l1/{cluster_id}")
 async def get_l1_memories(
     cluster_id: str,
-    limit: int = Query(default=100, le=1000),
-    offset: int = Query(default=0, ge=0)
+    limit: int = Query(default=100, ge=1, le=1000),
+    offset: int = Query(default=0, ge=0),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page (instead of offset)"),
+    format: str = Query(default="json", description="json (one page), ndjson or columnar (stream to the end)"),
+    batch_size: int = Query(default=1000, ge=1, le=10000, description="Rows per streamed batch"),
+    snap: Snapshot = Depends(request_snapshot),
 ):
     """
     Get memories within a specific L1 cluster.
     Used when zooming into an L1 cluster to see individual nodes.
-    Supports pagination for large clusters.
+    Pages by cursor (or offset) over the cluster's member list. The
+    streaming formats send everything from the cursor/offset onwards, so
+    the frontend can draw the first nodes while the rest arrive.
     """
-    if not clustering_data or not layout_data:
+    if not snap.clustering_data or not snap.layout_data:
         raise HTTPException(status_code=503, detail="Data not loaded")
+    if format != "json" and format not in STREAM_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be json, {' or '.join(STREAM_FORMATS)}")
 
-    cluster_id_int = int(cluster_id)
-    memory_positions = layout_data.get('positions', {}).get('memories', {})
-    l1_clusters = clustering_data.get('clusters', {}).get('l1', {})
-
-    # Get L1 cluster info
-    l1_info = l1_clusters.get(cluster_id, {})
-
-    # Filter memories by L1 cluster
-    cluster_memories = [
-        m for m in clustering_data.get('memories', [])
-        if m.get('cluster_l1') == cluster_id_int
-    ]
-
-    if not cluster_memories:
+    try:
+        members = snap.l1_members.get(int(cluster_id))
+    except ValueError:
+        members = None
+    if not members:
         raise HTTPException(status_code=404, detail=f"L1 cluster {cluster_id} not found or empty")
 
-    # Apply pagination
-    total = len(cluster_memories)
-    paginated = cluster_memories[offset:offset + limit]
-    has_more = offset + limit < total
-
-    memories = []
-    for mem in paginated:
-        mem_id = mem['id']
-        pos = memory_positions.get(mem_id, {"x": 0, "y": 0})
-        memories.append({
-            "id": mem_id,
-            "x": pos.get("x", 0),
-            "y": pos.get("y", 0),
-            "content_preview": mem.get('content_preview', '')[:200],
-            "category": mem.get('category', 'general'),
-            "cluster_l1": mem.get('cluster_l1'),
-            "cluster_l2": mem.get('cluster_l2'),
-        })
+    all_memories = snap.clustering_data['memories']
+    memory_positions = snap.layout_data.get('positions', {}).get('memories', {})
+    l1_info = snap.clustering_data.get('clusters', {}).get('l1', {}).get(cluster_id, {})
+    start = bisect.bisect_right(members, decode_cursor(snap, cursor)) if cursor else offset
+    total = len(members)
 
-    return {
+    header = {
         "cluster_id": cluster_id,
         "cluster_label": l1_info.get("label", f"L1-{cluster_id}"),
         "total_memories": total,
-        "memories": memories,
+    }
+    if format in STREAM_FORMATS:
+        rows = (l1_memory_record(all_memories[i], memory_positions) for i in members[start:])
+        return StreamingResponse(stream_rows(header, rows, format, batch_size), media_type="application/x-ndjson")
+
+    page = members[start:start + limit]
+    has_more = start + limit < total
+    return {
+        **header,
+        "memories": [l1_memory_record(all_memories[i], memory_positions) for i in page],
         "has_more": has_more,
+        "next_cursor": encode_cursor(snap, page[-1]) if has_more and page else None,
     }
 
 
 @app.get("/api/memory/{memory_id}")
-async def get_memory(memory_id: str):
+@app.get("/api/t/{tenant}/memory/{memory_id}")
+async def get_memory(memory_id: str, snap: Snapshot = Depends(request_snapshot)):
     """
     Get full details for a specific memory.
     Used when clicking on a node.
     """
-    if not clustering_data or not layout_data:
+    if not snap.clustering_data or not snap.layout_data:
         raise HTTPException(status_code=503, detail="Data not loaded")
 
-    memory_positions = layout_data.get('positions', {}).get('memories', {})
+    memory_positions = snap.layout_data.get('positions', {}).get('memories', {})
 
-    # Find the memory
-    memory = None
-    for m in clustering_data.get('memories', []):
-        if m['id'] == memory_id:
-            memory = m
-            break
-
-    if not memory:
+    index = snap.memory_index.get(memory_id)
+    if index is None:
         raise HTTPException(status_code=404, detail=f"Memory {memory_id} not found")
+    memory = snap.clustering_data['memories'][index]
 
     pos = memory_positions.get(memory_id, {"x": 0, "y": 0})
 
     return {
         "id": memory_id,
-        "content": memory.get('content_preview', ''),
+        "content": snap.content(index),
         "category": memory.get('category', 'general'),
         "source": memory.get('source', 'zeus'),
         "created_at": memory.get('created_at', ''),
@@ -630,25 +1256,64 @@ async def get_memory(memory_id: str):
     }
 
 
-@app.get("/api/search")
-async def search_memories(
-    q: str = Query(..., min_length=2, description="Search query"),
-    limit: int = Query(default=20, le=100)
-):
+@app.post("/api/memories/batch")
+@app.post("/api/t/{tenant}/memories/batch")
+async def get_memories_batch(batch: MemoryBatchRequest, snap: Snapshot = Depends(request_snapshot)):
     """
-    Search memories by content and return matching results with cluster info.
-    Useful for finding where a topic fits in the hierarchy.
+    Get many memories in one request, e.g. a selected region or a path.
+    Returns columns (one array per field, in request order) for the ids
+    found; unknown ids are listed in "missing".
     """
-    if not clustering_data or not layout_data:
+    if not snap.clustering_data or not snap.layout_data:
         raise HTTPException(status_code=503, detail="Data not loaded")
 
-    query_lower = q.lower()
-    l1_clusters = clustering_data.get('clusters', {}).get('l1', {})
-    l2_clusters = clustering_data.get('clusters', {}).get('l2', {})
-    memory_positions = layout_data.get('positions', {}).get('memories', {})
-
-    results = []
-    for mem in clustering_data.get('memories', []):
+    all_memories = snap.clustering_data['memories']
+    memory_positions = snap.layout_data.get('positions', {}).get('memories', {})
+    indices = []
+    missing = []
+    for memory_id in batch.ids:
+        index = snap.memory_index.get(memory_id)
+        if index is None:
+            missing.append(memory_id)
+        else:
+            indices.append(index)
+    found = [all_memories[i] for i in indices]
+
+    positions = [memory_positions.get(m['id'], {"x": 0, "y": 0}) for m in found]
+    columns = {
+        "id": [m['id'] for m in found],
+        "x": [pos.get("x", 0) for pos in positions],
+        "y": [pos.get("y", 0) for pos in positions],
+        "cluster_l1": [str(m.get('cluster_l1', '')) for m in found],
+        "cluster_l2": [str(m.get('cluster_l2', '')) for m in found],
+    }
+    if batch.fields in ("previews", "full"):
+        columns["category"] = [m.get('category', 'general') for m in found]
+    if batch.fields == "previews":
+        columns["content_preview"] = [m.get('content_preview', '')[:200] for m in found]
+    if batch.fields == "full":
+        columns["content"] = [snap.content(i) for i in indices]
+        columns["source"] = [m.get('source', 'zeus') for m in found]
+        columns["created_at"] = [m.get('created_at', '') for m in found]
+
+    # Columns are plain JSON values already; skip FastAPI's per-value encoding pass
+    return JSONResponse({
+        "fields": batch.fields,
+        "count": len(found),
+        "missing": missing,
+        "columns": columns,
+    })
+
+
+def search_matches(snap: Snapshot, query_lower: str, start: int):
+    """(memory index, result) for memories whose preview contains the query, from start on."""
+    l1_clusters = snap.clustering_data.get('clusters', {}).get('l1', {})
+    l2_clusters = snap.clustering_data.get('clusters', {}).get('l2', {})
+    memory_positions = snap.layout_data.get('positions', {}).get('memories', {})
+    memories = snap.clustering_data.get('memories', [])
+
+    for i in range(start, len(memories)):
+        mem = memories[i]
         content = mem.get('content_preview', '').lower()
         if query_lower in content:
             l1_id = str(mem.get('cluster_l1', ''))
@@ -657,7 +1322,7 @@ async def search_memories(
             l2_info = l2_clusters.get(l2_id, {})
             pos = memory_positions.get(mem['id'], {"x": 0, "y": 0})
 
-            results.append({
+            yield i, {
                 "id": mem['id'],
                 "content_preview": mem.get('content_preview', '')[:200],
                 "category": mem.get('category', 'general'),
@@ -667,15 +1332,49 @@ async def search_memories(
                 "cluster_l2_label": l2_info.get('label', f'L2-{l2_id}'),
                 "x": pos.get("x", 0),
                 "y": pos.get("y", 0),
-            })
+            }
 
-            if len(results) >= limit:
-                break
+
+@app.get("/api/search")
+@app.get("/api/t/{tenant}/search")
+async def search_memories(
+    q: str = Query(..., min_length=2, description="Search query"),
+    limit: int = Query(default=20, le=100),
+    cursor: Optional[str] = Query(default=None, description="next_cursor from the previous page"),
+    format: str = Query(default="json", description="json (one page), ndjson or columnar (stream every match)"),
+    batch_size: int = Query(default=100, ge=1, le=10000, description="Results per streamed batch"),
+    snap: Snapshot = Depends(request_snapshot),
+):
+    """
+    Search memories by content and return matching results with cluster info.
+    Useful for finding where a topic fits in the hierarchy.
+    A full page carries next_cursor to continue the scan where it stopped;
+    the streaming formats send every match from the cursor onwards.
+    """
+    if not snap.clustering_data or not snap.layout_data:
+        raise HTTPException(status_code=503, detail="Data not loaded")
+    if format != "json" and format not in STREAM_FORMATS:
+        raise HTTPException(status_code=400, detail=f"format must be json, {' or '.join(STREAM_FORMATS)}")
+
+    start = decode_cursor(snap, cursor) + 1 if cursor else 0
+    matches = search_matches(snap, q.lower(), start)
+    if format in STREAM_FORMATS:
+        rows = (result for _, result in matches)
+        return StreamingResponse(stream_rows({"query": q}, rows, format, batch_size),
+                                 media_type="application/x-ndjson")
+
+    results = []
+    last = None
+    for last, result in matches:
+        results.append(result)
+        if len(results) >= limit:
+            break
 
     return {
         "query": q,
         "total_results": len(results),
         "results": results,
+        "next_cursor": encode_cursor(snap, last) if len(results) >= limit else None,
     }
 
 
@@ -697,7 +1396,8 @@ async def get_tenant_distribution():
     }
 
     try:
-        conn = await asyncpg.connect(**db_config)
+        with request_metrics.query("tenant_distribution.connect"):
+            conn = await asyncpg.connect(**db_config)
 
         query = """
             SELECT
@@ -710,7 +1410,8 @@ async def get_tenant_distribution():
             ORDER BY memory_count DESC
         """
 
-        rows = await conn.fetch(query)
+        with request_metrics.query("tenant_distribution.tenant_counts"):
+            rows = await conn.fetch(query)
         await conn.close()
 
         # Assign colors to tenants
@@ -771,7 +1472,9 @@ async def get_tenant_graph():
     # Check cache first
     cache_key = "tenant_graph"
     cached = _cache.get(cache_key)
-    if cached and cached["expires"] > time.time():
+    hit = cached is not None and cached["expires"] > time.time()
+    request_metrics.cache_result("tenant_graph", hit)
+    if hit:
         return cached["data"]
 
     import asyncpg
@@ -849,80 +1552,89 @@ async def get_tenant_graph():
             return 'other'
 
     try:
-        conn = await asyncpg.connect(**db_config, timeout=30, command_timeout=30)
+        with request_metrics.query("tenant_graph.connect"):
+            conn = await asyncpg.connect(**db_config, timeout=30, command_timeout=30)
 
         # 1. Get all tenants with parent hierarchy
-        tenant_rows = await conn.fetch("""
-            SELECT t.tenant_id::text, t.name, t.parent_tenant_id::text, t.created_at
-            FROM zeus_core.tenants t
-            ORDER BY t.name
-        """)
+        with request_metrics.query("tenant_graph.tenants"):
+            tenant_rows = await conn.fetch("""
+                SELECT t.tenant_id::text, t.name, t.parent_tenant_id::text, t.created_at
+                FROM zeus_core.tenants t
+                ORDER BY t.name
+            """)
 
         # 2. Get memory counts per tenant (uses index, fast)
-        mem_count_rows = await conn.fetch("""
-            SELECT tenant_id::text, COUNT(*) as memory_count
-            FROM zeus_core.memories
-            GROUP BY tenant_id
-        """)
+        with request_metrics.query("tenant_graph.memory_counts"):
+            mem_count_rows = await conn.fetch("""
+                SELECT tenant_id::text, COUNT(*) as memory_count
+                FROM zeus_core.memories
+                GROUP BY tenant_id
+            """)
         mem_counts = {r["tenant_id"]: r["memory_count"] for r in mem_count_rows}
 
         # 3. Get top sources per tenant (top 8 by count)
-        source_rows = await conn.fetch("""
-            SELECT tenant_id::text, source, COUNT(*) as memory_count
-            FROM zeus_core.memories
-            WHERE tenant_id IS NOT NULL
-            GROUP BY tenant_id, source
-            ORDER BY tenant_id, COUNT(*) DESC
-        """)
+        with request_metrics.query("tenant_graph.top_sources"):
+            source_rows = await conn.fetch("""
+                SELECT tenant_id::text, source, COUNT(*) as memory_count
+                FROM zeus_core.memories
+                WHERE tenant_id IS NOT NULL
+                GROUP BY tenant_id, source
+                ORDER BY tenant_id, COUNT(*) DESC
+            """)
 
         # 4. Get real pipeline stats using fast indexed queries
         # Split into targeted queries that hit indexes instead of one 60s full-table scan
 
         # 4a. Approximate total from pg_class (instant, no table scan)
-        approx_total_row = await conn.fetchrow("""
-            SELECT reltuples::bigint as approx_total
-            FROM pg_class
-            WHERE relname = 'memories'
-              AND relnamespace = (SELECT oid FROM pg_namespace WHERE nspname = 'zeus_core')
-        """)
+        with request_metrics.query("tenant_graph.approx_total"):
+            approx_total_row = await conn.fetchrow("""
+                SELECT reltuples::bigint as approx_total
+                FROM pg_class
+                WHERE relname = 'memories'
+                  AND relnamespace = (SELECT oid FROM pg_namespace WHERE nspname = 'zeus_core')
+            """)
 
         # 4b. Memories missing embeddings (uses idx_memories_voyage_null, ~50ms)
-        missing_embed_row = await conn.fetchrow("""
-            SELECT COUNT(*) as no_embedding
-            FROM zeus_core.memories
-            WHERE embedding_voyage IS NULL
-        """)
+        with request_metrics.query("tenant_graph.missing_embeddings"):
+            missing_embed_row = await conn.fetchrow("""
+                SELECT COUNT(*) as no_embedding
+                FROM zeus_core.memories
+                WHERE embedding_voyage IS NULL
+            """)
 
         # 4c. Recent ingestion throughput (uses idx_memories_created, ~7ms)
-        throughput_row = await conn.fetchrow("""
-            SELECT
-                COUNT(*) FILTER (WHERE created_at >= NOW() - INTERVAL '24 hours') as ingested_24h,
-                COUNT(*) FILTER (WHERE created_at >= NOW() - INTERVAL '7 days') as ingested_7d
-            FROM zeus_core.memories
-            WHERE created_at >= NOW() - INTERVAL '7 days'
-        """)
+        with request_metrics.query("tenant_graph.throughput"):
+            throughput_row = await conn.fetchrow("""
+                SELECT
+                    COUNT(*) FILTER (WHERE created_at >= NOW() - INTERVAL '24 hours') as ingested_24h,
+                    COUNT(*) FILTER (WHERE created_at >= NOW() - INTERVAL '7 days') as ingested_7d
+                FROM zeus_core.memories
+                WHERE created_at >= NOW() - INTERVAL '7 days'
+            """)
 
         # 4d. Active ingestion crons from ingestion_log (tiny table, instant)
-        ingestion_crons = await conn.fetch("""
-            SELECT source, COUNT(*) as runs,
-                   SUM(items_processed) as total_processed,
-                   SUM(items_created) as total_created,
-                   MAX(created_at) as last_run
-            FROM zeus_core.ingestion_log
-            GROUP BY source
-            ORDER BY MAX(created_at) DESC
-        """)
+        with request_metrics.query("tenant_graph.ingestion_crons"):
+            ingestion_crons = await conn.fetch("""
+                SELECT source, COUNT(*) as runs,
+                       SUM(items_processed) as total_processed,
+                       SUM(items_created) as total_created,
+                       MAX(created_at) as last_run
+                FROM zeus_core.ingestion_log
+                GROUP BY source
+                ORDER BY MAX(created_at) DESC
+            """)
 
         # 4e. Distinct source count from ingestion_log + known source categories
-        distinct_src_row = await conn.fetchrow("""
-            SELECT COUNT(DISTINCT source) as cnt
-            FROM (
-                SELECT DISTINCT source FROM zeus_core.ingestion_log
-                UNION
-                SELECT DISTINCT source FROM zeus_core.memories
-                WHERE created_at >= NOW() - INTERVAL '30 days'
-            ) recent_sources
-        """)
+        with request_metrics.query("tenant_graph.distinct_sources"):
+            distinct_src_row = await conn.fetchrow("""
+                SELECT COUNT(DISTINCT source) as cnt
+                FROM (
+                    SELECT DISTINCT source FROM zeus_core.ingestion_log
+                    UNION
+                    SELECT DISTINCT source FROM zeus_core.memories
+                    WHERE created_at >= NOW() - INTERVAL '30 days'
+                ) recent_sources
+            """)
 
         await conn.close()
 
@@ -1222,10 +1934,8 @@ async def get_tenant_graph():
         }
 
 
-@app.get("/api/stats")
-async def get_stats():
-    """Get statistics about the loaded data."""
-    if not clustering_data or not layout_data:
+def build_stats(snap: Snapshot) -> dict:
+    if not snap.clustering_data or not snap.layout_data:
         return {
             "total_memories": 0,
             "total_l1_clusters": 0,
@@ -1234,96 +1944,124 @@ async def get_stats():
         }
 
     return {
-        "total_memories": len(clustering_data.get('memories', [])),
-        "total_l1_clusters": len(clustering_data.get('clusters', {}).get('l1', {})),
-        "total_l2_clusters": len(clustering_data.get('clusters', {}).get('l2', {})),
+        "total_memories": len(snap.clustering_data.get('memories', [])),
+        "total_l1_clusters": len(snap.clustering_data.get('clusters', {}).get('l1', {})),
+        "total_l2_clusters": len(snap.clustering_data.get('clusters', {}).get('l2', {})),
         "data_loaded": True,
     }
 
 
+@app.get("/api/stats")
+@app.get("/api/t/{tenant}/stats")
+async def get_stats(request: Request, snap: Snapshot = Depends(request_snapshot)):
+    """Get statistics about the loaded data."""
+    response = snap.responses.get("stats")
+    if response is None:
+        return build_stats(snap)
+    return response.respond(request)
+
+
 # =============================================================================
 # Extended Feature Endpoints (v2.0)
 # =============================================================================
 
+VISUALIZATION_OPTIONS = {
+    "layouts": [
+        {"id": "force", "name": "Force-Directed", "description": "Physics-based node positioning"},
+        {"id": "layered", "name": "Layered 3D", "description": "Z-axis represents hierarchy/tier"},
+        {"id": "spherical", "name": "Spherical", "description": "Nodes on sphere surface by category"},
+        {"id": "cylinder", "name": "Cylinder", "description": "Time on Y-axis, categories on circumference"},
+    ],
+    "geometries": [
+        {"id": "sphere", "name": "Sphere", "symbol": "●"},
+        {"id": "cube", "name": "Cube", "symbol": "■"},
+        {"id": "octahedron", "name": "Octahedron", "symbol": "◆"},
+        {"id": "ring", "name": "Ring", "symbol": "○"},
+    ],
+    "effects": [
+        {"id": "glow", "name": "Glow", "description": "Add glow effect to nodes"},
+        {"id": "particles", "name": "Particles", "description": "Animated particles along edges"},
+        {"id": "labels", "name": "Labels", "description": "Show node labels on hover", "default": True},
+        {"id": "pulse", "name": "Pulse Recent", "description": "Pulse animation for recent nodes"},
+    ],
+    "colorModes": [
+        {"id": "category", "name": "By Category", "description": "Color by node type/category"},
+        {"id": "heatmap_connections", "name": "Heat Map (Connections)", "description": "Color by connection count"},
+        {"id": "heatmap_recency", "name": "Heat Map (Recency)", "description": "Color by creation date"},
+    ],
+    "sizeModes": [
+        {"id": "default", "name": "Default", "description": "Use data-defined sizes"},
+        {"id": "centrality", "name": "By Centrality", "description": "Size based on precomputed node degree"},
+    ],
+}
+
+
 @app.get("/api/visualization-options")
-async def get_visualization_options():
+async def get_visualization_options(request: Request):
     """
     Get available visualization options and their configurations.
     Used by Atlas frontend to populate settings panels.
     """
-    return {
-        "layouts": [
-            {"id": "force", "name": "Force-Directed", "description": "Physics-based node positioning"},
-            {"id": "layered", "name": "Layered 3D", "description": "Z-axis represents hierarchy/tier"},
-            {"id": "spherical", "name": "Spherical", "description": "Nodes on sphere surface by category"},
-            {"id": "cylinder", "name": "Cylinder", "description": "Time on Y-axis, categories on circumference"},
-        ],
-        "geometries": [
-            {"id": "sphere", "name": "Sphere", "symbol": "●"},
-            {"id": "cube", "name": "Cube", "symbol": "■"},
-            {"id": "octahedron", "name": "Octahedron", "symbol": "◆"},
-            {"id": "ring", "name": "Ring", "symbol": "○"},
-        ],
-        "effects": [
-            {"id": "glow", "name": "Glow", "description": "Add glow effect to nodes"},
-            {"id": "particles", "name": "Particles", "description": "Animated particles along edges"},
-            {"id": "labels", "name": "Labels", "description": "Show node labels on hover", "default": True},
-            {"id": "pulse", "name": "Pulse Recent", "description": "Pulse animation for recent nodes"},
-        ],
-        "colorModes": [
-            {"id": "category", "name": "By Category", "description": "Color by node type/category"},
-            {"id": "heatmap_connections", "name": "Heat Map (Connections)", "description": "Color by connection count"},
-            {"id": "heatmap_recency", "name": "Heat Map (Recency)", "description": "Color by creation date"},
-        ],
-        "sizeModes": [
-            {"id": "default", "name": "Default", "description": "Use data-defined sizes"},
-            {"id": "centrality", "name": "By Centrality", "description": "Size based on node degree"},
-        ],
-    }
+    response = snapshot.responses.get("visualization-options")
+    if response is None:
+        return VISUALIZATION_OPTIONS
+    return response.respond(request)
 
 
 @app.get("/api/centrality")
-async def compute_centrality():
+@app.get("/api/t/{tenant}/centrality")
+async def compute_centrality(
+    metric: str = Query(default="degree", description="degree, weighted_degree, pagerank or betweenness"),
+    limit: int = Query(default=1000, ge=1, le=10000),
+    offset: int = Query(default=0, ge=0),
+    top_k: Optional[int] = Query(default=None, ge=1, le=10000, description="Shortcut for offset=0, limit=top_k"),
+    snap: Snapshot = Depends(request_snapshot),
+):
     """
-    Compute centrality metrics for all nodes in the graph.
-    Returns degree centrality for each node.
+    Get precomputed centrality metrics for nodes in the k-NN graph.
+    Values come from the offline metrics stage (compute_metrics.py) and are
+    returned in descending order, paginated.
     """
-    if not clustering_data:
-        raise HTTPException(status_code=503, detail="Data not loaded")
+    if not snap.metrics_data:
+        raise HTTPException(status_code=503, detail="Centrality metrics not loaded")
 
-    # Build adjacency from clustering data
-    # This is a simplified centrality - for full graph we'd need edge data
-    memories = clustering_data.get('memories', [])
-    l1_clusters = clustering_data.get('clusters', {}).get('l1', {})
+    if metric not in snap.metrics_order:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown metric '{metric}'. Available: {', '.join(snap.metrics_order)}"
+        )
+
+    if top_k is not None:
+        offset, limit = 0, top_k
 
-    centrality = {}
-    for mem in memories:
-        mem_id = mem['id']
-        # Use cluster membership as proxy for connectivity
-        l1_id = str(mem.get('cluster_l1', 0))
-        cluster_size = l1_clusters.get(l1_id, {}).get('size', 1)
-        # Nodes in larger clusters have higher "centrality"
-        centrality[mem_id] = min(cluster_size / 10, 1.0)
+    ids = snap.metrics_data['ids']
+    values = snap.metrics_data['metrics'][metric]
+    page = snap.metrics_order[metric][offset:offset + limit]
 
     return {
-        "metric": "degree_centrality",
-        "total_nodes": len(centrality),
-        "values": centrality,
+        "metric": metric,
+        "available_metrics": list(snap.metrics_order),
+        "total_nodes": len(ids),
+        "offset": offset,
+        "limit": limit,
+        "has_more": offset + limit < len(ids),
+        "values": {ids[i]: values[i] for i in page},
     }
 
 
 @app.get("/api/temporal-distribution")
-async def get_temporal_distribution():
+@app.get("/api/t/{tenant}/temporal-distribution")
+async def get_temporal_distribution(snap: Snapshot = Depends(request_snapshot)):
     """
     Get temporal distribution of nodes for time slider feature.
     Returns date range and counts per time bucket.
     """
-    if not clustering_data:
+    if not snap.clustering_data:
         raise HTTPException(status_code=503, detail="Data not loaded")
 
     from datetime import datetime
 
-    memories = clustering_data.get('memories', [])
+    memories = snap.clustering_data.get('memories', [])
     dated_memories = [m for m in memories if m.get('created_at')]
 
     if not dated_memories:
@@ -1367,19 +2105,8 @@ async def get_temporal_distribution():
     }
 
 
-@app.get("/api/clusters/{level}")
-async def get_clusters_for_collapse(level: str = "l1"):
-    """
-    Get all clusters at a specific level for expand/collapse feature.
-    Returns cluster info with member counts.
-    """
-    if not clustering_data:
-        raise HTTPException(status_code=503, detail="Data not loaded")
-
-    if level not in ["l1", "l2"]:
-        raise HTTPException(status_code=400, detail="Level must be 'l1' or 'l2'")
-
-    clusters = clustering_data.get('clusters', {}).get(level, {})
+def build_clusters(snap: Snapshot, level: str) -> dict:
+    clusters = snap.clustering_data.get('clusters', {}).get(level, {})
 
     result = []
     for cluster_id, info in clusters.items():
@@ -1397,16 +2124,33 @@ async def get_clusters_for_collapse(level: str = "l1"):
     }
 
 
+@app.get("/api/clusters/{level}")
+@app.get("/api/t/{tenant}/clusters/{level}")
+async def get_clusters_for_collapse(request: Request, level: str = "l1", snap: Snapshot = Depends(request_snapshot)):
+    """
+    Get all clusters at a specific level for expand/collapse feature.
+    Returns cluster info with member counts.
+    """
+    if not snap.clustering_data:
+        raise HTTPException(status_code=503, detail="Data not loaded")
+
+    if level not in ["l1", "l2"]:
+        raise HTTPException(status_code=400, detail="Level must be 'l1' or 'l2'")
+
+    return snap.responses[f"clusters:{level}"].respond(request)
+
+
 @app.get("/api/path/{start_id}/{end_id}")
-async def find_path(start_id: str, end_id: str):
+@app.get("/api/t/{tenant}/path/{start_id}/{end_id}")
+async def find_path(start_id: str, end_id: str, snap: Snapshot = Depends(request_snapshot)):
     """
     Find shortest path between two nodes.
     Uses cluster membership for path approximation.
     """
-    if not clustering_data:
+    if not snap.clustering_data:
         raise HTTPException(status_code=503, detail="Data not loaded")
 
-    memories = clustering_data.get('memories', [])
+    memories = snap.clustering_data.get('memories', [])
     mem_by_id = {m['id']: m for m in memories}
 
     if start_id not in mem_by_id:
@@ -1448,16 +2192,18 @@ async def find_path(start_id: str, end_id: str):
 
 
 @app.get("/api/neighbors/{memory_id}")
-async def get_neighbors(memory_id: str, max_neighbors: int = Query(default=20, le=100)):
+@app.get("/api/t/{tenant}/neighbors/{memory_id}")
+async def get_neighbors(memory_id: str, max_neighbors: int = Query(default=20, le=100),
+                        snap: Snapshot = Depends(request_snapshot)):
     """
     Get neighbors of a memory node based on cluster membership.
     Useful for highlighting connected nodes on selection.
     """
-    if not clustering_data or not layout_data:
+    if not snap.clustering_data or not snap.layout_data:
         raise HTTPException(status_code=503, detail="Data not loaded")
 
-    memories = clustering_data.get('memories', [])
-    memory_positions = layout_data.get('positions', {}).get('memories', {})
+    memories = snap.clustering_data.get('memories', [])
+    memory_positions = snap.layout_data.get('positions', {}).get('memories', {})
 
     # Find the target memory
     target = None
@@ -1536,7 +2282,8 @@ async def viz_navigator():
 
 
 @app.get("/api/navigator/graph")
-async def get_navigator_graph(level: str = "ecosystem", node_id: Optional[str] = None):
+async def get_navigator_graph(level: str = "ecosystem", node_id: Optional[str] = None,
+                              parent: Optional[str] = None):
     """
     Get graph data for the multi-scale navigator.
     Supports zooming into specific nodes to load sub-graphs.
@@ -1545,82 +2292,104 @@ async def get_navigator_graph(level: str = "ecosystem", node_id: Optional[str] =
     - ecosystem: Full ALDC ecosystem overview
     - client: Client-specific schema (requires node_id)
     - schema: Table-level view
-    - element: Column/measure level
+    - element: Column/measure level of one table (requires node_id = table
+      node and parent = the client node whose schema graph lists it)
     """
     data_dir = get_data_dir()
+    graph_mapping = {
+        "fusion92_client": "f92_schema_graph.json",
+        "gep_client": "gep_schema_graph.json",
+        "aldc_eng": "aldc_schema_graph.json",
+    }
 
     if level == "ecosystem" or node_id is None:
         # Load main ecosystem navigator data
-        graph_file = data_dir / "examples" / "aldc_ecosystem_navigator.json"
+        graph_file = get_navigator_file()
+    elif level == "element" and parent is not None:
+        # Table sub-graphs are only served through the parent schema graph's
+        # zoom targets (written by generate_schema_graph), never a raw path
+        if parent not in graph_mapping:
+            raise HTTPException(status_code=400, detail=f"Unknown parent for element level: {parent}")
+        schema_file = data_dir / "examples" / graph_mapping[parent]
+        schema = await graph_documents.load(schema_file)
+        if schema is None:
+            raise HTTPException(status_code=404, detail=f"Graph data not found: {schema_file}")
+        zoom_targets = schema.data.get("navigation", {}).get("zoom_targets", {})
+        if node_id not in zoom_targets:
+            raise HTTPException(status_code=404, detail=f"No column-level graph for {node_id}")
+        graph_file = schema_file.parent / zoom_targets[node_id]["target_graph"]
     else:
         # Load sub-graph based on zoom target
-        graph_mapping = {
-            "fusion92_client": "f92_schema_graph.json",
-            "gep_client": "gep_schema_graph.json",
-            "aldc_eng": "aldc_schema_graph.json",
-        }
-
         if node_id in graph_mapping:
             graph_file = data_dir / "examples" / graph_mapping[node_id]
         else:
-            graph_file = data_dir / "examples" / "aldc_ecosystem_navigator.json"
+            graph_file = get_navigator_file()
 
-    if not graph_file.exists():
+    document = await graph_documents.load(graph_file)
+    if document is None:
         raise HTTPException(status_code=404, detail=f"Graph data not found: {graph_file}")
 
-    with open(graph_file, 'r') as f:
-        graph_data = json.load(f)
-
+    # The graph itself is serialized once per file version; only the
+    # request-specific envelope is encoded here
+    return Response(
+        b"".join([
+            b'{"level":', json_bytes(level),
+            b',"node_id":', json_bytes(node_id),
+            b',"graph":', document.graph_json,
+            b',"navigation":', document.fragment("navigation", lambda data: data.get("navigation", {})),
+            b',"available_overlays":',
+            document.fragment("available_overlays", lambda data: list(data.get("overlays", {}).keys())),
+            b'}',
+        ]),
+        media_type="application/json",
+    )
+
+
+def overlay_response(overlay_type: str, items: list, style: dict) -> dict:
     return {
-        "level": level,
-        "node_id": node_id,
-        "graph": graph_data,
-        "navigation": graph_data.get("navigation", {}),
-        "available_overlays": list(graph_data.get("overlays", {}).keys()),
+        "overlay_type": overlay_type,
+        "total": len(items),
+        "items": items,
+        "style": style,
     }
 
 
+async def navigator_overlay(overlay_type: str, style: dict, fallback: list) -> Response:
+    """Overlay items from the navigator's sample_overlays, serialized once per file version."""
+    document = await graph_documents.load(get_navigator_file())
+    if document is None:
+        return JSONResponse(overlay_response(overlay_type, fallback, style))
+    body = document.fragment(
+        f"overlay:{overlay_type}",
+        lambda data: overlay_response(overlay_type, data.get("sample_overlays", {}).get(overlay_type, []), style),
+    )
+    return Response(body, media_type="application/json")
+
+
 @app.get("/api/overlays/projects")
 async def get_project_overlays():
     """
     Get project overlay data to show on the ecosystem graph.
     Returns projects with their affected nodes for visualization.
     """
-    data_dir = get_data_dir()
-
-    # Load navigator data which contains sample overlays
-    graph_file = data_dir / "examples" / "aldc_ecosystem_navigator.json"
-
-    if graph_file.exists():
-        with open(graph_file, 'r') as f:
-            data = json.load(f)
-
-        projects = data.get("sample_overlays", {}).get("projects", [])
-    else:
-        # Fallback sample data
-        projects = [
-            {
-                "id": "prj-fu92-28",
-                "name": "Smartsheet Replacement",
-                "status": "in_progress",
-                "jira_key": "FU92-28",
-                "affected_nodes": ["smartsheet", "eclipse_connectors", "snowflake_warehouse", "fusion92_client"],
-                "hours_spent": 218.39,
-                "due_date": "2026-02-15"
-            }
-        ]
-
-    return {
-        "overlay_type": "projects",
-        "total": len(projects),
-        "items": projects,
-        "style": {
-            "node_halo": "#ffd700",
-            "edge_style": "dashed",
-            "badge_color": "#ffd700",
-            "badge_icon": "clipboard"
+    # Fallback sample data when the navigator file is missing
+    fallback = [
+        {
+            "id": "prj-fu92-28",
+            "name": "Smartsheet Replacement",
+            "status": "in_progress",
+            "jira_key": "FU92-28",
+            "affected_nodes": ["smartsheet", "eclipse_connectors", "snowflake_warehouse", "fusion92_client"],
+            "hours_spent": 218.39,
+            "due_date": "2026-02-15"
         }
-    }
+    ]
+    return await navigator_overlay("projects", {
+        "node_halo": "#ffd700",
+        "edge_style": "dashed",
+        "badge_color": "#ffd700",
+        "badge_icon": "clipboard"
+    }, fallback)
 
 
 @app.get("/api/overlays/initiatives")
@@ -1629,29 +2398,12 @@ async def get_initiative_overlays():
     Get initiative overlay data for strategic view.
     Shows business initiatives mapped to technical components.
     """
-    data_dir = get_data_dir()
-
-    graph_file = data_dir / "examples" / "aldc_ecosystem_navigator.json"
-
-    if graph_file.exists():
-        with open(graph_file, 'r') as f:
-            data = json.load(f)
-
-        initiatives = data.get("sample_overlays", {}).get("initiatives", [])
-    else:
-        initiatives = []
-
-    return {
-        "overlay_type": "initiatives",
-        "total": len(initiatives),
-        "items": initiatives,
-        "style": {
-            "node_halo": "#00ff88",
-            "edge_style": "dotted",
-            "badge_color": "#00ff88",
-            "badge_icon": "flag"
-        }
-    }
+    return await navigator_overlay("initiatives", {
+        "node_halo": "#00ff88",
+        "edge_style": "dotted",
+        "badge_color": "#00ff88",
+        "badge_icon": "flag"
+    }, [])
 
 
 @app.get("/api/overlays/dashboards")
@@ -1660,28 +2412,11 @@ async def get_dashboard_overlays():
     Get dashboard overlay showing data dependencies.
     Shows which data sources feed into which dashboards.
     """
-    data_dir = get_data_dir()
-
-    graph_file = data_dir / "examples" / "aldc_ecosystem_navigator.json"
-
-    if graph_file.exists():
-        with open(graph_file, 'r') as f:
-            data = json.load(f)
-
-        dashboards = data.get("sample_overlays", {}).get("dashboards", [])
-    else:
-        dashboards = []
-
-    return {
-        "overlay_type": "dashboards",
-        "total": len(dashboards),
-        "items": dashboards,
-        "style": {
-            "node_halo": "#ff6b6b",
-            "badge_color": "#ff6b6b",
-            "badge_icon": "chart"
-        }
-    }
+    return await navigator_overlay("dashboards", {
+        "node_halo": "#ff6b6b",
+        "badge_color": "#ff6b6b",
+        "badge_icon": "chart"
+    }, [])
 
 
 @app.get("/api/overlays/timelines")
@@ -1709,41 +2444,36 @@ async def get_zoom_target(node_id: str):
     Get zoom target information for a specific node.
     Returns details about what sub-graph to load when zooming into this node.
     """
-    data_dir = get_data_dir()
-
-    # Load navigator data
-    graph_file = data_dir / "examples" / "aldc_ecosystem_navigator.json"
-
-    if not graph_file.exists():
+    document = await graph_documents.load(get_navigator_file())
+    if document is None:
         raise HTTPException(status_code=404, detail="Navigator data not found")
 
-    with open(graph_file, 'r') as f:
-        data = json.load(f)
-
     # Check navigation zoom_targets
-    zoom_targets = data.get("navigation", {}).get("zoom_targets", {})
+    zoom_targets = document.data.get("navigation", {}).get("zoom_targets", {})
 
     if node_id in zoom_targets:
         target = zoom_targets[node_id]
-        return {
+        body = document.fragment(f"zoom:{node_id}", lambda data: {
             "node_id": node_id,
             "can_zoom": True,
             "target_graph": target.get("target_graph"),
             "target_endpoint": target.get("target_endpoint"),
             "level": target.get("level"),
             "description": target.get("description"),
-        }
+        })
+        return Response(body, media_type="application/json")
 
     # Check nodes for expandable flag
-    for node in data.get("nodes", []):
-        if node.get("id") == node_id and node.get("expandable"):
-            return {
-                "node_id": node_id,
-                "can_zoom": True,
-                "target_graph": node.get("zoom_target"),
-                "target_endpoint": node.get("zoom_endpoint"),
-                "children_preview": node.get("children_preview", {}),
-            }
+    node = document.nodes_by_id.get(node_id)
+    if node is not None and node.get("expandable"):
+        body = document.fragment(f"zoom:{node_id}", lambda data: {
+            "node_id": node_id,
+            "can_zoom": True,
+            "target_graph": node.get("zoom_target"),
+            "target_endpoint": node.get("zoom_endpoint"),
+            "children_preview": node.get("children_preview", {}),
+        })
+        return Response(body, media_type="application/json")
 
     return {
         "node_id": node_id,
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+"""
+Batch-regenerate every visualization listed in build_manifest.json.
+
+Each manifest entry names an input JSON, an output HTML file, a generator
+module in src/ (generate_3d or generate_radial) and optional keyword options
+for its generate_visualization(). An entry is rebuilt only when the hash of
+its input file, generator source and options differs from the last
+successful build (kept in a local state file), its output is missing, or,
+for --split-data outputs, any asset on its recorded asset list is missing.
+Stale entries render in parallel in a process pool.
+
+Usage:
+    python src/build_all.py
+    python src/build_all.py --jobs 4 --force
+    python src/build_all.py --manifest build_manifest.json --state-file data/state/build_state.json
+"""
+
+import argparse
+import contextlib
+import hashlib
+import importlib
+import io
+import json
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent
+DEFAULT_MANIFEST = "build_manifest.json"
+DEFAULT_STATE_FILE = "data/state/build_state.json"
+STATE_VERSION = 1
+GENERATORS = ("generate_3d", "generate_radial")
+
+
+def load_manifest(path: str) -> list[dict]:
+    """Read and validate manifest entries."""
+    with open(path) as f:
+        entries = json.load(f)["visualizations"]
+    outputs = set()
+    for entry in entries:
+        if entry["generator"] not in GENERATORS:
+            raise ValueError(f"{entry['output']}: unknown generator {entry['generator']!r}")
+        if entry["output"] in outputs:
+            raise ValueError(f"{entry['output']}: listed more than once")
+        outputs.add(entry["output"])
+    return entries
+
+
+def file_sha256(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def build_key(entry: dict, generator_hashes: dict[str, str]) -> str:
+    """Hash of everything an output depends on: input, generator version, options."""
+    digest = hashlib.sha256()
+    digest.update(file_sha256(Path(entry["input"])).encode())
+    digest.update(generator_hashes[entry["generator"]].encode())
+    digest.update(json.dumps(entry.get("options", {}), sort_keys=True).encode())
+    return digest.hexdigest()
+
+
+def output_missing(entry: dict) -> bool:
+    """Whether the output HTML, or a split-data asset it references, is gone."""
+    if not os.path.exists(entry["output"]):
+        return True
+    if entry.get("options", {}).get("split_data"):
+        if str(SRC_DIR) not in sys.path:
+            sys.path.insert(0, str(SRC_DIR))
+        from generate_3d import split_assets_missing
+        return split_assets_missing(entry["output"])
+    return False
+
+
+def load_build_state(path: str) -> dict[str, str]:
+    """Output path -> build key of its last successful build."""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        state = json.load(f)
+    if state.get("version") != STATE_VERSION:
+        return {}
+    return state.get("outputs", {})
+
+
+def save_build_state(path: str, outputs: dict[str, str]):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    state = {"version": STATE_VERSION, "updated": datetime.now().isoformat(), "outputs": outputs}
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(state, f, indent=2, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+def render(entry: dict) -> tuple[float, str]:
+    """Run one generator in a worker process; returns (seconds, captured log)."""
+    if str(SRC_DIR) not in sys.path:
+        sys.path.insert(0, str(SRC_DIR))
+    generator = importlib.import_module(entry["generator"])
+    log = io.StringIO()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(log):
+        generator.generate_visualization(entry["input"], entry["output"], **entry.get("options", {}))
+    return time.perf_counter() - start, log.getvalue()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Regenerate all visualizations in the build manifest")
+    parser.add_argument("--manifest", default=DEFAULT_MANIFEST, help="Manifest of input -> output -> generator")
+    parser.add_argument("--state-file", default=DEFAULT_STATE_FILE,
+                        help="Build hashes from the last run, used to skip up-to-date outputs")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1, help="Worker processes")
+    parser.add_argument("--force", action="store_true", help="Rebuild every output")
+    parser.add_argument("--verbose", "-v", action="store_true", help="Print generator output")
+    args = parser.parse_args()
+
+    entries = load_manifest(args.manifest)
+    generator_hashes = {name: file_sha256(SRC_DIR / f"{name}.py") for name in GENERATORS}
+    state = {} if args.force else load_build_state(args.state_file)
+
+    keys = {}
+    stale = []
+    for entry in entries:
+        keys[entry["output"]] = build_key(entry, generator_hashes)
+        if state.get(entry["output"]) != keys[entry["output"]] or output_missing(entry):
+            stale.append(entry)
+
+    wall_start = time.perf_counter()
+    results = {}
+    if stale:
+        with ProcessPoolExecutor(max_workers=max(1, min(args.jobs, len(stale)))) as pool:
+            futures = {pool.submit(render, entry): entry for entry in stale}
+            for future in as_completed(futures):
+                entry = futures[future]
+                try:
+                    seconds, log = future.result()
+                except Exception as e:
+                    results[entry["output"]] = ("failed", None, f"{type(e).__name__}: {e}")
+                    continue
+                results[entry["output"]] = ("built", seconds, log)
+                state[entry["output"]] = keys[entry["output"]]
+        save_build_state(args.state_file, state)
+    wall_time = time.perf_counter() - wall_start
+
+    print(f"{'output':<42} {'generator':<16} {'status':<8} {'time':>8}")
+    for entry in entries:
+        status, seconds, log = results.get(entry["output"], ("skipped", None, ""))
+        timing = f"{seconds:.2f}s" if seconds is not None else "-"
+        print(f"{entry['output']:<42} {entry['generator']:<16} {status:<8} {timing:>8}")
+        if status == "failed" or (args.verbose and log):
+            print("    " + log.strip().replace("\n", "\n    "))
+
+    built = sum(1 for status, _, _ in results.values() if status == "built")
+    failed = sum(1 for status, _, _ in results.values() if status == "failed")
+    render_time = sum(seconds for _, seconds, _ in results.values() if seconds is not None)
+    print(f"\n{built} built, {len(entries) - len(stale)} up to date, {failed} failed "
+          f"in {wall_time:.2f}s wall ({render_time:.2f}s render, {args.jobs} jobs)")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
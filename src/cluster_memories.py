@@ -13,8 +13,11 @@ This creates a hierarchical structure:
 Usage:
     source venv/bin/activate
     python src/cluster_memories.py
+    python src/cluster_memories.py --tenant <tenant_id>   # -> data/tenants/<tenant_id>/
+    python src/cluster_memories.py --fixture data/fixtures/synthetic_100k --output-dir data/synthetic_100k
 """
 
+import argparse
 import os
 import json
 import numpy as np
@@ -25,6 +28,9 @@ import leidenalg
 from collections import defaultdict
 from datetime import datetime
 
+from content_store import write_content_store
+from extract_zeus_data import sanitize_secrets
+
 # Database connection
 DB_CONFIG = {
     'host': 'psql-zeus-memory-dev.postgres.database.azure.com',
@@ -48,9 +54,14 @@ def get_db_connection():
     return psycopg2.connect(**DB_CONFIG)
 
 
-def fetch_memories_with_embeddings(limit=MAX_MEMORIES):
+def tenant_data_dir(tenant_id=None):
+    """Output directory for a tenant's snapshot; the default tenant keeps data/."""
+    return os.path.join("data", "tenants", tenant_id) if tenant_id else "data"
+
+
+def fetch_memories_with_embeddings(limit=MAX_MEMORIES, tenant_id=TENANT_ID):
     """Fetch memories that have embeddings."""
-    print(f"Fetching up to {limit} memories with embeddings...")
+    print(f"Fetching up to {limit} memories with embeddings for tenant {tenant_id}...")
 
     conn = get_db_connection()
     cur = conn.cursor(cursor_factory=RealDictCursor)
@@ -70,7 +81,7 @@ def fetch_memories_with_embeddings(limit=MAX_MEMORIES):
           AND embedding_voyage IS NOT NULL
         ORDER BY created_at DESC
         LIMIT %s
-    """, (TENANT_ID, limit))
+    """, (tenant_id, limit))
 
     memories = cur.fetchall()
     cur.close()
@@ -80,6 +91,25 @@ def fetch_memories_with_embeddings(limit=MAX_MEMORIES):
     return memories
 
 
+def load_fixture_memories(fixture_dir, limit=MAX_MEMORIES):
+    """Read memories from a synthetic fixture (see synthetic_memories.py), newest first like the DB query."""
+    print(f"Loading up to {limit} memories from fixture {fixture_dir}...")
+
+    embeddings = np.load(os.path.join(fixture_dir, "embeddings.npy"), mmap_mode='r')
+    with open(os.path.join(fixture_dir, "memories.jsonl")) as f:
+        rows = [json.loads(line) for line in f]
+    order = sorted(range(len(rows)), key=lambda i: rows[i]['created_at'], reverse=True)[:limit]
+
+    memories = []
+    for i in order:
+        memory = rows[i]
+        memory['embedding_voyage'] = embeddings[i]
+        memories.append(memory)
+
+    print(f"Loaded {len(memories)} memories with embeddings")
+    return memories
+
+
 def parse_embedding(emb):
     """Parse embedding from various formats (list, string, numpy array)."""
     if emb is None:
@@ -337,14 +367,45 @@ def save_clustering_results(memories, l1_assignments, l1_to_l2, labels, output_p
     return results
 
 
+def save_knn_graph(memories, edges, weights, output_path):
+    """Persist the k-NN graph as compact arrays for the metrics stage (Phase 2b)."""
+    print(f"Saving k-NN graph to {output_path}...")
+
+    edge_array = np.array(edges, dtype=np.int32).reshape(-1, 2)
+    np.savez_compressed(
+        output_path,
+        ids=np.array([m['id'] for m in memories]),
+        src=edge_array[:, 0],
+        dst=edge_array[:, 1],
+        weight=np.array(weights, dtype=np.float32),
+    )
+
+    print(f"Saved k-NN graph: {len(memories)} nodes, {len(edges)} edges")
+
+
 def main():
+    parser = argparse.ArgumentParser(description='Cluster Zeus memories into L1 topics and L2 domains')
+    parser.add_argument('--tenant', type=str, default=None,
+                        help=f'Tenant to cluster, written to data/tenants/<tenant>/ '
+                             f'(default: {TENANT_ID} into data/)')
+    parser.add_argument('--limit', type=int, default=MAX_MEMORIES, help='Maximum memories to cluster')
+    parser.add_argument('--fixture', type=str, default=None,
+                        help='Read memories from a synthetic fixture directory instead of the database')
+    parser.add_argument('--output-dir', type=str, default=None,
+                        help='Write results here instead of data/ (or data/tenants/<tenant>/)')
+    args = parser.parse_args()
+    output_dir = args.output_dir or tenant_data_dir(args.tenant)
+
     print("=" * 60)
     print("Zeus Memory Clustering - Phase 1")
     print("=" * 60)
 
 
     # Fetch memories
-    memories = fetch_memories_with_embeddings(limit=MAX_MEMORIES)
+    if args.fixture:
+        memories = load_fixture_memories(args.fixture, limit=args.limit)
+    else:
+        memories = fetch_memories_with_embeddings(limit=args.limit, tenant_id=args.tenant or TENANT_ID)
 
     if len(memories) < 10:
         print("Not enough memories with embeddings to cluster")
@@ -361,6 +422,10 @@ def main():
     valid_memories = [memories[i] for i in valid_indices]
     print(f"Using {len(valid_memories)} memories with valid embeddings")
 
+    # Redact before anything derived from content (labels, previews, the content store)
+    for memory in valid_memories:
+        memory['content'] = sanitize_secrets(memory['content'])
+
     # Run L1 clustering (fine-grained topics)
     l1_assignments, n_l1 = run_leiden_clustering(
         len(valid_memories), edges, weights, resolution=1.0
@@ -373,12 +438,22 @@ def main():
     labels = generate_cluster_labels(valid_memories, l1_assignments)
 
     # Save results
-    output_path = "data/clustering_results.json"
-    os.makedirs("data", exist_ok=True)
+    output_path = os.path.join(output_dir, "clustering_results.json")
+    os.makedirs(output_dir, exist_ok=True)
     results = save_clustering_results(
         valid_memories, l1_assignments, l1_to_l2, labels, output_path
     )
 
+    # Persist the k-NN graph so centrality can be computed offline
+    knn_path = os.path.join(output_dir, "knn_graph.npz")
+    save_knn_graph(valid_memories, edges, weights, knn_path)
+
+    # Full contents for the API, in the same order as results["memories"]
+    store = write_content_store(output_dir, [m['id'] for m in valid_memories],
+                                [m['content'] for m in valid_memories])
+    print(f"Saved content store: {store['raw_bytes'] / 1e6:.1f}MB -> {store['stored_bytes'] / 1e6:.1f}MB "
+          f"in {store['blocks']} blocks")
+
     print("\n" + "=" * 60)
     print("CLUSTERING COMPLETE")
     print("=" * 60)
@@ -386,6 +461,7 @@ def main():
     print(f"L1 clusters (topics): {n_l1}")
     print(f"L2 clusters (domains): {n_l2}")
     print(f"Results saved to: {output_path}")
+    print(f"k-NN graph saved to: {knn_path}")
 
     # Show sample clusters
     print("\nSample L1 clusters:")
@@ -8,9 +8,13 @@ Creates layouts at multiple hierarchy levels for semantic zoom.
 Usage:
     source venv/bin/activate
     python src/compute_layout.py
+    python src/compute_layout.py --tenant <tenant_id>   # data/tenants/<tenant_id>/
+    python src/compute_layout.py --data-dir data/synthetic_100k
 """
 
+import argparse
 import json
+import os
 import numpy as np
 from pathlib import Path
 from fa2_modified import ForceAtlas2
@@ -176,12 +180,20 @@ def save_layout_results(clustering_data, l1_positions, l2_positions, memory_posi
 
 
 def main():
+    parser = argparse.ArgumentParser(description='Compute semantic zoom layouts from clustering results')
+    parser.add_argument('--tenant', type=str, default=None,
+                        help='Read and write data/tenants/<tenant>/ instead of data/')
+    parser.add_argument('--data-dir', type=str, default=None,
+                        help='Read and write this directory (e.g. a cluster_memories.py --output-dir)')
+    args = parser.parse_args()
+    data_dir = args.data_dir or (os.path.join("data", "tenants", args.tenant) if args.tenant else "data")
+
     print("=" * 60)
     print("Zeus Memory Layout Computation - Phase 2")
     print("=" * 60)
 
     # Load clustering results
-    clustering_data = load_clustering_results()
+    clustering_data = load_clustering_results(os.path.join(data_dir, "clustering_results.json"))
 
     # Build and layout L2 clusters (high level)
     G_l2 = build_cluster_graph(clustering_data, level='l2')
@@ -195,7 +207,7 @@ def main():
     memory_positions = compute_memory_positions(clustering_data, l1_positions)
 
     # Save results
-    output_path = "data/layout_results.json"
+    output_path = os.path.join(data_dir, "layout_results.json")
     save_layout_results(
         clustering_data, l1_positions, l2_positions, memory_positions, output_path
     )
@@ -0,0 +1,253 @@
+#!/usr/bin/env python3
+"""
+Zeus Memory Graph Metrics - Phase 2b
+
+Computes centrality metrics offline over the k-NN graph persisted by Phase 1
+(data/knn_graph.npz):
+- Degree and weighted degree
+- PageRank via sparse power iteration
+- Approximate betweenness via sampled Brandes traversals
+
+Results are stored as arrays aligned with the memory id list so the API can
+serve them without any per-request computation.
+
+Usage:
+    source venv/bin/activate
+    python src/compute_metrics.py
+    python src/compute_metrics.py --betweenness-samples 256
+    python src/compute_metrics.py --tenant <tenant_id>   # data/tenants/<tenant_id>/
+"""
+
+import argparse
+import json
+import os
+import time
+import numpy as np
+import scipy.sparse as sp
+from collections import deque
+from datetime import datetime
+
+# PageRank parameters
+PAGERANK_DAMPING = 0.85
+PAGERANK_MAX_ITER = 100
+PAGERANK_TOL = 1e-8
+
+# Number of BFS sources sampled for approximate betweenness
+BETWEENNESS_SAMPLES = 64
+
+METRIC_NAMES = ["degree", "weighted_degree", "pagerank", "betweenness"]
+
+
+def load_knn_graph(filepath="data/knn_graph.npz"):
+    """Load the persisted k-NN graph and build a symmetric CSR adjacency matrix."""
+    print(f"Loading k-NN graph from {filepath}...")
+    data = np.load(filepath)
+    ids = [str(i) for i in data['ids']]
+    n = len(ids)
+
+    src = data['src'].astype(np.int64)
+    dst = data['dst'].astype(np.int64)
+    weight = data['weight'].astype(np.float64)
+
+    # k-NN edges are stored once per pair; mirror them for an undirected graph
+    rows = np.concatenate([src, dst])
+    cols = np.concatenate([dst, src])
+    vals = np.concatenate([weight, weight])
+    adjacency = sp.csr_matrix((vals, (rows, cols)), shape=(n, n))
+    adjacency.sum_duplicates()
+
+    print(f"Loaded graph: {n} nodes, {len(src)} edges")
+    return ids, adjacency
+
+
+def compute_degrees(adjacency):
+    """Compute unweighted and weighted degree from the CSR adjacency."""
+    degree = np.diff(adjacency.indptr).astype(np.int64)
+    weighted_degree = np.asarray(adjacency.sum(axis=1)).ravel()
+    return degree, weighted_degree
+
+
+def compute_pagerank(adjacency, damping=PAGERANK_DAMPING, max_iter=PAGERANK_MAX_ITER, tol=PAGERANK_TOL):
+    """Compute weighted PageRank with sparse power iteration."""
+    print(f"Computing PageRank (damping={damping})...")
+    n = adjacency.shape[0]
+    if n == 0:
+        return np.zeros(0)
+
+    out_weight = np.asarray(adjacency.sum(axis=1)).ravel()
+    dangling = out_weight == 0
+    inv_out = np.zeros(n)
+    inv_out[~dangling] = 1.0 / out_weight[~dangling]
+
+    # Column-stochastic transition matrix: M[j, i] = A[i, j] / out(i)
+    transition = (sp.diags(inv_out) @ adjacency).T.tocsr()
+
+    rank = np.full(n, 1.0 / n)
+    for iteration in range(max_iter):
+        dangling_mass = rank[dangling].sum()
+        new_rank = damping * (transition @ rank + dangling_mass / n) + (1 - damping) / n
+        delta = np.abs(new_rank - rank).sum()
+        rank = new_rank
+        if delta < tol:
+            print(f"  Converged after {iteration + 1} iterations (delta={delta:.2e})")
+            break
+    else:
+        print(f"  Stopped after {max_iter} iterations (delta={delta:.2e})")
+
+    return rank / rank.sum()
+
+
+def compute_approx_betweenness(adjacency, samples=BETWEENNESS_SAMPLES, seed=42):
+    """Approximate normalized betweenness with Brandes BFS from sampled sources.
+
+    Uses unweighted shortest paths; contributions from the sampled sources are
+    rescaled by n / samples to estimate the full sum.
+    """
+    n = adjacency.shape[0]
+    if n < 3:
+        return np.zeros(n)
+
+    samples = min(samples, n)
+    print(f"Computing approximate betweenness ({samples} sampled sources)...")
+
+    indptr = adjacency.indptr
+    indices = adjacency.indices
+    rng = np.random.default_rng(seed)
+    sources = rng.choice(n, size=samples, replace=False)
+
+    betweenness = np.zeros(n)
+    sigma = np.zeros(n)
+    dist = np.full(n, -1, dtype=np.int64)
+    delta = np.zeros(n)
+
+    for count, s in enumerate(sources, start=1):
+        stack = []
+        predecessors = {}
+        sigma[s] = 1.0
+        dist[s] = 0
+        queue = deque([s])
+
+        while queue:
+            v = queue.popleft()
+            stack.append(v)
+            dist_v = dist[v]
+            for w in indices[indptr[v]:indptr[v + 1]]:
+                if dist[w] < 0:
+                    dist[w] = dist_v + 1
+                    queue.append(w)
+                if dist[w] == dist_v + 1:
+                    sigma[w] += sigma[v]
+                    predecessors.setdefault(w, []).append(v)
+
+        while stack:
+            w = stack.pop()
+            coeff = (1.0 + delta[w]) / sigma[w]
+            for v in predecessors.get(w, ()):
+                delta[v] += sigma[v] * coeff
+            if w != s:
+                betweenness[w] += delta[w]
+
+        # Reset only the nodes touched by this traversal
+        visited = np.fromiter(predecessors.keys(), dtype=np.int64, count=len(predecessors))
+        sigma[visited] = 0.0
+        dist[visited] = -1
+        delta[visited] = 0.0
+        sigma[s] = 0.0
+        dist[s] = -1
+        delta[s] = 0.0
+
+        if count % 16 == 0 or count == samples:
+            print(f"  Processed {count}/{samples} sources...")
+
+    # Rescale the sample estimate and normalize for an undirected graph
+    betweenness *= n / samples
+    betweenness /= (n - 1) * (n - 2)
+    return betweenness
+
+
+def save_metrics_results(ids, adjacency, metrics, parameters, output_path):
+    """Save metric arrays aligned with the memory id list."""
+    print(f"Saving metrics to {output_path}...")
+
+    results = {
+        "metadata": {
+            "generated_at": datetime.now().isoformat(),
+            "total_nodes": len(ids),
+            "total_edges": int(adjacency.nnz // 2),
+            "parameters": parameters,
+        },
+        "ids": ids,
+        "metrics": {
+            "degree": [int(v) for v in metrics["degree"]],
+            "weighted_degree": [round(float(v), 4) for v in metrics["weighted_degree"]],
+            "pagerank": [float(f"{v:.6g}") for v in metrics["pagerank"]],
+            "betweenness": [float(f"{v:.6g}") for v in metrics["betweenness"]],
+        },
+    }
+
+    # Compact separators - these arrays are one entry per memory
+    with open(output_path, 'w') as f:
+        json.dump(results, f, separators=(',', ':'))
+
+    print(f"Saved {len(METRIC_NAMES)} metrics for {len(ids)} nodes")
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compute centrality metrics over the k-NN graph')
+    parser.add_argument('--tenant', type=str, default=None,
+                        help='Read and write data/tenants/<tenant>/ instead of data/')
+    parser.add_argument('--input', type=str, default=None,
+                        help='Persisted k-NN graph from cluster_memories.py (default: <data dir>/knn_graph.npz)')
+    parser.add_argument('--output', type=str, default=None,
+                        help='Output metrics file (default: <data dir>/metrics_results.json)')
+    parser.add_argument('--betweenness-samples', type=int, default=BETWEENNESS_SAMPLES,
+                        help='Number of sampled BFS sources for approximate betweenness')
+    parser.add_argument('--damping', type=float, default=PAGERANK_DAMPING,
+                        help='PageRank damping factor')
+    args = parser.parse_args()
+    data_dir = os.path.join('data', 'tenants', args.tenant) if args.tenant else 'data'
+    args.input = args.input or os.path.join(data_dir, 'knn_graph.npz')
+    args.output = args.output or os.path.join(data_dir, 'metrics_results.json')
+
+    print("=" * 60)
+    print("Zeus Memory Graph Metrics - Phase 2b")
+    print("=" * 60)
+
+    ids, adjacency = load_knn_graph(args.input)
+
+    timings = {}
+    start = time.perf_counter()
+    degree, weighted_degree = compute_degrees(adjacency)
+    timings["degree"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    pagerank = compute_pagerank(adjacency, damping=args.damping)
+    timings["pagerank"] = time.perf_counter() - start
+
+    start = time.perf_counter()
+    betweenness = compute_approx_betweenness(adjacency, samples=args.betweenness_samples)
+    timings["betweenness"] = time.perf_counter() - start
+
+    metrics = {
+        "degree": degree,
+        "weighted_degree": weighted_degree,
+        "pagerank": pagerank,
+        "betweenness": betweenness,
+    }
+    parameters = {
+        "pagerank_damping": args.damping,
+        "betweenness_samples": min(args.betweenness_samples, len(ids)),
+    }
+    save_metrics_results(ids, adjacency, metrics, parameters, args.output)
+
+    print("\n" + "=" * 60)
+    print("METRICS COMPUTATION COMPLETE")
+    print("=" * 60)
+    for name, elapsed in timings.items():
+        print(f"{name}: {elapsed:.2f}s")
+    print(f"Results saved to: {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,175 @@
+#!/usr/bin/env python3
+"""
+Block-compressed store of full memory contents.
+
+cluster_memories.py writes one next to clustering_results.json, and the API
+serves full texts from it for /api/memory without a database round trip.
+
+Two files in the snapshot directory:
+- content_store.bin: zstd frames, each one ~64 KB block of UTF-8 texts laid
+  end to end, all compressed with a dictionary trained on the texts
+- content_store.json: the block table, the dictionary, and a
+  (block, offset, length) entry per memory in the order of
+  clustering_results.json's memories, plus a hash of that id order so a
+  store is never paired with a different clustering file
+
+Readers keep a small LRU of decompressed blocks, so neighbouring lookups
+(a cluster, a path) mostly decompress nothing.
+
+Requires the zstandard package (imported when a store is written or opened).
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+from array import array
+from collections import OrderedDict
+
+CONTENT_STORE_BIN = "content_store.bin"
+CONTENT_STORE_INDEX = "content_store.json"
+FORMAT_VERSION = 1
+
+BLOCK_SIZE = 64 * 1024  # Uncompressed bytes per block (texts never span blocks)
+DICT_SIZE = 112 * 1024  # zstd's default dictionary size
+DICT_SAMPLES = 20000  # Texts sampled (evenly) for dictionary training
+COMPRESSION_LEVEL = 9
+DEFAULT_CACHE_BLOCKS = 256  # Decompressed blocks kept per store (~16 MB)
+
+
+def ids_digest(ids) -> str:
+    """Hash of the memory id order the store's entries follow."""
+    digest = hashlib.sha256()
+    for memory_id in ids:
+        digest.update(memory_id.encode("utf-8"))
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+def train_dictionary(texts: list[bytes]):
+    """zstd dictionary from an even sample of texts, or None if there is too little to train on."""
+    import zstandard as zstd
+
+    step = max(1, len(texts) // DICT_SAMPLES)
+    samples = [text for text in texts[::step] if text]
+    try:
+        return zstd.train_dictionary(DICT_SIZE, samples)
+    except zstd.ZstdError:
+        return None
+
+
+def write_content_store(directory: str, ids: list[str], contents: list[str],
+                        block_size: int = BLOCK_SIZE, level: int = COMPRESSION_LEVEL) -> dict:
+    """Write contents (aligned with ids) as a store in directory; returns size stats."""
+    import zstandard as zstd
+
+    texts = [(content or "").encode("utf-8") for content in contents]
+    dictionary = train_dictionary(texts)
+    compressor = zstd.ZstdCompressor(level=level, dict_data=dictionary)
+
+    entries = array("I")  # block, offset, length per memory
+    offsets = array("Q", [0])  # frame start per block, plus the end of the file
+    bin_path = os.path.join(directory, CONTENT_STORE_BIN)
+    with open(f"{bin_path}.tmp", "wb") as f:
+        block = bytearray()
+        for text in texts:
+            entries.extend((len(offsets) - 1, len(block), len(text)))
+            block += text
+            if len(block) >= block_size:
+                offsets.append(offsets[-1] + f.write(compressor.compress(bytes(block))))
+                block = bytearray()
+        if block:
+            offsets.append(offsets[-1] + f.write(compressor.compress(bytes(block))))
+
+    index = {
+        "format": FORMAT_VERSION,
+        "count": len(ids),
+        "ids_sha256": ids_digest(ids),
+        "block_size": block_size,
+        "dictionary": base64.b64encode(dictionary.as_bytes()).decode() if dictionary else None,
+        "offsets": base64.b64encode(offsets.tobytes()).decode(),
+        "entries": base64.b64encode(entries.tobytes()).decode(),
+    }
+    index_path = os.path.join(directory, CONTENT_STORE_INDEX)
+    with open(f"{index_path}.tmp", "w") as f:
+        json.dump(index, f)
+    # Blocks first: the index is what readers (and the API's watcher) look for
+    os.replace(f"{bin_path}.tmp", bin_path)
+    os.replace(f"{index_path}.tmp", index_path)
+
+    return {
+        "memories": len(ids),
+        "blocks": len(offsets) - 1,
+        "raw_bytes": sum(map(len, texts)),
+        "stored_bytes": offsets[-1],
+        "dictionary_bytes": len(dictionary.as_bytes()) if dictionary else 0,
+    }
+
+
+class ContentStore:
+    """Full texts by memory position, read block by block through an LRU."""
+
+    def __init__(self, directory: str, index: dict = None, cache_blocks: int = DEFAULT_CACHE_BLOCKS):
+        import zstandard as zstd
+
+        if index is None:
+            with open(os.path.join(directory, CONTENT_STORE_INDEX)) as f:
+                index = json.load(f)
+        if index.get("format") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported content store format {index.get('format')!r}")
+        self.count = index["count"]
+        self.ids_sha256 = index["ids_sha256"]
+        self._offsets = array("Q")
+        self._offsets.frombytes(base64.b64decode(index["offsets"]))
+        self._entries = array("I")
+        self._entries.frombytes(base64.b64decode(index["entries"]))
+        if len(self._entries) != 3 * self.count:
+            raise ValueError("Content store index is truncated")
+
+        dictionary = index.get("dictionary")
+        self._decompressor = zstd.ZstdDecompressor(
+            dict_data=zstd.ZstdCompressionDict(base64.b64decode(dictionary)) if dictionary else None
+        )
+        self._fd = os.open(os.path.join(directory, CONTENT_STORE_BIN), os.O_RDONLY)
+        self.cache_blocks = cache_blocks
+        self._blocks = OrderedDict()  # block number -> decompressed bytes, oldest first
+        # Decompressors aren't thread-safe; blocks decompress in well under a millisecond
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def __del__(self):
+        fd = getattr(self, "_fd", None)
+        if fd is not None:
+            os.close(fd)
+
+    def _block(self, number: int) -> bytes:
+        with self._lock:
+            block = self._blocks.get(number)
+            if block is not None:
+                self.hits += 1
+                self._blocks.move_to_end(number)
+                return block
+            self.misses += 1
+            start, end = self._offsets[number], self._offsets[number + 1]
+            block = self._decompressor.decompress(os.pread(self._fd, end - start, start))
+            self._blocks[number] = block
+            if len(self._blocks) > self.cache_blocks:
+                self._blocks.popitem(last=False)
+            return block
+
+    def get(self, position: int) -> str:
+        """Text of the memory at this position in clustering_results.json's memories."""
+        block, offset, length = self._entries[3 * position:3 * position + 3]
+        return self._block(block)[offset:offset + length].decode("utf-8")
+
+    def stats(self) -> dict:
+        return {
+            "memories": self.count,
+            "blocks": len(self._offsets) - 1,
+            "stored_mb": round(self._offsets[-1] / 1e6, 1),
+            "cached_blocks": len(self._blocks),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
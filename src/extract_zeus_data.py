@@ -2,8 +2,11 @@
 """Extract Zeus Memory knowledge for visualization."""
 
 import json
+import os
 import re
+import bisect
 import argparse
+import numpy as np
 import psycopg2
 from datetime import datetime, timedelta
 from collections import defaultdict
@@ -20,6 +23,25 @@ conn_params = {
 
 TENANT_ID = 'b513bc6e-ad51-4a11-bea3-e3b1a84d7b55'
 
+# Similarity edge extraction (see generate_similarity_edges)
+SIMILARITY_MODES = ("pairwise", "lateral", "local")
+DEFAULT_SIMILARITY_MODE = "local"
+SIMILARITY_TOP_K = 10  # Nearest neighbours considered per node
+PAIRWISE_MAX_EDGES = 200  # Default cap for pairwise mode (its SQL needs a LIMIT)
+LATERAL_OVERFETCH = 4  # Lateral mode searches the whole tenant, so fetch extra candidates
+
+# Extraction scale (see extract_nodes)
+DEFAULT_MAX_NODES = 500  # Historical 200 decisions + 300 memories
+DECISION_SHARE = 0.4  # Fraction of the node budget given to decisions
+KEYSET_PAGE_SIZE = 1000  # Rows per keyset page
+LEARNING_LOOP_LINKS = 3  # Nearest-in-time partners per node for related/informs edges
+
+# Incremental extraction state
+STATE_DIR = 'data/state'  # <output stem>.state.json and <output stem>.delta.jsonl per output
+STATE_VERSION = 1
+# Edge types rebuilt per group when new nodes join that group
+REGROUPED_EDGE_TYPES = ("same_category", "same_agent", "temporal_context")
+
 # Team member mapping (name variations -> canonical ID)
 TEAM_MEMBERS = {
     # JK variations
@@ -44,6 +66,8 @@ TEAM_MEMBERS = {
     'cce': 'system',
     'cce-system': 'system',
 }
+# Aliases searched for in content, in TEAM_MEMBERS order (first match wins)
+CONTENT_ALIASES = [(name, contrib_id) for name, contrib_id in TEAM_MEMBERS.items() if contrib_id != 'system']
 
 # Contributor node definitions with Slack headshot images
 CONTRIBUTORS = {
@@ -285,25 +309,35 @@ def resolve_contributor(metadata, source, content=""):
 
     # Check content for name mentions
     content_lower = content.lower() if content else ""
-    for name, contrib_id in TEAM_MEMBERS.items():
-        if name in content_lower and contrib_id != 'system':
+    for name, contrib_id in CONTENT_ALIASES:
+        if name in content_lower:
             return contrib_id
 
     return 'system'  # Default to system
 
-# Patterns that might contain secrets
+# Patterns that might contain secrets, each with a literal every match contains.
+# In ASCII text the literal is checked against the lowercased text first so the
+# (comparatively slow) case-insensitive regex only runs on strings that could
+# match. re.IGNORECASE also matches some non-ASCII letters to ASCII ones
+# ('ı' to 'i', the Kelvin sign to 'k') where lower() does not, so other text
+# runs every pattern.
 SECRET_PATTERNS = [
-    r'ntn_[a-zA-Z0-9]{40,}',  # Notion tokens
-    r'sk-[a-zA-Z0-9]{32,}',   # OpenAI keys
-    r'xoxb-[a-zA-Z0-9\-]+',   # Slack bot tokens
-    r'xoxp-[a-zA-Z0-9\-]+',   # Slack user tokens
-    r'ghp_[a-zA-Z0-9]{36}',   # GitHub tokens
-    r'gho_[a-zA-Z0-9]{36}',   # GitHub OAuth tokens
-    r'zm_[a-zA-Z0-9_]{30,}',  # Zeus Memory API keys
-    r'AKIA[A-Z0-9]{16}',      # AWS access keys
-    r'password["\']?\s*[:=]\s*["\'][^"\']+["\']',  # Password patterns
-    r'api[_-]?key["\']?\s*[:=]\s*["\'][^"\']+["\']',  # API key patterns
+    ('ntn_', r'ntn_[a-zA-Z0-9]{40,}'),  # Notion tokens
+    ('sk-', r'sk-[a-zA-Z0-9]{32,}'),    # OpenAI keys
+    ('xoxb-', r'xoxb-[a-zA-Z0-9\-]+'),  # Slack bot tokens
+    ('xoxp-', r'xoxp-[a-zA-Z0-9\-]+'),  # Slack user tokens
+    ('ghp_', r'ghp_[a-zA-Z0-9]{36}'),   # GitHub tokens
+    ('gho_', r'gho_[a-zA-Z0-9]{36}'),   # GitHub OAuth tokens
+    ('zm_', r'zm_[a-zA-Z0-9_]{30,}'),   # Zeus Memory API keys
+    ('akia', r'AKIA[A-Z0-9]{16}'),      # AWS access keys
+    ('password', r'password["\']?\s*[:=]\s*["\'][^"\']+["\']'),  # Password patterns
+    ('key', r'api[_-]?key["\']?\s*[:=]\s*["\'][^"\']+["\']'),    # API key patterns
 ]
+SECRET_REGEXES = [(literal, re.compile(pattern, re.IGNORECASE)) for literal, pattern in SECRET_PATTERNS]
+
+# Cleaned content per node id (bounded; cleared when full)
+CLEAN_CACHE_MAX = 200000
+_clean_cache = {}
 
 # Safe categories (non-confidential)
 SAFE_CATEGORIES = [
@@ -320,59 +354,175 @@ def sanitize_secrets(text):
     """Remove potential secrets from text."""
     if not text:
         return text
-    for pattern in SECRET_PATTERNS:
-        text = re.sub(pattern, '[REDACTED]', text, flags=re.IGNORECASE)
+    if not text.isascii():
+        for _, regex in SECRET_REGEXES:
+            text = regex.sub('[REDACTED]', text)
+        return text
+    lowered = text.lower()
+    for literal, regex in SECRET_REGEXES:
+        if literal in lowered:
+            text = regex.sub('[REDACTED]', text)
     return text
 
 
+def truncate_text(cleaned, max_len=None):
+    """Truncate already-cleaned text for labels."""
+    if max_len and len(cleaned) > max_len:
+        return cleaned[:max_len-3] + "..."
+    return cleaned
+
+
 def clean_text(text, max_len=None):
     """Clean text for display. If max_len is None, returns full text."""
     if not text:
         return "Untitled"
     text = sanitize_secrets(text)
-    cleaned = ' '.join(text.split())
-    if max_len and len(cleaned) > max_len:
-        cleaned = cleaned[:max_len-3] + "..."
+    return truncate_text(' '.join(text.split()), max_len)
+
+
+def clean_text_cached(node_id, text):
+    """clean_text(text) memoized per node id, so each content string is redacted once."""
+    cleaned = _clean_cache.get(node_id)
+    if cleaned is None:
+        if len(_clean_cache) >= CLEAN_CACHE_MAX:
+            _clean_cache.clear()
+        cleaned = _clean_cache[node_id] = clean_text(text)
     return cleaned
 
 
-def extract_nodes(cur, hours_filter=0):
+def fetch_keyset(cur, query, params, id_column, id_index, created_index, limit=None, page_size=KEYSET_PAGE_SIZE):
+    """Fetch rows newest-first with keyset pagination over (created_at, id).
+
+    Each page seeks past the last (created_at, id) seen instead of using OFFSET,
+    so every page is an index range scan regardless of depth. Rows without a
+    created_at come first, as they do under ORDER BY created_at DESC, and are
+    paged by id alone in a pass of their own.
+
+    Args:
+        cur: Database cursor
+        query: SELECT ... FROM ... WHERE ... (no ORDER BY/LIMIT) with {keyset} placeholder
+        params: Parameters for the query's own placeholders
+        id_column: Unique tie-breaker column paired with created_at
+        id_index: Position of the id column in each row
+        created_index: Position of created_at in each row
+        limit: Maximum rows to return (None = all)
+        page_size: Rows fetched per round trip
+    """
+    rows = []
+    for dated in (False, True):
+        order = f"created_at DESC, {id_column} DESC" if dated else f"{id_column} DESC"
+        last_key = None
+        while limit is None or len(rows) < limit:
+            batch = page_size if limit is None else min(page_size, limit - len(rows))
+            keyset = "AND created_at IS NOT NULL" if dated else "AND created_at IS NULL"
+            page_params = list(params)
+            if last_key is not None:
+                if dated:
+                    keyset += f" AND (created_at, {id_column}) < (%s, %s)"
+                    page_params.extend(last_key)
+                else:
+                    keyset += f" AND {id_column} < %s"
+                    page_params.append(last_key[1])
+
+            cur.execute(
+                query.format(keyset=keyset) + f"\n        ORDER BY {order}\n        LIMIT %s",
+                page_params + [batch]
+            )
+            page = cur.fetchall()
+            rows.extend(page)
+            if len(page) < batch:
+                break
+            last_key = (page[-1][created_index], page[-1][id_index])
+    return rows
+
+
+def since_clause(since):
+    """SQL fragment and params for an inclusive created_at watermark."""
+    if since is None:
+        return "", ()
+    return "AND created_at >= %s", (since,)
+
+
+def fetch_decisions(cur, time_clause="", limit=None, since=None):
+    """Fetch decision rows newest-first (optionally created at or after since)."""
+    watermark_clause, watermark_params = since_clause(since)
+    return fetch_keyset(cur, f"""
+        SELECT decision_id, action, reasoning, confidence, agent_id, created_at
+        FROM zeus_core.decisions
+        WHERE tenant_id = %s
+        {time_clause}
+        {watermark_clause}
+        {{keyset}}""", (TENANT_ID,) + watermark_params, "decision_id", 0, 5, limit=limit)
+
+
+def fetch_memories(cur, time_clause="", limit=None, since=None):
+    """Fetch CCE memory rows (safe categories only) newest-first (optionally since a watermark)."""
+    watermark_clause, watermark_params = since_clause(since)
+    return fetch_keyset(cur, f"""
+        SELECT memory_id, content, source, metadata, created_at
+        FROM zeus_core.memories
+        WHERE tenant_id = %s
+          AND source IN ('cce_decision_log', 'cce_research', 'cce_failed_approach',
+                        'cce_success_log', 'cce_system', 'cce', 'cce-learning',
+                        'cce-prototype', 'cce_learn', 'cce-session', 'slack')
+          AND (
+            metadata->>'category' IS NULL
+            OR metadata->>'category' IN %s
+          )
+        {time_clause}
+        {watermark_clause}
+        {{keyset}}""", (TENANT_ID, tuple(SAFE_CATEGORIES)) + watermark_params, "memory_id", 0, 4, limit=limit)
+
+
+def split_node_budget(max_nodes):
+    """Split --max-nodes between decisions and memories (0 = unlimited)."""
+    if not max_nodes:
+        return None, None
+    decision_limit = int(max_nodes * DECISION_SHARE)
+    return decision_limit, max_nodes - decision_limit
+
+
+def extract_nodes(cur, hours_filter=0, max_nodes=DEFAULT_MAX_NODES):
     """Extract all nodes (decisions + memories).
 
     Args:
         cur: Database cursor
         hours_filter: Only include data from last N hours (0 = no filter)
+        max_nodes: Node budget split between decisions and memories (0 = no limit)
     """
-    nodes = []
-    node_ids = set()
-    node_metadata = {}  # Store metadata for edge generation
-
     # Build time filter clause
     time_clause = ""
     if hours_filter > 0:
         time_clause = f"AND created_at > NOW() - INTERVAL '{hours_filter} hours'"
         print(f"Filtering to last {hours_filter} hours")
 
-    # 1. Get decisions
-    cur.execute(f"""
-        SELECT decision_id, action, reasoning, confidence, agent_id, created_at
-        FROM zeus_core.decisions
-        WHERE tenant_id = %s
-        {time_clause}
-        ORDER BY created_at DESC
-        LIMIT 200
-    """, (TENANT_ID,))
+    decision_limit, memory_limit = split_node_budget(max_nodes)
 
-    decisions = cur.fetchall()
+    # 1. Get decisions
+    decisions = fetch_decisions(cur, time_clause, limit=decision_limit)
     print(f"Found {len(decisions)} decisions")
 
+    # 2. Get CCE memories
+    memories = fetch_memories(cur, time_clause, limit=memory_limit)
+    print(f"Found {len(memories)} CCE memories")
+
+    return build_nodes(decisions, memories)
+
+
+def build_nodes(decisions, memories, include_hub=True):
+    """Build visualization nodes and edge-generation metadata from fetched rows."""
+    nodes = []
+    node_ids = set()
+    node_metadata = {}  # Store metadata for edge generation
+
     for row in decisions:
         decision_id, action, reasoning, confidence, agent_id, created_at = row
         node_id = str(decision_id)
         node_ids.add(node_id)
 
         # Build full content with action, reasoning, and confidence
-        full_content = clean_text(action)
+        action_text = clean_text_cached(node_id, action)
+        full_content = action_text
         if reasoning:
             full_content += f"\n\nReasoning: {clean_text(reasoning)}"
         if confidence:
@@ -383,7 +533,7 @@ def extract_nodes(cur, hours_filter=0):
 
         nodes.append({
             "id": node_id,
-            "label": clean_text(action, 50),
+            "label": truncate_text(action_text, 50),
             "title": full_content,  # Full content for modal display
             "tier": 4,  # Decide tier
             "group": "decision",
@@ -401,26 +551,6 @@ def extract_nodes(cur, hours_filter=0):
             "contributor": contributor,
         }
 
-    # 2. Get CCE memories
-    cur.execute(f"""
-        SELECT memory_id, content, source, metadata, created_at
-        FROM zeus_core.memories
-        WHERE tenant_id = %s
-          AND source IN ('cce_decision_log', 'cce_research', 'cce_failed_approach',
-                        'cce_success_log', 'cce_system', 'cce', 'cce-learning',
-                        'cce-prototype', 'cce_learn', 'cce-session', 'slack')
-          AND (
-            metadata->>'category' IS NULL
-            OR metadata->>'category' IN %s
-          )
-        {time_clause}
-        ORDER BY created_at DESC
-        LIMIT 300
-    """, (TENANT_ID, tuple(SAFE_CATEGORIES)))
-
-    memories = cur.fetchall()
-    print(f"Found {len(memories)} CCE memories")
-
     # Knowledge Path tiers for cylinder layout:
     # Tier 0: Ingest - Data Sources (Ingestion) + Web Domains
     # Tier 1: Curate - Zeus Hub + Management Team
@@ -474,10 +604,11 @@ def extract_nodes(cur, hours_filter=0):
         project = meta.get('project', '')
         area = classify_project_area(project)
 
+        content_text = clean_text_cached(node_id, content)
         nodes.append({
             "id": node_id,
-            "label": clean_text(content, 50),
-            "title": clean_text(content),  # Full content for modal display
+            "label": truncate_text(content_text, 50),
+            "title": content_text,  # Full content for modal display
             "tier": tier_map.get(source, 3),
             "group": source if source in GROUPS else "cce",
             "size": size_map.get(source, 15),
@@ -499,6 +630,9 @@ def extract_nodes(cur, hours_filter=0):
             "area": area,
         }
 
+    if not include_hub:
+        return nodes, node_ids, node_metadata
+
     # 3. Create hub node
     hub_id = "zeus-memory-hub"
     nodes.insert(0, {
@@ -522,10 +656,44 @@ def extract_nodes(cur, hours_filter=0):
     return nodes, node_ids, node_metadata
 
 
-def generate_metadata_edges(nodes, node_ids, node_metadata):
-    """Generate edges based on metadata relationships."""
+def build_time_index(members, node_metadata):
+    """Sort node ids by created_at timestamp for nearest-in-time lookups."""
+    dated = []
+    for node_id in members:
+        created = node_metadata[node_id].get('created_at')
+        if created:
+            dated.append((created.timestamp(), node_id))
+    dated.sort()
+    return [t for t, _ in dated], [n for _, n in dated]
+
+
+def nearest_in_time(time_index, timestamp, k):
+    """Return up to k node ids closest to timestamp (bisect + two-pointer walk)."""
+    times, ids = time_index
+    hi = bisect.bisect_left(times, timestamp)
+    lo = hi - 1
+    result = []
+    while len(result) < k and (lo >= 0 or hi < len(times)):
+        if hi >= len(times) or (lo >= 0 and timestamp - times[lo] <= times[hi] - timestamp):
+            result.append(ids[lo])
+            lo -= 1
+        else:
+            result.append(ids[hi])
+            hi += 1
+    return result
+
+
+def generate_metadata_edges(nodes, node_ids, node_metadata, edge_set=None, changed=None):
+    """Generate edges based on metadata relationships.
+
+    Args:
+        edge_set: Existing edge keys to dedupe against (new set if None)
+        changed: Optional set of new node ids - only references touching those
+            nodes, groups containing them and their nearest-in-time links are generated
+    """
     edges = []
-    edge_set = set()  # Track unique edges
+    if edge_set is None:
+        edge_set = set()  # Track unique edges
 
     def add_edge(source, target, edge_type):
         """Add edge if not already exists."""
@@ -541,6 +709,8 @@ def generate_metadata_edges(nodes, node_ids, node_metadata):
     # 1. Explicit references from metadata
     for node_id, meta in node_metadata.items():
         related = meta.get('related_memory')
+        if changed is not None and node_id not in changed and related not in changed:
+            continue
         if related and related in node_ids:
             add_edge(node_id, related, "references")
 
@@ -551,6 +721,9 @@ def generate_metadata_edges(nodes, node_ids, node_metadata):
         if cat:
             category_groups[cat].append(node_id)
 
+    if changed is not None:
+        category_groups = {k: v for k, v in category_groups.items() if not changed.isdisjoint(v)}
+
     for category, members in category_groups.items():
         if len(members) > 1 and len(members) <= 20:  # Avoid huge clusters
             for i, m1 in enumerate(members):
@@ -564,6 +737,9 @@ def generate_metadata_edges(nodes, node_ids, node_metadata):
         if agent:
             agent_groups[agent].append(node_id)
 
+    if changed is not None:
+        agent_groups = {k: v for k, v in agent_groups.items() if not changed.isdisjoint(v)}
+
     for agent, members in agent_groups.items():
         if len(members) > 1 and len(members) <= 30:
             for i, m1 in enumerate(members):
@@ -577,26 +753,66 @@ def generate_metadata_edges(nodes, node_ids, node_metadata):
         if src:
             source_groups[src].append(node_id)
 
+    def link_nearest_in_time(from_members, to_members, edge_type, by_project=False):
+        """Link each node to the closest-in-time targets (optionally same project first)."""
+        if not from_members or not to_members:
+            return
+        if changed is not None:
+            # New targets pull in their nearest existing sources; only new sources link forwards
+            new_targets = [n for n in to_members if n in changed]
+            if new_targets:
+                source_index = build_time_index(from_members, node_metadata)
+                for target in new_targets:
+                    created = node_metadata[target].get('created_at')
+                    if created:
+                        for node_id in nearest_in_time(source_index, created.timestamp(), LEARNING_LOOP_LINKS):
+                            add_edge(node_id, target, edge_type)
+            from_members = [n for n in from_members if n in changed]
+            if not from_members:
+                return
+        global_index = build_time_index(to_members, node_metadata)
+        project_indexes = {}
+        if by_project:
+            project_members = defaultdict(list)
+            for target in to_members:
+                project = node_metadata[target].get('project')
+                if project:
+                    project_members[project].append(target)
+            project_indexes = {p: build_time_index(m, node_metadata) for p, m in project_members.items()}
+
+        for node_id in from_members:
+            meta = node_metadata[node_id]
+            created = meta.get('created_at')
+            if not created:
+                continue
+            index = project_indexes.get(meta.get('project'), global_index)
+            for target in nearest_in_time(index, created.timestamp(), LEARNING_LOOP_LINKS):
+                add_edge(node_id, target, edge_type)
+
     # Connect failed approaches to successes (learning loop)
-    failed = source_groups.get('cce_failed_approach', [])
-    success = source_groups.get('cce_success_log', [])
-    for f in failed[:15]:
-        for s in success[:15]:
-            add_edge(f, s, "related")
+    link_nearest_in_time(
+        source_groups.get('cce_failed_approach', []),
+        source_groups.get('cce_success_log', []),
+        "related", by_project=True
+    )
 
     # Connect research to decisions
-    research = source_groups.get('cce_research', [])
-    decisions = source_groups.get('decision', [])
-    for r in research[:20]:
-        for d in decisions[:10]:
-            add_edge(r, d, "informs")
+    link_nearest_in_time(
+        source_groups.get('cce_research', []),
+        source_groups.get('decision', []),
+        "informs"
+    )
 
     print(f"Generated {len(edges)} metadata-based edges")
     return edges, edge_set
 
 
-def generate_temporal_edges(node_ids, node_metadata, edge_set):
-    """Generate edges based on temporal proximity."""
+def generate_temporal_edges(node_ids, node_metadata, edge_set, changed=None):
+    """Generate edges based on temporal proximity.
+
+    When changed is given, only (day, source) groups containing one of those
+    node ids are linked.
+    """
     edges = []
 
     def add_edge(source, target, edge_type):
@@ -626,20 +842,173 @@ def generate_temporal_edges(node_ids, node_metadata, edge_set):
             source_day[source].append((node_id, created))
 
         for source, items in source_day.items():
+            if changed is not None and not any(node_id in changed for node_id, _ in items):
+                continue
             if len(items) > 1:
                 # Sort by time
                 items.sort(key=lambda x: x[1])
                 # Connect sequential items (max 2 connections per node)
-                for i in range(len(items) - 1):
-                    if i < 10:  # Limit edges
-                        add_edge(items[i][0], items[i+1][0], "temporal_context")
+                for i in range(min(len(items) - 1, 10)):  # Limit edges
+                    add_edge(items[i][0], items[i+1][0], "temporal_context")
 
     print(f"Generated {len(edges)} temporal edges")
     return edges
 
 
-def generate_similarity_edges(cur, node_ids, node_metadata, edge_set, similarity_threshold=0.85, max_edges=200):
-    """Generate edges based on vector similarity using pgvector."""
+def parse_embedding(emb):
+    """Parse a pgvector value (text like "[0.1,0.2,...]" or a list) into a float32 array."""
+    if emb is None:
+        return None
+    if isinstance(emb, str):
+        return np.fromstring(emb.strip('[]'), sep=',', dtype=np.float32)
+    return np.asarray(emb, dtype=np.float32)
+
+
+def topk_similar_pairs(ids, embeddings, k=SIMILARITY_TOP_K, threshold=0.85, batch_size=2048):
+    """Find each node's top-k cosine neighbours with a blocked NumPy kernel.
+
+    Args:
+        ids: Node ids aligned with the embedding rows
+        embeddings: (n, d) float32 matrix
+        k: Neighbours kept per node before thresholding
+        threshold: Minimum cosine similarity for a pair
+        batch_size: Rows per matrix-multiply block (bounds memory to batch_size * n)
+
+    Returns:
+        List of (source_id, target_id, similarity) for unique pairs, highest first
+    """
+    n = len(ids)
+    if n < 2:
+        return []
+    k = min(k, n - 1)
+
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    norms[norms == 0] = 1
+    normalized = (embeddings / norms).astype(np.float32, copy=False)
+
+    pair_rows, pair_cols, pair_sims = [], [], []
+    for start in range(0, n, batch_size):
+        end = min(start + batch_size, n)
+        sims = normalized[start:end] @ normalized.T
+        rows = np.arange(end - start)
+        sims[rows, rows + start] = -np.inf  # Exclude self
+
+        top = np.argpartition(sims, -k, axis=1)[:, -k:]
+        top_sims = np.take_along_axis(sims, top, axis=1)
+        keep = top_sims > threshold
+
+        pair_rows.append(np.repeat(rows + start, k)[keep.ravel()])
+        pair_cols.append(top[keep])
+        pair_sims.append(top_sims[keep])
+
+    rows = np.concatenate(pair_rows)
+    cols = np.concatenate(pair_cols)
+    sims = np.concatenate(pair_sims)
+    if len(rows) == 0:
+        return []
+
+    # Each pair may be found from both ends - keep one copy
+    lo = np.minimum(rows, cols).astype(np.int64)
+    hi = np.maximum(rows, cols).astype(np.int64)
+    _, first = np.unique(lo * n + hi, return_index=True)
+    order = first[np.argsort(-sims[first], kind='stable')]
+
+    return [(ids[lo[i]], ids[hi[i]], float(sims[i])) for i in order]
+
+
+def fetch_similar_pairs_pairwise(cur, uuid_list, similarity_threshold, max_edges):
+    """Original all-pairs self-join, computed entirely in Postgres (O(N^2))."""
+    cur.execute("""
+        WITH node_embeddings AS (
+            SELECT memory_id, embedding_voyage
+            FROM zeus_core.memories
+            WHERE memory_id = ANY(%s::uuid[])
+              AND embedding_voyage IS NOT NULL
+        )
+        SELECT
+            m1.memory_id::text as source,
+            m2.memory_id::text as target,
+            1 - (m1.embedding_voyage <=> m2.embedding_voyage) as similarity
+        FROM node_embeddings m1
+        JOIN node_embeddings m2 ON m1.memory_id < m2.memory_id
+        WHERE 1 - (m1.embedding_voyage <=> m2.embedding_voyage) > %s
+        ORDER BY similarity DESC
+        LIMIT %s
+    """, (uuid_list, similarity_threshold, max_edges))
+    return cur.fetchall()
+
+
+def fetch_similar_pairs_lateral(cur, uuid_list, similarity_threshold, k):
+    """Per-node pgvector nearest-neighbour lookups in one round trip.
+
+    Each node runs an index-ordered `ORDER BY embedding <=> ... LIMIT k` over
+    the tenant, so the ANN index does the work instead of an N^2 join.
+    Neighbours outside the extracted node set are dropped by the caller.
+    """
+    cur.execute("""
+        SELECT
+            q.memory_id::text as source,
+            nn.memory_id::text as target,
+            1 - nn.distance as similarity
+        FROM zeus_core.memories q
+        CROSS JOIN LATERAL (
+            SELECT m.memory_id, m.embedding_voyage <=> q.embedding_voyage as distance
+            FROM zeus_core.memories m
+            WHERE m.tenant_id = %s
+              AND m.embedding_voyage IS NOT NULL
+              AND m.memory_id <> q.memory_id
+            ORDER BY m.embedding_voyage <=> q.embedding_voyage
+            LIMIT %s
+        ) nn
+        WHERE q.memory_id = ANY(%s::uuid[])
+          AND q.embedding_voyage IS NOT NULL
+          AND 1 - nn.distance > %s
+        ORDER BY similarity DESC
+    """, (TENANT_ID, k * LATERAL_OVERFETCH, uuid_list, similarity_threshold))
+    return cur.fetchall()
+
+
+def fetch_similar_pairs_local(cur, uuid_list, similarity_threshold, k):
+    """Pull the embeddings once (primary-key lookup) and rank neighbours locally."""
+    cur.execute("""
+        SELECT memory_id::text, embedding_voyage::text
+        FROM zeus_core.memories
+        WHERE memory_id = ANY(%s::uuid[])
+          AND embedding_voyage IS NOT NULL
+    """, (uuid_list,))
+
+    ids = []
+    vectors = []
+    for memory_id, embedding in cur.fetchall():
+        vector = parse_embedding(embedding)
+        if vector is not None and len(vector) > 0:
+            ids.append(memory_id)
+            vectors.append(vector)
+
+    if not vectors:
+        return []
+    print(f"Fetched {len(vectors)} embeddings for local similarity")
+    return topk_similar_pairs(ids, np.vstack(vectors), k=k, threshold=similarity_threshold)
+
+
+def generate_similarity_edges(cur, node_ids, node_metadata, edge_set, similarity_threshold=0.85,
+                              max_edges=None, mode=DEFAULT_SIMILARITY_MODE, k=SIMILARITY_TOP_K,
+                              query_ids=None):
+    """Generate edges based on vector similarity.
+
+    Modes:
+        pairwise: all-pairs self-join in Postgres (original behaviour, O(N^2))
+        lateral: per-node pgvector k-NN lookups via CROSS JOIN LATERAL
+        local: fetch embeddings once, top-k with a vectorized NumPy kernel
+
+    query_ids restricts the lookups to those memory ids (incremental runs).
+    Only lateral mode can do that without every embedding in the graph, so it
+    is used regardless of mode.
+
+    max_edges caps the edges returned. By default it is PAIRWISE_MAX_EDGES
+    in pairwise mode and k x memory nodes queried otherwise, i.e. no cap
+    beyond the k-NN bound itself.
+    """
     edges = []
 
     def add_edge(source, target, edge_type, similarity):
@@ -661,33 +1030,34 @@ def generate_similarity_edges(cur, node_ids, node_metadata, edge_set, similarity
         print("No memory nodes for similarity calculation")
         return edges
 
-    # Query for similar pairs using pgvector
-    # Using embedding_voyage for similarity (or embedding_bge as fallback)
+    if mode not in SIMILARITY_MODES:
+        raise ValueError(f"Unknown similarity mode '{mode}' (expected one of {SIMILARITY_MODES})")
+
+    if query_ids is not None:
+        memory_ids = [nid for nid in memory_ids if nid in query_ids]
+        mode = "lateral"
+        if not memory_ids:
+            print("No new memory nodes for similarity calculation")
+            return edges
+
+    if max_edges is None:
+        max_edges = PAIRWISE_MAX_EDGES if mode == "pairwise" else k * len(memory_ids)
+
+    print(f"Similarity mode: {mode} ({len(memory_ids)} memory nodes, up to {max_edges} edges)")
     try:
-        # Convert string UUIDs to proper format for PostgreSQL
         uuid_list = [uuid for uuid in memory_ids if uuid != 'zeus-memory-hub']
-        cur.execute("""
-            WITH node_embeddings AS (
-                SELECT memory_id, embedding_voyage
-                FROM zeus_core.memories
-                WHERE memory_id::text = ANY(%s)
-                  AND embedding_voyage IS NOT NULL
-            )
-            SELECT
-                m1.memory_id::text as source,
-                m2.memory_id::text as target,
-                1 - (m1.embedding_voyage <=> m2.embedding_voyage) as similarity
-            FROM node_embeddings m1
-            JOIN node_embeddings m2 ON m1.memory_id < m2.memory_id
-            WHERE 1 - (m1.embedding_voyage <=> m2.embedding_voyage) > %s
-            ORDER BY similarity DESC
-            LIMIT %s
-        """, (uuid_list, similarity_threshold, max_edges))
+        if mode == "pairwise":
+            similar_pairs = fetch_similar_pairs_pairwise(cur, uuid_list, similarity_threshold, max_edges)
+        elif mode == "lateral":
+            similar_pairs = fetch_similar_pairs_lateral(cur, uuid_list, similarity_threshold, k)
+        else:
+            similar_pairs = fetch_similar_pairs_local(cur, uuid_list, similarity_threshold, k)
 
-        similar_pairs = cur.fetchall()
         print(f"Found {len(similar_pairs)} similar memory pairs")
 
         for source, target, similarity in similar_pairs:
+            if len(edges) >= max_edges:
+                break
             if source in node_ids and target in node_ids:
                 edge_type = "highly_similar" if similarity > 0.92 else "similar"
                 add_edge(source, target, edge_type, similarity)
@@ -861,6 +1231,8 @@ def generate_hierarchy_nodes_and_edges(nodes, node_ids, node_metadata, edge_set)
         hierarchy_nodes.append(area_node)
         node_ids.add(area_id)
 
+    project_members = defaultdict(list)  # project -> learning node ids
+
     # Scan nodes for projects and categorize learnings
     for node_id, meta in node_metadata.items():
         if meta.get('type') == 'hub':
@@ -872,6 +1244,7 @@ def generate_hierarchy_nodes_and_edges(nodes, node_ids, node_metadata, edge_set)
 
         if project:
             area_projects[area].add(project)
+            project_members[project].append(node_id)
 
             # Categorize by type (success/failure/decision)
             if source == 'cce_success_log':
@@ -924,9 +1297,8 @@ def generate_hierarchy_nodes_and_edges(nodes, node_ids, node_metadata, edge_set)
             add_edge(area_node_id, project_id, "contains")
 
             # Connect learnings to project
-            for node_id, meta in node_metadata.items():
-                if meta.get('project') == project_name:
-                    add_edge(project_id, node_id, "belongs_to")
+            for node_id in project_members[project_name]:
+                add_edge(project_id, node_id, "belongs_to")
 
     # Summary
     print(f"Generated {len(hierarchy_nodes)} hierarchy nodes (2 areas + {len(hierarchy_nodes) - 2} projects)")
@@ -1104,14 +1476,21 @@ def get_embedding_backlog_count(cur):
         return 0
 
 
-def extract_data(hours_filter=0, include_contributors=False, include_hierarchy=False, include_ingestion=False):
+def extract_data(hours_filter=0, include_contributors=False, include_hierarchy=False, include_ingestion=False,
+                 similarity_mode=DEFAULT_SIMILARITY_MODE, similarity_k=SIMILARITY_TOP_K,
+                 similarity_threshold=0.85, max_similarity_edges=None, max_nodes=DEFAULT_MAX_NODES):
     """Extract all data and generate edges using multiple methods.
 
     Args:
         hours_filter: Only include data from last N hours (0 = no filter)
+        max_nodes: Decision + memory node budget (0 = no limit)
         include_contributors: Add contributor nodes and edges
         include_hierarchy: Add Area/Project hierarchy nodes and edges
         include_ingestion: Add ingestion source nodes and edges
+        similarity_mode: 'pairwise', 'lateral' or 'local' (see generate_similarity_edges)
+        similarity_k: Nearest neighbours considered per node (lateral/local)
+        similarity_threshold: Minimum cosine similarity for an edge
+        max_similarity_edges: Cap on similarity edges (None = mode default, see generate_similarity_edges)
 
     Returns:
         nodes, edges, metadata dict with embedding_backlog count
@@ -1120,7 +1499,7 @@ def extract_data(hours_filter=0, include_contributors=False, include_hierarchy=F
     cur = conn.cursor()
 
     # Extract nodes (pass hours filter)
-    nodes, node_ids, node_metadata = extract_nodes(cur, hours_filter=hours_filter)
+    nodes, node_ids, node_metadata = extract_nodes(cur, hours_filter=hours_filter, max_nodes=max_nodes)
 
     # Generate edges using all methods
     all_edges = []
@@ -1135,7 +1514,13 @@ def extract_data(hours_filter=0, include_contributors=False, include_hierarchy=F
     all_edges.extend(temporal_edges)
 
     # 3. Similarity edges (vector-based)
-    similarity_edges = generate_similarity_edges(cur, node_ids, node_metadata, edge_set)
+    similarity_edges = generate_similarity_edges(
+        cur, node_ids, node_metadata, edge_set,
+        similarity_threshold=similarity_threshold,
+        max_edges=max_similarity_edges,
+        mode=similarity_mode,
+        k=similarity_k,
+    )
     all_edges.extend(similarity_edges)
 
     # 4. Hub edges (structural)
@@ -1184,11 +1569,223 @@ def extract_data(hours_filter=0, include_contributors=False, include_hierarchy=F
     # Return additional metadata
     extra_metadata = {
         "embedding_backlog": embedding_backlog,
+        "node_metadata": node_metadata,
     }
 
     return nodes, all_edges, extra_metadata
 
 
+def edge_key(edge):
+    """Undirected dedupe key used by every edge generator."""
+    return tuple(sorted([edge['source'], edge['target']])) + (edge['type'],)
+
+
+def compute_watermark(node_metadata, previous=None):
+    """Latest created_at (and the ids sharing it) per node type.
+
+    The ids let the next run use an inclusive `created_at >= watermark` query
+    without re-adding rows that landed in the same instant.
+    """
+    watermark = dict(previous or {})
+    for node_type in ("decision", "memory"):
+        latest, ids = None, []
+        for node_id, meta in node_metadata.items():
+            created = meta.get('created_at')
+            if meta.get('type') != node_type or not created:
+                continue
+            if latest is None or created > latest:
+                latest, ids = created, [node_id]
+            elif created == latest:
+                ids.append(node_id)
+        prior = watermark.get(node_type)
+        if latest is None:
+            continue
+        if prior and datetime.fromisoformat(prior["created_at"]) == latest:
+            ids = sorted(set(ids) | set(prior["ids"]))
+        elif prior and datetime.fromisoformat(prior["created_at"]) > latest:
+            continue
+        watermark[node_type] = {"created_at": latest.isoformat(), "ids": sorted(ids)}
+    return watermark
+
+
+def state_paths(output):
+    """Default state file and delta log for an output graph, keyed by its file stem."""
+    stem = os.path.splitext(os.path.basename(output))[0]
+    return (os.path.join(STATE_DIR, f"{stem}.state.json"),
+            os.path.join(STATE_DIR, f"{stem}.delta.jsonl"))
+
+
+def save_extract_state(path, node_metadata, watermark, output):
+    """Persist the watermark and edge-generation metadata for incremental runs."""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    serialized = {}
+    for node_id, meta in node_metadata.items():
+        meta = dict(meta)
+        if meta.get('created_at'):
+            meta['created_at'] = meta['created_at'].isoformat()
+        serialized[node_id] = meta
+    state = {
+        "version": STATE_VERSION,
+        "updated": datetime.now().isoformat(),
+        "output": os.path.abspath(output),
+        "watermark": watermark,
+        "node_metadata": serialized,
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(state, f, separators=(',', ':'))
+    os.replace(tmp_path, path)
+    print(f"Saved extraction state to {path} ({len(serialized)} nodes)")
+
+
+def load_extract_state(path):
+    """Load incremental state, or None if missing/incompatible."""
+    if not os.path.exists(path):
+        return None
+    with open(path) as f:
+        state = json.load(f)
+    if state.get("version") != STATE_VERSION:
+        print(f"Ignoring extraction state {path} (version {state.get('version')})")
+        return None
+    node_metadata = {}
+    for node_id, meta in state["node_metadata"].items():
+        if meta.get('created_at'):
+            meta['created_at'] = datetime.fromisoformat(meta['created_at'])
+        node_metadata[node_id] = meta
+    state["node_metadata"] = node_metadata
+    return state
+
+
+def extract_incremental(graph, state, similarity_mode=DEFAULT_SIMILARITY_MODE, similarity_k=SIMILARITY_TOP_K,
+                        similarity_threshold=0.85, max_similarity_edges=None):
+    """Merge decisions/memories newer than the state watermark into an existing graph.
+
+    Only rows at or after the watermark are fetched. Edges are recomputed for
+    the new nodes and the category/agent/day groups they join; similarity uses
+    per-node k-NN lookups for the new memories only. Ingestion source nodes are
+    carried over unchanged (they are refreshed by full runs).
+
+    Args:
+        graph: Previously generated visualization JSON (nodes/edges)
+        state: Loaded extraction state (watermark + node metadata)
+
+    Returns:
+        nodes, edges, extra_metadata (embedding_backlog, node_metadata, watermark, delta)
+    """
+    watermark = state["watermark"]
+    old_metadata = state["node_metadata"]
+
+    def since(node_type):
+        mark = watermark.get(node_type)
+        return (datetime.fromisoformat(mark["created_at"]), set(mark["ids"])) if mark else (None, set())
+
+    conn = psycopg2.connect(**conn_params)
+    cur = conn.cursor()
+
+    decision_since, decision_seen = since("decision")
+    memory_since, memory_seen = since("memory")
+    decisions = [row for row in fetch_decisions(cur, since=decision_since)
+                 if str(row[0]) not in decision_seen and str(row[0]) not in old_metadata]
+    memories = [row for row in fetch_memories(cur, since=memory_since)
+                if str(row[0]) not in memory_seen and str(row[0]) not in old_metadata]
+    print(f"Found {len(decisions)} new decisions and {len(memories)} new CCE memories since watermark")
+
+    new_nodes, new_ids, new_metadata = build_nodes(decisions, memories, include_hub=False)
+
+    # New rows first, matching the newest-first order of a full extraction
+    node_metadata = {**new_metadata, **old_metadata}
+    nodes = new_nodes + graph["nodes"]
+    node_ids = {node['id'] for node in nodes}
+
+    # Drop grouped edges in every group a new node joins; they are rebuilt below
+    new_categories = {m.get('category') for m in new_metadata.values()} - {None}
+    new_agents = {m.get('agent_id') for m in new_metadata.values()} - {None}
+    new_days = {(m['created_at'].date(), m.get('source')) for m in new_metadata.values() if m.get('created_at')}
+
+    def in_affected_group(edge):
+        source = node_metadata.get(edge['source'], {})
+        target = node_metadata.get(edge['target'], {})
+        if edge['type'] == 'same_category':
+            return source.get('category') in new_categories and source.get('category') == target.get('category')
+        if edge['type'] == 'same_agent':
+            return source.get('agent_id') in new_agents and source.get('agent_id') == target.get('agent_id')
+        if source.get('created_at') and target.get('created_at'):
+            day = (source['created_at'].date(), source.get('source'))
+            return day in new_days and day == (target['created_at'].date(), target.get('source'))
+        return False
+
+    edges = [e for e in graph["edges"] if e['type'] not in REGROUPED_EDGE_TYPES or not in_affected_group(e)]
+    removed = len(graph["edges"]) - len(edges)
+    edge_set = {edge_key(e) for e in edges}
+
+    added_edges = []
+    if new_ids:
+        metadata_edges, edge_set = generate_metadata_edges(nodes, node_ids, node_metadata, edge_set, changed=new_ids)
+        added_edges.extend(metadata_edges)
+        added_edges.extend(generate_temporal_edges(node_ids, node_metadata, edge_set, changed=new_ids))
+        added_edges.extend(generate_similarity_edges(
+            cur, node_ids, node_metadata, edge_set,
+            similarity_threshold=similarity_threshold,
+            max_edges=max_similarity_edges,
+            mode=similarity_mode,
+            k=similarity_k,
+            query_ids=new_ids,
+        ))
+        added_edges.extend(generate_hub_edges(new_nodes, edge_set))
+
+        # Contributor and hierarchy nodes carry counts over the whole graph;
+        # regenerate them in memory (existing edges dedupe via edge_set)
+        if any(node['group'] in ('contributor', 'management') for node in nodes):
+            contrib_nodes, contrib_edges = generate_contributor_nodes_and_edges(
+                nodes, node_ids, node_metadata, edge_set
+            )
+            contrib_by_id = {node['id']: node for node in contrib_nodes}
+            nodes = [contrib_by_id.pop(node['id'], node) for node in nodes] + list(contrib_by_id.values())
+            added_edges.extend(contrib_edges)
+
+        hierarchy_ids = {node['id'] for node in nodes if node['group'] in ('area_client', 'area_rnd', 'project')}
+        if hierarchy_ids:
+            node_ids -= hierarchy_ids
+            hierarchy_nodes, hierarchy_edges = generate_hierarchy_nodes_and_edges(
+                nodes, node_ids, node_metadata, edge_set
+            )
+            nodes = [node for node in nodes if node['id'] not in hierarchy_ids] + hierarchy_nodes
+            added_edges.extend(hierarchy_edges)
+
+    edges.extend(added_edges)
+
+    embedding_backlog = get_embedding_backlog_count(cur)
+    print(f"Embedding backlog: {embedding_backlog} pending")
+
+    cur.close()
+    conn.close()
+
+    added_by_type = defaultdict(int)
+    for e in added_edges:
+        added_by_type[e['type']] += 1
+    delta = {
+        "timestamp": datetime.now().isoformat(),
+        "watermark_before": watermark,
+        "added_nodes": sorted(new_ids),
+        "added_edges": len(added_edges),
+        "added_edges_by_type": dict(added_by_type),
+        "removed_edges": removed,
+        "total_nodes": len(nodes),
+        "total_edges": len(edges),
+    }
+    print(f"\n--- Delta Summary ---")
+    print(f"  Nodes added: {len(new_ids)}")
+    print(f"  Edges added: {len(added_edges)}, regrouped/removed: {removed}")
+
+    extra_metadata = {
+        "embedding_backlog": embedding_backlog,
+        "node_metadata": node_metadata,
+        "watermark": compute_watermark(node_metadata, watermark),
+        "delta": delta,
+    }
+    return nodes, edges, extra_metadata
+
+
 def main():
     parser = argparse.ArgumentParser(description='Extract Zeus Memory data for visualization')
     parser.add_argument('--hours', type=int, default=0,
@@ -1201,7 +1798,74 @@ def main():
                        help='Disable ingestion source nodes (enabled by default)')
     parser.add_argument('--output', type=str, default='data/examples/zeus_knowledge_path.json',
                        help='Output file path')
+    parser.add_argument('--max-nodes', type=int, default=DEFAULT_MAX_NODES,
+                       help='Decision + memory node budget, fetched with keyset pagination (0 = no limit)')
+    parser.add_argument('--similarity-mode', choices=SIMILARITY_MODES, default=DEFAULT_SIMILARITY_MODE,
+                       help='Similarity edge strategy: pairwise (SQL self-join), lateral (pgvector k-NN per node) '
+                            'or local (NumPy top-k over fetched embeddings)')
+    parser.add_argument('--similarity-k', type=int, default=SIMILARITY_TOP_K,
+                       help='Nearest neighbours per node for lateral/local modes')
+    parser.add_argument('--similarity-threshold', type=float, default=0.85,
+                       help='Minimum cosine similarity for a similarity edge')
+    parser.add_argument('--max-similarity-edges', type=int, default=None,
+                       help=f'Maximum number of similarity edges (default: k x memory nodes; '
+                            f'{PAIRWISE_MAX_EDGES} in pairwise mode)')
+    parser.add_argument('--incremental', action='store_true',
+                       help='Merge only rows newer than the saved watermark into the existing --output graph '
+                            '(falls back to a full extraction when no state/output exists)')
+    parser.add_argument('--state-file', type=str, default=None,
+                       help=f'Watermark and node metadata for incremental runs '
+                            f'(default: {STATE_DIR}/<output stem>.state.json)')
+    parser.add_argument('--delta-log', type=str, default=None,
+                       help=f'JSON-lines log of incremental deltas (default: {STATE_DIR}/<output stem>.delta.jsonl)')
     args = parser.parse_args()
+    default_state_file, default_delta_log = state_paths(args.output)
+    args.state_file = args.state_file or default_state_file
+    args.delta_log = args.delta_log or default_delta_log
+
+    state = load_extract_state(args.state_file) if args.incremental else None
+    if state is not None and state.get("output") not in (None, os.path.abspath(args.output)):
+        parser.error(f"{args.state_file} tracks {state['output']}, not {args.output}; "
+                     f"pass the matching --output or a separate --state-file")
+    graph = None
+    if state is not None and os.path.exists(args.output):
+        with open(args.output) as f:
+            graph = json.load(f)
+    elif args.incremental:
+        print(f"No extraction state or existing output - running a full extraction to bootstrap")
+
+    if graph is not None:
+        nodes, edges, extra_metadata = extract_incremental(
+            graph, state,
+            similarity_mode=args.similarity_mode,
+            similarity_k=args.similarity_k,
+            similarity_threshold=args.similarity_threshold,
+            max_similarity_edges=args.max_similarity_edges,
+        )
+        data = graph
+        data["metadata"]["updated"] = datetime.now().strftime("%Y-%m-%d %H:%M")
+        data["metadata"]["embedding_backlog"] = extra_metadata.get("embedding_backlog", 0)
+        data["metadata"]["last_delta"] = {
+            "added_nodes": len(extra_metadata["delta"]["added_nodes"]),
+            "added_edges": extra_metadata["delta"]["added_edges"],
+            "removed_edges": extra_metadata["delta"]["removed_edges"],
+        }
+        data["nodes"] = nodes
+        data["edges"] = edges
+
+        with open(args.output, 'w') as f:
+            json.dump(data, f, indent=2, default=str)
+        save_extract_state(args.state_file, extra_metadata["node_metadata"], extra_metadata["watermark"],
+                           args.output)
+        os.makedirs(os.path.dirname(args.delta_log) or '.', exist_ok=True)
+        with open(args.delta_log, 'a') as f:
+            f.write(json.dumps(extra_metadata["delta"]) + "\n")
+
+        print(f"\nUpdated {args.output}")
+        print(f"  Nodes: {len(nodes)}")
+        print(f"  Edges: {len(edges)}")
+        print(f"  Delta appended to {args.delta_log}")
+        return
 
     # Extract data with optional time filter
     # Contributors and ingestion enabled by default
@@ -1209,7 +1873,12 @@ def main():
         hours_filter=args.hours,
         include_contributors=not args.no_contributors,
         include_hierarchy=args.hierarchy,
-        include_ingestion=not args.no_ingestion
+        include_ingestion=not args.no_ingestion,
+        similarity_mode=args.similarity_mode,
+        similarity_k=args.similarity_k,
+        similarity_threshold=args.similarity_threshold,
+        max_similarity_edges=args.max_similarity_edges,
+        max_nodes=args.max_nodes,
     )
 
     # Build visualization data
@@ -1225,6 +1894,8 @@ def main():
             "contributors_enabled": not args.no_contributors,
             "hierarchy_enabled": args.hierarchy,
             "ingestion_enabled": not args.no_ingestion,
+            "similarity_mode": args.similarity_mode,
+            "max_nodes": args.max_nodes if args.max_nodes > 0 else "all",
             "embedding_backlog": extra_metadata.get("embedding_backlog", 0),
         },
         "groups": GROUPS,
@@ -1239,6 +1910,9 @@ def main():
     with open(args.output, 'w') as f:
         json.dump(data, f, indent=2, default=str)
 
+    save_extract_state(args.state_file, extra_metadata["node_metadata"],
+                       compute_watermark(extra_metadata["node_metadata"]), args.output)
+
     print(f"\nGenerated {args.output}")
     print(f"  Nodes: {len(nodes)}")
     print(f"  Edges: {len(edges)}")
@@ -20,6 +20,7 @@ VISUAL ENHANCEMENTS:
 INTERACTION EXTENSIONS:
 - Path highlighting with animated traversal
 - Expand/collapse clustered groups
+- Level-of-detail meta-nodes for large graphs (--node-budget)
 - Multi-select with shift-click
 - Search with zoom-to-result
 - Time slider for graph evolution
@@ -30,6 +31,8 @@ LAYOUT VARIATIONS:
 - Spherical layout (nodes on sphere surface)
 - Cylinder layout (time on Y, categories on circumference)
 - Force + constraints (pin nodes to fixed positions)
+- Optional offline-precomputed positions for every layout (--precompute-layout)
+- Instanced node/link rendering for large graphs (--instanced)
 
 DATA-DRIVEN FEATURES:
 - Edge thickness by relationship strength
@@ -39,13 +42,52 @@ DATA-DRIVEN FEATURES:
 
 Usage:
     python generate_3d.py --input data/examples/fbc_partners.json --output output/html/fbc_ecosystem.html
+    python generate_3d.py --input data/examples/zeus_decision_graph.json --output output/html/zeus_decision_graph.html --split-data
 """
 
 import argparse
+import base64
+import gzip
+import hashlib
+import io
 import json
 import math
+import sys
+from array import array
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Optional
+from urllib.parse import urlparse
+
+# --split-data: assets are written next to the HTML shell in this directory
+SPLIT_DATA_DIR = "data"
+# Nodes per lazily fetched description chunk
+DESCRIPTION_CHUNK_SIZE = 200
+
+# --precompute-layout: force simulation parameters (mirroring d3-force-3d defaults)
+FORCE_ITERATIONS = 300
+FORCE_CHARGE = -30.0
+FORCE_LINK_DISTANCE = 30.0
+FORCE_VELOCITY_DECAY = 0.4
+FORCE_ALPHA_MIN = 0.001
+FORCE_EXACT_MAX_NODES = 500  # Above this, far-field repulsion uses grid cells
+FORCE_NODES_PER_CELL = 64
+LAYOUT_NAMES = ("force", "layered", "spherical", "cylinder")
+
+# --node-budget: level-of-detail collapsing for large graphs
+LOD_ID_PREFIX = "lod:"
+LOD_META_SHARE = 0.5  # Fraction of the budget reserved for meta-nodes
+LOD_MIN_PART_SHARE = 0.25  # Smallest meta-node split, as a fraction of the budget
+LOD_LINKS_PER_NODE = 4  # Visible links are capped at budget * this, heaviest first
+LOD_MAX_MEMBERS = 100  # Members shipped per meta-node, most connected first; the rest stay folded
+
+# --logo-dir: node logos packed offline into atlas pages
+LOGO_ATLAS_CELL = 128  # Pixels per logo
+LOGO_ATLAS_SIZE = 2048  # Pixels per atlas page (256 logos)
+LOGO_IMAGE_SUFFIXES = (".png", ".jpg", ".jpeg", ".gif", ".webp")
+
+# --instanced: above this many visible nodes the viewer draws instanced meshes
+INSTANCED_NODE_THRESHOLD = 3000
 
 
 def load_json_data(filepath: str) -> dict[str, Any]:
@@ -54,8 +96,554 @@ def load_json_data(filepath: str) -> dict[str, Any]:
         return json.load(f)
 
 
-def generate_html(data: dict[str, Any], title: str) -> str:
-    """Generate custom HTML with 3D interactive features."""
+def _repulsion(points, sources, weights=None):
+    """Sum of (source - point) * weight / |source - point|^2 for each point.
+
+    Expanded as matrix products (|p|^2 + |q|^2 - 2 p.q) so no (n, m, 3)
+    difference tensor is materialised.
+    """
+    import numpy as np
+
+    inv = points @ sources.T
+    inv *= -2.0
+    inv += (points * points).sum(axis=1)[:, None]
+    inv += (sources * sources).sum(axis=1)[None, :]
+    np.maximum(inv, 1.0, out=inv)  # d3 distanceMin = 1
+    np.reciprocal(inv, out=inv)
+    if weights is not None:
+        inv *= weights
+    return inv @ sources - points * inv.sum(axis=1)[:, None], inv
+
+
+def _charge_exact(pos):
+    """All-pairs many-body repulsion (unit charge per node)."""
+    import numpy as np
+
+    velocity = np.empty_like(pos)
+    for start in range(0, len(pos), 2048):
+        velocity[start:start + 2048], _ = _repulsion(pos[start:start + 2048], pos)
+    return velocity
+
+
+def _charge_grid(pos):
+    """Barnes-Hut style approximation on a uniform grid.
+
+    Each cell is summarised by its centroid and node count; a node feels the
+    other cells as point masses and the nodes of its own cell exactly (or,
+    for dense cells, through a nested grid).
+    """
+    import numpy as np
+
+    n = len(pos)
+    cells_per_axis = max(2, round((n / FORCE_NODES_PER_CELL) ** (1 / 3)))
+    low = pos.min(axis=0)
+    span = np.maximum(pos.max(axis=0) - low, 1e-6)
+    coords = np.minimum((pos - low) / span * cells_per_axis, cells_per_axis - 1).astype(np.int64)
+    cell = (coords[:, 0] * cells_per_axis + coords[:, 1]) * cells_per_axis + coords[:, 2]
+
+    _, cell_index, counts = np.unique(cell, return_inverse=True, return_counts=True)
+    centroids = np.stack([np.bincount(cell_index, weights=pos[:, d]) for d in range(3)], axis=1)
+    centroids = (centroids / counts[:, None]).astype(pos.dtype)
+    masses = counts.astype(pos.dtype)[None, :]
+
+    velocity = np.empty_like(pos)
+    for start in range(0, n, 2048):
+        block = pos[start:start + 2048]
+        rows = np.arange(len(block))
+        own = cell_index[start:start + 2048]
+        far, inv = _repulsion(block, centroids, masses)
+        # Remove the own-cell centroid term; those nodes are handled exactly below
+        far -= (centroids[own] - block) * inv[rows, own][:, None]
+        velocity[start:start + 2048] = far
+
+    # Dense cells recurse into their own grid, giving an octree-like hierarchy
+    order = np.argsort(cell_index, kind="stable")
+    bounds = np.concatenate([[0], np.cumsum(counts)])
+    for c in range(len(counts)):
+        members = order[bounds[c]:bounds[c + 1]]
+        if len(members) > FORCE_EXACT_MAX_NODES and len(members) < n:
+            velocity[members] += _charge_grid(pos[members])
+        elif len(members) > 1:
+            velocity[members] += _charge_exact(pos[members])
+    return velocity
+
+
+def compute_force_layout(n: int, sources, targets, iterations: int = FORCE_ITERATIONS, seed: int = 0):
+    """3D force-directed positions with vectorized NumPy.
+
+    Follows the d3-force-3d model the viewer uses (many-body charge, link
+    springs with degree-based strength and bias, velocity decay, alpha
+    cooling) so the result looks like a settled in-browser simulation.
+    """
+    import numpy as np
+
+    rng = np.random.default_rng(seed)
+    # d3's phyllotaxis-like start: a ball whose radius grows with n
+    radius = 10.0 * np.cbrt(max(n, 1))
+    pos = rng.normal(size=(n, 3))
+    pos *= (radius * np.cbrt(rng.random(n)) / np.linalg.norm(pos, axis=1))[:, None]
+    pos = pos.astype(np.float32)
+    velocity = np.zeros((n, 3), dtype=np.float32)
+    if n < 2:
+        return pos * 0
+
+    sources = np.asarray(sources, dtype=np.int64)
+    targets = np.asarray(targets, dtype=np.int64)
+    degree = np.bincount(np.concatenate([sources, targets]), minlength=n).astype(np.float32)
+    if len(sources):
+        strength = 1.0 / np.minimum(degree[sources], degree[targets])
+        bias = degree[sources] / (degree[sources] + degree[targets])
+
+    charge = _charge_exact if n <= FORCE_EXACT_MAX_NODES else _charge_grid
+    alpha = 1.0
+    alpha_decay = 1 - FORCE_ALPHA_MIN ** (1 / iterations)
+    for _ in range(iterations):
+        alpha += (0.0 - alpha) * alpha_decay
+
+        if len(sources):
+            delta = (pos[targets] + velocity[targets]) - (pos[sources] + velocity[sources])
+            dist = np.maximum(np.linalg.norm(delta, axis=1), 1e-6)
+            scale = ((dist - FORCE_LINK_DISTANCE) / dist * alpha * strength)[:, None] * delta
+            for d in range(3):
+                velocity[:, d] -= np.bincount(targets, weights=scale[:, d] * bias, minlength=n)
+                velocity[:, d] += np.bincount(sources, weights=scale[:, d] * (1 - bias), minlength=n)
+
+        velocity += charge(pos) * np.float32(FORCE_CHARGE * alpha)
+        velocity *= 1 - FORCE_VELOCITY_DECAY
+        pos += velocity
+
+    return pos - pos.mean(axis=0)
+
+
+def compute_layouts(nodes_list: list[dict[str, Any]], links_list: list[dict[str, Any]],
+                    iterations: int = FORCE_ITERATIONS) -> dict[str, list[list[float]]]:
+    """Precompute viewer positions for every layout option.
+
+    The layered, spherical and cylinder layouts reproduce the viewer's
+    applyLayeredLayout/applySphericalLayout/applyCylinderLayout for the full
+    node set, so switching layouts needs no simulation either.
+    """
+    import numpy as np
+
+    n = len(nodes_list)
+    index = {node["id"]: i for i, node in enumerate(nodes_list)}
+    pairs = [(index[l["source"]], index[l["target"]]) for l in links_list
+             if l["source"] in index and l["target"] in index]
+    sources = [a for a, _ in pairs]
+    targets = [b for _, b in pairs]
+    tiers = np.array([node.get("tier") or 0 for node in nodes_list], dtype=float)
+
+    layouts = {"force": compute_force_layout(n, sources, targets, iterations=iterations)}
+
+    def rank_within(keys):
+        """Position of each node among nodes sharing its key, and the key's size."""
+        seen, rank, total = {}, np.zeros(n), np.zeros(n)
+        for i, key in enumerate(keys):
+            rank[i] = seen.get(key, 0)
+            seen[key] = rank[i] + 1
+        for i, key in enumerate(keys):
+            total[i] = seen[key]
+        return rank, total
+
+    # Layered: ring per tier, Z = tier
+    rank, total = rank_within(tiers)
+    angle = rank / total * 2 * np.pi
+    radius = 50 + tiers * 80
+    layouts["layered"] = np.stack([np.cos(angle) * radius, np.sin(angle) * radius, tiers * 100], axis=1)
+
+    # Spherical: one meridian per group, latitude by position within the group
+    groups = [node.get("group") or "default" for node in nodes_list]
+    group_order = {g: i for i, g in enumerate(dict.fromkeys(groups))}
+    phi = np.array([group_order[g] for g in groups]) / len(group_order) * 2 * np.pi
+    rank, total = rank_within(groups)
+    theta = rank / total * np.pi - np.pi / 2
+    r = 200 + tiers * 30
+    layouts["spherical"] = np.stack([
+        r * np.cos(theta) * np.cos(phi), r * np.sin(theta), r * np.cos(theta) * np.sin(phi)
+    ], axis=1)
+
+    # Cylinder: evenly spaced ring per tier (viewer uses radius 200, height 500)
+    cylinder_tiers = np.array([node["tier"] if isinstance(node.get("tier"), (int, float)) else 0
+                               for node in nodes_list], dtype=float)
+    sorted_tiers = sorted(set(cylinder_tiers.tolist()))
+    if len(sorted_tiers) > 1:
+        stage_y = {t: -0.45 + 0.9 * i / (len(sorted_tiers) - 1) for i, t in enumerate(sorted_tiers)}
+    else:
+        stage_y = {t: 0.0 for t in sorted_tiers}
+    rank, total = rank_within(cylinder_tiers)
+    angle = rank / total * 2 * np.pi
+    layouts["cylinder"] = np.stack([
+        np.cos(angle) * 200, np.array([stage_y[t] for t in cylinder_tiers]) * 500, np.sin(angle) * 200
+    ], axis=1)
+
+    return {name: np.round(coords, 1).tolist() for name, coords in layouts.items()}
+
+
+def build_lod_graph(nodes_list: list[dict[str, Any]], links_list: list[dict[str, Any]],
+                    node_budget: int):
+    """Collapse a graph to roughly node_budget visible nodes.
+
+    The highest-degree nodes stay visible; the rest are folded into one
+    meta-node per (group, tier), split into parts when there are more
+    collapsed nodes than the meta-node share of the budget can hold. Links
+    are aggregated between their visible endpoints (weight = link count)
+    and capped at node_budget * LOD_LINKS_PER_NODE, heaviest first. The
+    viewer repeats the same aggregation whenever a meta-node expands.
+
+    Only the LOD_MAX_MEMBERS most connected members of each meta-node are
+    shipped; expanding it shows those. Links to the others are folded into
+    weighted links to the meta-node itself, so collapsed weights stay exact.
+
+    Returns:
+        (visible_nodes, visible_links, lod) where lod holds the shipped
+        member lists and the link list the viewer re-aggregates on
+        expansion, or None when the graph already fits the budget
+    """
+    if len(nodes_list) <= node_budget:
+        return nodes_list, links_list, None
+
+    meta_budget = max(1, int(node_budget * LOD_META_SHARE))
+    by_degree = sorted(range(len(nodes_list)), key=lambda i: -nodes_list[i].get("degree", 0))
+    kept = set(by_degree[:max(0, node_budget - meta_budget)])
+
+    buckets = {}
+    for i, node in enumerate(nodes_list):
+        if i not in kept:
+            buckets.setdefault((node["group"], node["tier"]), []).append(node)
+    n_collapsed = len(nodes_list) - len(kept)
+    part_size = max(math.ceil(n_collapsed / max(1, meta_budget - len(buckets))),
+                    int(node_budget * LOD_MIN_PART_SHARE))
+
+    members = {}
+    meta_nodes = []
+    for (group, tier), bucket in buckets.items():
+        parts = [bucket[i:i + part_size] for i in range(0, len(bucket), part_size)]
+        for part_index, part in enumerate(parts):
+            meta_id = f"{LOD_ID_PREFIX}{group}:{tier}:{part_index}"
+            first = part[0]
+            label = f"{first['groupLabel']} · tier {tier}"
+            if len(parts) > 1:
+                label += f" #{part_index + 1}"
+            dates = [n["createdAt"] for n in part if n.get("createdAt")]
+            description = f"{len(part):,} collapsed nodes. Click to expand"
+            if len(part) > LOD_MAX_MEMBERS:
+                description += f" the {LOD_MAX_MEMBERS:,} most connected"
+            meta = {
+                "id": meta_id,
+                "name": f"{label} ({len(part):,})",
+                "description": description + ".",
+                "val": min(80, 20 + 4 * math.sqrt(len(part))),
+                "color": first["color"],
+                "group": group,
+                "groupLabel": first["groupLabel"],
+                "tier": tier,
+                "logo": "",
+                "createdAt": max(dates) if dates else None,
+                "physicalGroup": "",
+                "physicalGroupColor": None,
+                "physicalGroupLabel": None,
+                "degree": 0,
+                "isLodNode": True,
+                "memberCount": len(part),
+            }
+            if "layoutPos" in first:
+                meta["layoutPos"] = {
+                    name: [round(sum(n["layoutPos"][name][axis] for n in part) / len(part), 1)
+                           for axis in range(3)]
+                    for name in LAYOUT_NAMES
+                }
+                meta["x"], meta["y"], meta["z"] = meta["layoutPos"]["force"]
+            for node in part:
+                node["lodParent"] = meta_id
+            members[meta_id] = part
+            meta_nodes.append(meta)
+
+    parent = {node["id"]: node["lodParent"] for part in members.values() for node in part}
+    folded = set()
+    for meta_id, part in members.items():
+        if len(part) > LOD_MAX_MEMBERS:
+            shipped = {node["id"] for node in sorted(part, key=lambda n: -n.get("degree", 0))[:LOD_MAX_MEMBERS]}
+            folded.update(node["id"] for node in part if node["id"] not in shipped)
+            members[meta_id] = [node for node in part if node["id"] in shipped]
+
+    # Links the viewer re-aggregates: unchanged between shipped nodes,
+    # merged into weighted links to the meta-node for folded endpoints
+    lod_links = []
+    folded_links = {}
+    for link in links_list:
+        source, target = link["source"], link["target"]
+        if source not in folded and target not in folded:
+            lod_links.append(link)
+            continue
+        if source in folded:
+            source = parent[source]
+        if target in folded:
+            target = parent[target]
+        if source == target:
+            continue
+        key = (min(source, target), max(source, target), link["edgeType"])
+        if key in folded_links:
+            folded_links[key]["weight"] += 1
+        else:
+            folded_links[key] = dict(link, source=source, target=target, weight=1)
+    lod_links.extend(folded_links.values())
+
+    aggregated = {}
+    for link in links_list:
+        source, target = parent.get(link["source"], link["source"]), parent.get(link["target"], link["target"])
+        if source == target:
+            continue
+        key = (min(source, target), max(source, target), link["edgeType"])
+        if key in aggregated:
+            aggregated[key]["weight"] += 1
+        else:
+            aggregated[key] = dict(link, source=source, target=target, weight=1)
+    link_budget = node_budget * LOD_LINKS_PER_NODE
+    visible_links = sorted(aggregated.values(), key=lambda link: -link["weight"])[:link_budget]
+
+    # Meta degrees are capped at the real maximum so centrality sizing stays in range
+    max_degree = max((node.get("degree", 0) for node in nodes_list), default=0)
+    meta_by_id = {meta["id"]: meta for meta in meta_nodes}
+    for link in visible_links:
+        for end in (link["source"], link["target"]):
+            if end in meta_by_id:
+                meta_by_id[end]["degree"] = min(max_degree, meta_by_id[end]["degree"] + link["weight"])
+
+    visible_nodes = [node for i, node in enumerate(nodes_list) if i in kept] + meta_nodes
+    lod = {"budget": node_budget, "linkBudget": link_budget, "members": members, "links": lod_links}
+    return visible_nodes, visible_links, lod
+
+
+def logo_cache_name(url: str) -> str:
+    """File name a remote logo is stored under in the logo directory."""
+    suffix = Path(urlparse(url).path).suffix.lower()
+    return hashlib.sha1(url.encode("utf-8")).hexdigest()[:16] + (suffix if suffix in LOGO_IMAGE_SUFFIXES else ".png")
+
+
+def resolve_logo_file(logo: str, logo_dir: Path) -> Optional[Path]:
+    """Local file for a node logo: a path under logo_dir, a file named like
+    the URL's basename, or one saved by fetch_logos."""
+    parsed = urlparse(logo)
+    candidates = [logo_dir / logo_cache_name(logo)]
+    if not parsed.scheme:
+        candidates.insert(0, logo_dir / logo.lstrip("/"))
+        candidates.insert(1, logo_dir / Path(logo).name)
+    elif Path(parsed.path).suffix.lower() in LOGO_IMAGE_SUFFIXES:
+        candidates.insert(0, logo_dir / Path(parsed.path).name)
+    return next((path for path in candidates if path.is_file()), None)
+
+
+def fetch_logos(logos: set[str], logo_dir: Path):
+    """Download remote logos missing from logo_dir (stored by logo_cache_name)."""
+    from urllib.request import Request, urlopen
+
+    logo_dir.mkdir(parents=True, exist_ok=True)
+    for logo in sorted(logos):
+        if not urlparse(logo).scheme.startswith("http") or resolve_logo_file(logo, logo_dir):
+            continue
+        try:
+            with urlopen(Request(logo, headers={"User-Agent": "athena-generate-3d"}), timeout=15) as response:
+                (logo_dir / logo_cache_name(logo)).write_bytes(response.read())
+        except OSError as e:
+            print(f"Warning: could not fetch logo {logo}: {e}")
+
+
+def render_logo_cell(Image, ImageDraw, path: Path, cell: int):
+    """Square, circle-clipped logo as the viewer draws it; dark icons are
+    lightened the same way loadLightenedLogo does at runtime."""
+    logo = Image.open(path).convert("RGBA").resize((cell, cell), Image.LANCZOS)
+    pixels = logo.load()
+    opaque = [pixels[x, y] for y in range(0, cell, 2) for x in range(0, cell, 2) if pixels[x, y][3] > 50]
+    brightness = sum((r + g + b) / 3 for r, g, b, _ in opaque) / len(opaque) if opaque else 128
+    if brightness < 80:
+        for y in range(cell):
+            for x in range(cell):
+                r, g, b, a = pixels[x, y]
+                if a:
+                    pixels[x, y] = (min(255, 295 - r), min(255, 295 - g), min(255, 295 - b), a)
+
+    mask = Image.new("L", (cell, cell), 0)
+    ImageDraw.Draw(mask).ellipse((0, 0, cell - 1, cell - 1), fill=255)
+    clipped = Image.new("RGBA", (cell, cell), (0, 0, 0, 0))
+    clipped.paste(logo, (0, 0), mask)
+    return clipped
+
+
+def build_logo_atlas(nodes_list: list[dict[str, Any]], logo_dir: str, fetch: bool = False):
+    """Pack every distinct node logo found in logo_dir into PNG atlas pages.
+
+    Returns:
+        (atlas, pages) where atlas maps logo URL -> [page, x, y] (cell
+        LOGO_ATLAS_CELL px) and pages is the list of PNG bytes. Logos that
+        are missing locally (or unreadable, e.g. SVG) are left out and the
+        viewer loads them individually.
+    """
+    from PIL import Image, ImageDraw
+
+    logo_path = Path(logo_dir)
+    logos = {node["logo"] for node in nodes_list if node.get("logo") and not node["logo"].startswith("data:")}
+    if fetch:
+        fetch_logos(logos, logo_path)
+
+    cells = {}
+    for logo in sorted(logos):
+        path = resolve_logo_file(logo, logo_path)
+        if path is None:
+            continue
+        try:
+            cells[logo] = render_logo_cell(Image, ImageDraw, path, LOGO_ATLAS_CELL)
+        except OSError as e:
+            print(f"Warning: skipping logo {path}: {e}")
+
+    per_row = LOGO_ATLAS_SIZE // LOGO_ATLAS_CELL
+    per_page = per_row * per_row
+    entries, pages = {}, []
+    for i, (logo, cell) in enumerate(cells.items()):
+        page, slot = divmod(i, per_page)
+        if page == len(pages):
+            remaining = len(cells) - i
+            rows = math.ceil(min(remaining, per_page) / per_row)
+            width = LOGO_ATLAS_CELL * min(remaining, per_row)
+            pages.append(Image.new("RGBA", (width, rows * LOGO_ATLAS_CELL), (0, 0, 0, 0)))
+        x, y = (slot % per_row) * LOGO_ATLAS_CELL, (slot // per_row) * LOGO_ATLAS_CELL
+        pages[page].paste(cell, (x, y))
+        entries[logo] = [page, x, y]
+
+    encoded = []
+    for page in pages:
+        buffer = io.BytesIO()
+        page.save(buffer, format="PNG", optimize=True)
+        encoded.append(buffer.getvalue())
+    print(f"Logo atlas: {len(entries)}/{len(logos)} logos in {len(encoded)} page(s), "
+          f"{sum(map(len, encoded)):,} bytes")
+    return {"cell": LOGO_ATLAS_CELL, "entries": entries}, encoded
+
+
+def pack_uint_array(values: list[int]) -> dict[str, str]:
+    """Base64 little-endian Uint16/Uint32 array, decoded by the viewer's decodeTypedArray."""
+    typecode, js_type = ("H", "Uint16Array") if max(values, default=0) < 1 << 16 else ("I", "Uint32Array")
+    packed = array(typecode, values)
+    if sys.byteorder == "big":
+        packed.byteswap()
+    return {"type": js_type, "data": base64.b64encode(packed.tobytes()).decode("ascii")}
+
+
+def build_adjacency(nodes_list: list[dict[str, Any]], links_list: list[dict[str, Any]]) -> dict[str, Any]:
+    """CSR adjacency over nodes_list order.
+
+    Row i (neighbors[offsets[i]:offsets[i + 1]]) lists the node indices
+    connected to node i, in link order; links holds the index of the link
+    each neighbour came from (for relationType/edgeType). Both directions
+    are stored, matching the viewer's linksByNode.
+    """
+    index = {node["id"]: i for i, node in enumerate(nodes_list)}
+    rows = [[] for _ in nodes_list]
+    for link_index, link in enumerate(links_list):
+        source, target = index.get(link["source"]), index.get(link["target"])
+        if source is None or target is None:
+            continue
+        rows[source].append((target, link_index))
+        rows[target].append((source, link_index))
+
+    offsets = [0]
+    neighbors, link_ids = [], []
+    for row in rows:
+        neighbors.extend(neighbor for neighbor, _ in row)
+        link_ids.extend(link_index for _, link_index in row)
+        offsets.append(len(neighbors))
+    return {
+        "offsets": pack_uint_array(offsets),
+        "neighbors": pack_uint_array(neighbors),
+        "links": pack_uint_array(link_ids),
+    }
+
+
+def build_search_index(nodes_list: list[dict[str, Any]]) -> dict[str, Any]:
+    """Trigram index over lowercased labels.
+
+    keys is the sorted list of trigrams; postings[offsets[k]:offsets[k + 1]]
+    are the (ascending) node indices whose label contains keys[k]. Labels are
+    indexed with a trailing space so any two-character query is a prefix of
+    some key, letting the viewer answer it with a range scan. Trigrams are
+    cut over UTF-16 code units, as the viewer slices JS strings, so a key
+    may hold half of a surrogate pair.
+    """
+    grams = {}
+    for i, node in enumerate(nodes_list):
+        units = (str(node.get("name", "")).lower() + " ").encode("utf-16-le")
+        for j in range(0, len(units) - 4, 2):
+            grams.setdefault(units[j:j + 6], set()).add(i)
+
+    # JS string order is code-unit order
+    grams = {key.decode("utf-16-le", "surrogatepass"): sorted(ids) for key, ids in grams.items()}
+    keys = sorted(grams, key=lambda key: key.encode("utf-16-be", "surrogatepass"))
+    offsets = [0]
+    postings = []
+    for key in keys:
+        postings.extend(grams[key])
+        offsets.append(len(postings))
+    return {"keys": keys, "offsets": pack_uint_array(offsets), "postings": pack_uint_array(postings)}
+
+
+def parse_created_at(value: Any) -> Optional[datetime]:
+    """Parse an ISO timestamp, taking naive times as UTC (None if unparseable)."""
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+def normalize_created_at(value: Any) -> Any:
+    """Give naive timestamps an explicit UTC offset.
+
+    JS reads a date-time without an offset as local time, so the viewer and
+    compute_graph_stats would disagree on it. Date-only values are already
+    UTC in both and are left alone, as is anything unparseable.
+    """
+    if not value or len(str(value)) <= len("YYYY-MM-DD"):
+        return value
+    try:
+        parsed = datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+    except ValueError:
+        return value
+    return value if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc).isoformat()
+
+
+def compute_graph_stats(nodes_list: list[dict[str, Any]], links_list: list[dict[str, Any]]) -> dict[str, Any]:
+    """Whole-graph aggregates the viewer would otherwise rescan for on load."""
+    group_counts = {}
+    for node in nodes_list:
+        group_counts[node["group"]] = group_counts.get(node["group"], 0) + 1
+
+    dated = [(parse_created_at(node["createdAt"]), node["createdAt"]) for node in nodes_list if node.get("createdAt")]
+    parsed = [item for item in dated if item[0] is not None]
+    return {
+        "groupCounts": group_counts,
+        "edgeTypes": list(dict.fromkeys(link["edgeType"] for link in links_list)),
+        "datedNodes": len(dated),
+        "dateRange": [min(parsed)[1], max(parsed)[1]] if parsed else None,
+    }
+
+
+def generate_html(data: dict[str, Any], title: str, split_data: bool = False,
+                  precompute_layout: bool = False, layout_iterations: int = FORCE_ITERATIONS,
+                  node_budget: Optional[int] = None, logo_dir: Optional[str] = None,
+                  fetch_logos: bool = False, instanced: Optional[bool] = None):
+    """Generate custom HTML with 3D interactive features.
+
+    With split_data, returns (shell_html, assets) instead: the viewer script
+    and graph data are moved into content-hashed files (see split_html_assets).
+    With precompute_layout, every node carries its position in each layout so
+    the viewer renders without running the force simulation.
+    With node_budget, graphs above the budget open collapsed into meta-nodes
+    (see build_lod_graph) that the viewer expands on click.
+    With logo_dir, node logos found there are packed into atlas pages (see
+    build_logo_atlas) instead of being fetched one by one in the browser.
+    With instanced (by default on above INSTANCED_NODE_THRESHOLD visible
+    nodes), the viewer draws nodes and links as a few instanced meshes
+    instead of one Three.js object each.
+    """
 
     # Get group info for legend
     groups = data.get("groups", {})
@@ -92,7 +680,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             "groupLabel": group_info.get("label", group),
             "tier": tier,
             "logo": node.get("logo", ""),
-            "createdAt": node.get("created_at"),
+            "createdAt": normalize_created_at(node.get("created_at")),
             "physicalGroup": physical_group,
             "physicalGroupColor": physical_group_info.get("color", "#888888") if physical_group_info else None,
             "physicalGroupLabel": physical_group_info.get("label", physical_group) if physical_group_info else None,
@@ -146,11 +734,96 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             "edgeType": edge_type,  # Keep original type for filtering
         })
 
-    nodes_json = json.dumps(nodes_list)
-    links_json = json.dumps(links_list)
-    groups_json = json.dumps(groups)
-    physical_groups_json = json.dumps(physical_groups)
-    edge_styles_json = json.dumps(edge_styles)
+    # Precompute degree centrality so the viewer doesn't rescan links at runtime
+    degree = {}
+    for link in links_list:
+        degree[link["source"]] = degree.get(link["source"], 0) + 1
+        degree[link["target"]] = degree.get(link["target"], 0) + 1
+    for node in nodes_list:
+        node["degree"] = degree.get(node["id"], 0)
+    max_degree = max((n["degree"] for n in nodes_list), default=0)
+
+    if precompute_layout:
+        layouts = compute_layouts(nodes_list, links_list, iterations=layout_iterations)
+        for i, node in enumerate(nodes_list):
+            node["x"], node["y"], node["z"] = layouts["force"][i]
+            node["layoutPos"] = {name: layouts[name][i] for name in LAYOUT_NAMES}
+
+    # Full descriptions move into lazily fetched chunks in split mode; the
+    # first paint only needs id/label/group/size
+    description_chunks = []
+    if split_data:
+        for i, node in enumerate(nodes_list):
+            chunk_index = i // DESCRIPTION_CHUNK_SIZE
+            if chunk_index == len(description_chunks):
+                description_chunks.append({})
+            description = node.pop("description")
+            if description:
+                description_chunks[chunk_index][node["id"]] = description
+            node["descChunk"] = chunk_index
+
+    # Level of detail: open large graphs collapsed to the node budget. The most
+    # connected hidden members are embedded so meta-nodes expand without a round trip.
+    lod = None
+    graph_stats = compute_graph_stats(nodes_list, links_list)
+    search_nodes = nodes_list
+    if node_budget:
+        total_nodes = len(nodes_list)
+        nodes_list, links_list, lod = build_lod_graph(nodes_list, links_list, node_budget)
+        if lod:
+            print(f"LOD: {total_nodes:,} nodes -> {len(nodes_list):,} visible "
+                  f"({len(lod['members']):,} meta-nodes), {len(links_list):,} links")
+            # Search covers collapsed members too, in the order the viewer rebuilds
+            search_nodes = [node for node in nodes_list if not node.get("isLodNode")]
+            search_nodes += [node for members in lod["members"].values() for node in members]
+
+    if instanced is None:
+        instanced = len(nodes_list) > INSTANCED_NODE_THRESHOLD
+
+    # Precomputed lookups so the viewer does no full scans at startup
+    adjacency = build_adjacency(nodes_list, links_list)
+    search_index = build_search_index(search_nodes)
+
+    # Logo atlas pages ship as hashed files in split mode, data URIs otherwise
+    logo_atlas = None
+    logo_assets = {}
+    if logo_dir:
+        logo_atlas, pages = build_logo_atlas(search_nodes, logo_dir, fetch=fetch_logos)
+        logo_atlas["images"] = []
+        for page in pages:
+            if split_data:
+                name = f"logos.{content_hash(page)}.png"
+                logo_assets[name] = page
+                logo_atlas["images"].append(f"{SPLIT_DATA_DIR}/{name}")
+            else:
+                logo_atlas["images"].append("data:image/png;base64," + base64.b64encode(page).decode("ascii"))
+
+    if split_data:
+        data_js = """const nodesData = athenaData.nodes;
+        const linksData = athenaData.links;
+        const groupsData = athenaData.groups;
+        const physicalGroupsData = athenaData.physicalGroups;
+        const maxDegree = athenaData.maxDegree;
+        const descriptionChunks = athenaData.descriptionChunks;
+        const lodData = athenaData.lod;
+        const adjacencyData = athenaData.adjacency;
+        const searchIndexData = athenaData.searchIndex;
+        const graphStats = athenaData.stats;
+        const logoAtlas = athenaData.logoAtlas;
+        const instancedMode = athenaData.instanced;"""
+    else:
+        data_js = f"""const nodesData = {json.dumps(nodes_list)};
+        const linksData = {json.dumps(links_list)};
+        const groupsData = {json.dumps(groups)};
+        const physicalGroupsData = {json.dumps(physical_groups)};
+        const maxDegree = {max_degree};
+        const descriptionChunks = [];
+        const lodData = {json.dumps(lod)};
+        const adjacencyData = {json.dumps(adjacency)};
+        const searchIndexData = {json.dumps(search_index)};
+        const graphStats = {json.dumps(graph_stats)};
+        const logoAtlas = {json.dumps(logo_atlas)};
+        const instancedMode = {json.dumps(instanced)};"""
 
     # Check if physical groups are available for the view toggle
     has_physical_groups = bool(physical_groups) and any(n.get("physical_group") for n in data["nodes"])
@@ -191,8 +864,8 @@ def generate_html(data: dict[str, Any], title: str) -> str:
     ingestion_sources = data.get("ingestion_sources", {})
 
     # Pre-calculate counts for sidebar
-    node_count_str = f"{len(nodes_list):,}"
-    edge_count_str = f"{len(links_list):,}"
+    node_count_str = f"{len(data['nodes']):,}"
+    edge_count_str = f"{len(data['edges']):,}"
     embedding_backlog_str = f"{embedding_backlog:,} pending"
     backlog_status_class = "status-warning" if embedding_backlog > 0 else "status-ok"
 
@@ -1646,6 +2319,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                 <button id="vr-btn" class="vr-btn" onclick="enterVR()" disabled>VR</button>
                 <!-- Stats -->
                 <span id="stats-display" class="stats-display"></span>
+                <span id="fps-display" class="stats-display"></span>
             </div>
             <!-- Time slider (for temporal data) -->
             <div id="time-toolbar" class="toolbar-extended" style="top: 90px; display: none;">
@@ -1827,10 +2501,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
 
     <script>
         // Data
-        const nodesData = {nodes_json};
-        const linksData = {links_json};
-        const groupsData = {groups_json};
-        const physicalGroupsData = {physical_groups_json};
+        {data_js}
 
         // View mode state (logical or physical)
         let currentViewMode = 'logical';
@@ -1843,19 +2514,109 @@ def generate_html(data: dict[str, Any], title: str) -> str:
         nodesData.forEach(node => {{
             nodeMap[node.id] = node;
         }});
+        // Members hidden inside LOD meta-nodes are looked up like any other node
+        if (lodData) {{
+            Object.values(lodData.members).forEach(members => members.forEach(node => {{
+                nodeMap[node.id] = node;
+            }}));
+        }}
+
+        // Positions precomputed by generate_3d.py --precompute-layout
+        const hasPrecomputedLayout = nodesData.length > 0 && nodesData.every(n => n.layoutPos);
 
-        // Create link lookup for connections
+        // Place nodes at their precomputed positions and render them without
+        // simulation ticks. Only valid for the full node set the positions
+        // were computed for; returns false so callers fall back otherwise.
+        function applyPrecomputedLayout(nodes, layout, pinned) {{
+            if (!hasPrecomputedLayout || nodes.length !== nodesData.length || !nodes.every(n => n.layoutPos)) {{
+                return false;
+            }}
+            nodes.forEach(node => {{
+                const [x, y, z] = node.layoutPos[layout];
+                node.x = x;
+                node.y = y;
+                node.z = z;
+                node.vx = node.vy = node.vz = 0;
+                node.fx = pinned ? x : undefined;
+                node.fy = pinned ? y : undefined;
+                node.fz = pinned ? z : undefined;
+            }});
+            graph.cooldownTicks(0);  // Restored by onEngineStop
+            graph.d3ReheatSimulation();
+            if (pinned) setTimeout(() => graph.zoomToFit(500), 100);
+            return true;
+        }}
+
+        function reheatLayout() {{
+            graph.cooldownTicks(Infinity);
+            graph.d3ReheatSimulation();
+        }}
+
+        // Full descriptions for split-data builds, fetched per chunk on demand
+        const descriptionChunkLoads = {{}};
+        function loadDescriptionChunk(index) {{
+            if (!descriptionChunkLoads[index]) {{
+                descriptionChunkLoads[index] = window.athenaFetchJson(descriptionChunks[index]).then(chunk => {{
+                    Object.entries(chunk).forEach(([id, text]) => {{
+                        if (nodeMap[id]) nodeMap[id].description = text;
+                    }});
+                }});
+            }}
+            return descriptionChunkLoads[index];
+        }}
+
+        function prefetchDescriptions() {{
+            const idle = window.requestIdleCallback || (cb => setTimeout(cb, 200));
+            descriptionChunks.forEach((_, i) => idle(() => loadDescriptionChunk(i)));
+        }}
+
+        // Typed arrays embedded by the generator as {{ type, data: base64 }}
+        function decodeTypedArray(packed) {{
+            const binary = atob(packed.data);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+            return new window[packed.type](bytes.buffer);
+        }}
+
+        // Connections per node, read on demand from the generator's CSR
+        // adjacency (neighbour node indices plus the link each came from).
+        // Rebuilt from linksData once LOD meta-nodes change the visible graph.
+        let adjacency = {{
+            offsets: decodeTypedArray(adjacencyData.offsets),
+            neighbors: decodeTypedArray(adjacencyData.neighbors),
+            links: decodeTypedArray(adjacencyData.links),
+            nodeIndex: new Map(nodesData.map((node, i) => [node.id, i]))
+        }};
         const linksByNode = {{}};
-        linksData.forEach(link => {{
-            const sourceId = typeof link.source === 'object' ? link.source.id : link.source;
-            const targetId = typeof link.target === 'object' ? link.target.id : link.target;
 
-            if (!linksByNode[sourceId]) linksByNode[sourceId] = [];
-            if (!linksByNode[targetId]) linksByNode[targetId] = [];
+        function getNodeLinks(nodeId) {{
+            if (!linksByNode[nodeId] && adjacency) {{
+                const i = adjacency.nodeIndex.get(nodeId);
+                if (i === undefined) return [];
+                const row = [];
+                for (let k = adjacency.offsets[i]; k < adjacency.offsets[i + 1]; k++) {{
+                    const link = linksData[adjacency.links[k]];
+                    row.push({{ nodeId: nodesData[adjacency.neighbors[k]].id, relationType: link.relationType, edgeType: link.edgeType }});
+                }}
+                linksByNode[nodeId] = row;
+            }}
+            return linksByNode[nodeId] || [];
+        }}
+
+        function indexLinksByNode() {{
+            adjacency = null;
+            Object.keys(linksByNode).forEach(id => delete linksByNode[id]);
+            linksData.forEach(link => {{
+                const sourceId = typeof link.source === 'object' ? link.source.id : link.source;
+                const targetId = typeof link.target === 'object' ? link.target.id : link.target;
 
-            linksByNode[sourceId].push({{ nodeId: targetId, relationType: link.relationType, edgeType: link.edgeType }});
-            linksByNode[targetId].push({{ nodeId: sourceId, relationType: link.relationType, edgeType: link.edgeType }});
-        }});
+                if (!linksByNode[sourceId]) linksByNode[sourceId] = [];
+                if (!linksByNode[targetId]) linksByNode[targetId] = [];
+
+                linksByNode[sourceId].push({{ nodeId: targetId, relationType: link.relationType, edgeType: link.edgeType }});
+                linksByNode[targetId].push({{ nodeId: sourceId, relationType: link.relationType, edgeType: link.edgeType }});
+            }});
+        }}
 
         // Graph data
         const graphData = {{
@@ -1985,6 +2746,12 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             console.log('[Athena] handleNodeClick called:', node ? node.name : 'null');
             const now = Date.now();
 
+            // LOD meta-nodes expand into their members instead of selecting
+            if (node && node.isLodNode) {{
+                toggleLodNode(node.id);
+                return;
+            }}
+
             // Always select immediately on click
             selectNodeOnly(node);
 
@@ -2002,7 +2769,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
         const visibleGroups = new Set(allGroups);
 
         // Track which edge types are visible
-        const allEdgeTypes = [...new Set(linksData.map(l => l.edgeType))];
+        const allEdgeTypes = graphStats.edgeTypes;
         const visibleEdgeTypes = new Set(allEdgeTypes);
 
         // Attach event listeners to node filter chips
@@ -2176,7 +2943,6 @@ def generate_html(data: dict[str, Any], title: str) -> str:
 
             // Update count display
             const countEl = document.getElementById('date-count');
-            const nodesWithDates = nodesData.filter(n => n.createdAt).length;
             if (dateFilterFrom || dateFilterTo) {{
                 countEl.textContent = `(${{filteredNodes.length}} nodes)`;
             }} else {{
@@ -2398,6 +3164,8 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             }}, 350);
         }}
 
+        let layoutStableLogged = false;
+
         // Initialize graph
         function initGraph() {{
             const container = document.getElementById('graph');
@@ -2434,11 +3202,24 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                     node.fy = node.y;
                     node.fz = node.z;
                 }})
+                .cooldownTicks(hasPrecomputedLayout ? 0 : Infinity)
+                .onEngineStop(() => {{
+                    if (!layoutStableLogged) {{
+                        layoutStableLogged = true;
+                        console.log(`[Athena] Layout stable after ${{performance.now().toFixed(0)}} ms`);
+                    }}
+                    // Precomputed layouts render with zero ticks; later changes simulate as usual
+                    graph.cooldownTicks(Infinity);
+                }})
                 .enableNavigationControls(true);
 
             // Set initial camera position
             setTimeout(() => {{
-                graph.cameraPosition({{ x: 0, y: 0, z: 500 }});
+                if (hasPrecomputedLayout) {{
+                    graph.zoomToFit(0);
+                }} else {{
+                    graph.cameraPosition({{ x: 0, y: 0, z: 500 }});
+                }}
             }}, 100);
 
             // Disable default double-click zoom on background
@@ -2454,6 +3235,8 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                 graph.width(newWidth).height(newHeight);
             }});
 
+            if (instancedMode) initInstancedMode();
+
             // Apply labels after graph is ready
             setTimeout(() => {{
                 if (logoLabelsEnabled) {{
@@ -2470,7 +3253,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
 
         // Generate mock project/initiative data based on node and its connections
         function generateDashboardData(node) {{
-            const connections = linksByNode[node.id] || [];
+            const connections = getNodeLinks(node.id);
             const connectedNodes = connections.map(c => nodeMap[c.nodeId]).filter(Boolean);
 
             // Group connected nodes by tier to create project hierarchy
@@ -2631,7 +3414,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                     <div class="org-desc">${{node.description ? node.description.substring(0, 120) + '...' : 'Connected entity in the ecosystem with associated projects and initiatives.'}}</div>
                     <div class="org-meta">
                         <span>&#128205; Tier ${{node.tier || 0}}</span>
-                        <span>&#128279; ${{(linksByNode[node.id] || []).length}} connections</span>
+                        <span>&#128279; ${{getNodeLinks(node.id).length}} connections</span>
                         <span>&#128197; Active</span>
                     </div>
                 </div>
@@ -2751,7 +3534,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             recenteredNodeId = selectedNode.id;
 
             // Get direct connections
-            const connections = linksByNode[selectedNode.id] || [];
+            const connections = getNodeLinks(selectedNode.id);
             const neighborIds = new Set([selectedNode.id]);
             connections.forEach(conn => neighborIds.add(conn.nodeId));
 
@@ -2769,7 +3552,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                     if (explored.has(currentId)) continue;
                     explored.add(currentId);
 
-                    const nodeConnections = linksByNode[currentId] || [];
+                    const nodeConnections = getNodeLinks(currentId);
                     nodeConnections.forEach(conn => {{
                         if (conn.edgeType === 'team_member' && !explored.has(conn.nodeId)) {{
                             teamMemberIds.add(conn.nodeId);
@@ -2947,6 +3730,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
         // Navigate to a node by ID (works even if filtered out)
         function navigateToNode(nodeId) {{
             console.log('navigateToNode called with:', nodeId);
+            revealLodNode(nodeId);
 
             // First check if node is in current graph view
             const currentNodes = getGraphNodes();
@@ -3020,7 +3804,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             // Update highlighted nodes
             highlightedNodes.clear();
             highlightedNodes.add(node.id);
-            (linksByNode[node.id] || []).forEach(conn => {{
+            getNodeLinks(node.id).forEach(conn => {{
                 highlightedNodes.add(conn.nodeId);
             }});
 
@@ -3034,6 +3818,14 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             const fullDesc = node.description || 'No description available.';
             // Show truncated preview in sidebar
             descEl.textContent = fullDesc.length > 300 ? fullDesc.substring(0, 300) + '...' : fullDesc;
+            if (node.description === undefined && node.descChunk !== undefined) {{
+                descEl.textContent = 'Loading description...';
+                loadDescriptionChunk(node.descChunk).then(() => {{
+                    if (selectedNode !== node) return;
+                    const desc = node.description || 'No description available.';
+                    descEl.textContent = desc.length > 300 ? desc.substring(0, 300) + '...' : desc;
+                }});
+            }}
 
             // Show/hide view full button based on content length
             const viewFullBtn = document.getElementById('view-full-btn');
@@ -3046,6 +3838,9 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                 <span><span class="label">ID:</span> ${{node.id.substring(0, 8)}}...</span>
                 <span><span class="label">Type:</span> ${{node.groupLabel || node.group}}</span>
             `;
+            if (node.lodParent) {{
+                metaEl.innerHTML += `<span><span class="label">Cluster:</span> <a href="#" onclick="toggleLodNode('${{node.lodParent}}'); return false;">collapse</a></span>`;
+            }}
 
             // Show logo if available
             const logoEl = document.getElementById('node-logo');
@@ -3059,7 +3854,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             tierEl.className = 'node-tier';
 
             // Build connections list
-            const connections = linksByNode[node.id] || [];
+            const connections = getNodeLinks(node.id);
             const connectionsList = document.getElementById('connections');
             connectionsList.innerHTML = '';
 
@@ -3146,7 +3941,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
         function showDirectConnectionsOnly(node) {{
             // Filter to show only this node and its direct connections
             const directIds = new Set([node.id]);
-            (linksByNode[node.id] || []).forEach(conn => {{
+            getNodeLinks(node.id).forEach(conn => {{
                 directIds.add(conn.nodeId);
             }});
 
@@ -3229,6 +4024,70 @@ def generate_html(data: dict[str, Any], title: str) -> str:
         // --- Search functionality ---
         let searchTimeout = null;
 
+        // Trigram index over lowercased labels, built by the generator. Node
+        // indices refer to searchableNodes (with LOD: visible real nodes, then
+        // every meta-node's members).
+        const searchableNodes = lodData
+            ? nodesData.filter(n => !n.isLodNode).concat(...Object.values(lodData.members))
+            : nodesData.slice();
+        let searchIndex = null;
+
+        function lowerBound(keys, key) {{
+            let lo = 0, hi = keys.length;
+            while (lo < hi) {{
+                const mid = (lo + hi) >> 1;
+                if (keys[mid] < key) lo = mid + 1; else hi = mid;
+            }}
+            return lo;
+        }}
+
+        function labelCandidates(query) {{
+            if (!searchIndex) {{
+                searchIndex = {{
+                    keys: searchIndexData.keys,
+                    offsets: decodeTypedArray(searchIndexData.offsets),
+                    postings: decodeTypedArray(searchIndexData.postings)
+                }};
+            }}
+            const {{ keys, offsets, postings }} = searchIndex;
+            const row = k => postings.subarray(offsets[k], offsets[k + 1]);
+
+            if (query.length < 3) {{
+                // Two characters: union of every trigram starting with them
+                const ids = new Set();
+                for (let k = lowerBound(keys, query); k < keys.length && keys[k].startsWith(query); k++) {{
+                    row(k).forEach(i => ids.add(i));
+                }}
+                return [...ids].sort((a, b) => a - b);
+            }}
+
+            // Intersect trigram postings, smallest list first
+            const lists = [];
+            for (let j = 0; j + 3 <= query.length; j++) {{
+                const k = lowerBound(keys, query.substr(j, 3));
+                if (keys[k] !== query.substr(j, 3)) return [];
+                lists.push(row(k));
+            }}
+            lists.sort((a, b) => a.length - b.length);
+            return Array.from(lists[0]).filter(i => lists.every(list => {{
+                const at = lowerBound(list, i);
+                return list[at] === i;
+            }}));
+        }}
+
+        // Label matches come from the index; descriptions are only scanned
+        // when no label matches
+        function searchNodes(query, limit) {{
+            const results = [];
+            for (const i of labelCandidates(query)) {{
+                const node = searchableNodes[i];
+                if (node.name.toLowerCase().includes(query)) results.push(node);
+                if (results.length >= limit) return results;
+            }}
+            if (results.length > 0) return results;
+            return searchableNodes.filter(n => n.description && n.description.toLowerCase().includes(query)).slice(0, limit);
+        }}
+
         function handleSearch(event) {{
             const query = event.target.value.toLowerCase().trim();
             clearTimeout(searchTimeout);
@@ -3239,10 +4098,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             }}
 
             searchTimeout = setTimeout(() => {{
-                const results = nodesData.filter(n =>
-                    n.name.toLowerCase().includes(query) ||
-                    (n.description && n.description.toLowerCase().includes(query))
-                ).slice(0, 10);
+                const results = searchNodes(query, 10);
 
                 const resultsEl = document.getElementById('search-results');
                 resultsEl.innerHTML = results.map(n => `
@@ -3256,10 +4112,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
 
             // Handle Enter key to select first result
             if (event.key === 'Enter') {{
-                const firstResult = nodesData.find(n =>
-                    n.name.toLowerCase().includes(query) ||
-                    (n.description && n.description.toLowerCase().includes(query))
-                );
+                const firstResult = searchNodes(query, 1)[0];
                 if (firstResult) {{
                     searchSelectNode(firstResult.id);
                 }}
@@ -3285,6 +4138,323 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             navigateToNode(nodeId);
         }}
 
+        // --- Instanced rendering mode ---
+        // Large graphs (instancedMode, chosen by the generator) skip the per-node
+        // and per-link Three.js objects of 3d-force-graph. Nodes draw as one
+        // InstancedMesh per geometry, all sharing the same per-instance buffers
+        // (matrix = position and size, color, highlight), with a second
+        // InstancedMesh of billboard halos for glow and selection; links draw
+        // as one LineSegments buffer. Filtering and highlighting only rewrite
+        // those buffers: the layer watches the graph's node/link arrays and
+        // its nodeColor/nodeVal/linkColor accessors, so the existing
+        // highlight code drives it unchanged. Node dragging is not available
+        // in this mode.
+        const INSTANCED_GEOMETRIES = {{
+            sphere: () => new THREE.SphereGeometry(1, 8, 8),
+            cube: () => new THREE.BoxGeometry(1.6, 1.6, 1.6),
+            octahedron: () => new THREE.OctahedronGeometry(1.3),
+            ring: () => new THREE.TorusGeometry(1, 0.3, 6, 16)
+        }};
+        const HALO_GLOW_STRENGTH = 0.45;
+        let instancedLayer = null;
+        let instancedHoverNode = null;
+        const instancedColorCache = new Map();
+
+        function instancedColor(value) {{
+            if (!instancedColorCache.has(value)) {{
+                const color = new THREE.Color(value || '#888888');
+                instancedColorCache.set(value, [color.r, color.g, color.b]);
+            }}
+            return instancedColorCache.get(value);
+        }}
+
+        function accessorValue(accessor, obj) {{
+            return typeof accessor === 'function' ? accessor(obj) : obj[accessor];
+        }}
+
+        function initInstancedMode() {{
+            if (typeof THREE === 'undefined') {{
+                console.warn('THREE.js not available for instanced rendering');
+                return;
+            }}
+            // Logo labels need a pick object per node; off in this mode
+            logoLabelsEnabled = false;
+            const logoToggle = document.getElementById('logo-labels-toggle');
+            if (logoToggle) logoToggle.classList.remove('active');
+
+            graph
+                .nodeVisibility(false)
+                .linkVisibility(false)
+                .enableNodeDrag(false)
+                .onBackgroundClick(event => {{
+                    // Node objects are ours, so every click lands here first
+                    const node = pickInstancedNode(event);
+                    if (node) {{
+                        graph.onNodeClick()(node, event);
+                    }} else {{
+                        clearSelection();
+                    }}
+                }});
+
+            const rendererEl = graph.renderer().domElement;
+            let pendingHover = null;
+            rendererEl.addEventListener('pointermove', event => {{
+                if (pendingHover) {{
+                    pendingHover = event;
+                    return;
+                }}
+                pendingHover = event;
+                requestAnimationFrame(() => {{
+                    const node = pickInstancedNode(pendingHover);
+                    pendingHover = null;
+                    if (node !== instancedHoverNode) {{
+                        instancedHoverNode = node;
+                        rendererEl.style.cursor = node ? 'pointer' : '';
+                        rendererEl.title = node ? node.name : '';
+                    }}
+                }});
+            }});
+
+            const loop = () => {{
+                updateInstancedLayer();
+                requestAnimationFrame(loop);
+            }};
+            loop();
+        }}
+
+        function pickInstancedNode(event) {{
+            if (!instancedLayer) return null;
+            const mesh = instancedLayer.meshes[currentGeometry];
+            if (!mesh) return null;
+            const rect = graph.renderer().domElement.getBoundingClientRect();
+            const pointer = new THREE.Vector2(
+                ((event.clientX - rect.left) / rect.width) * 2 - 1,
+                -((event.clientY - rect.top) / rect.height) * 2 + 1
+            );
+            const raycaster = new THREE.Raycaster();
+            raycaster.setFromCamera(pointer, graph.camera());
+            mesh.boundingSphere = null;  // Instances move every frame
+            const hit = raycaster.intersectObject(mesh, false)[0];
+            return hit ? instancedLayer.nodes[hit.instanceId] : null;
+        }}
+
+        function createHaloMaterial() {{
+            return new THREE.ShaderMaterial({{
+                vertexShader: `
+                    attribute float instanceHighlight;
+                    varying vec3 vColor;
+                    varying float vStrength;
+                    varying vec2 vUv;
+                    void main() {{
+                        vColor = instanceColor;
+                        vStrength = instanceHighlight;
+                        vUv = uv;
+                        vec4 center = modelViewMatrix * instanceMatrix * vec4(0.0, 0.0, 0.0, 1.0);
+                        // Halo is 6x the node radius; quads without a halo collapse to a point
+                        float radius = length(instanceMatrix[0].xyz) * 6.0 * step(0.001, instanceHighlight);
+                        center.xy += position.xy * radius;
+                        gl_Position = projectionMatrix * center;
+                    }}`,
+                fragmentShader: `
+                    varying vec3 vColor;
+                    varying float vStrength;
+                    varying vec2 vUv;
+                    void main() {{
+                        float alpha = smoothstep(1.0, 0.15, length(vUv - 0.5) * 2.0) * vStrength;
+                        if (alpha < 0.01) discard;
+                        gl_FragColor = vec4(vColor * alpha, alpha);
+                    }}`,
+                transparent: true,
+                blending: THREE.AdditiveBlending,
+                depthWrite: false
+            }});
+        }}
+
+        function disposeInstancedLayer() {{
+            if (!instancedLayer) return;
+            const scene = graph.scene();
+            [...Object.values(instancedLayer.meshes), instancedLayer.halo, instancedLayer.links].forEach(obj => {{
+                if (!obj) return;
+                scene.remove(obj);
+                obj.geometry.dispose();
+                obj.material.dispose();
+            }});
+            instancedLayer = null;
+        }}
+
+        // Instances cover every loaded node; filtered-out nodes get zero scale
+        function buildInstancedLayer() {{
+            disposeInstancedLayer();
+            const nodes = nodesData.slice();
+            const count = nodes.length;
+            const matrix = new THREE.InstancedBufferAttribute(new Float32Array(count * 16), 16);
+            const color = new THREE.InstancedBufferAttribute(new Float32Array(count * 3), 3);
+            const highlight = new THREE.InstancedBufferAttribute(new Float32Array(count), 1);
+            for (let i = 0; i < count; i++) matrix.array[i * 16 + 15] = 1;
+            [matrix, color, highlight].forEach(attr => attr.setUsage(THREE.DynamicDrawUsage));
+
+            const haloGeometry = new THREE.PlaneGeometry(1, 1);
+            haloGeometry.setAttribute('instanceHighlight', highlight);
+            const halo = new THREE.InstancedMesh(haloGeometry, createHaloMaterial(), count);
+            halo.instanceMatrix = matrix;
+            halo.instanceColor = color;
+            halo.frustumCulled = false;
+            halo.renderOrder = 1;
+            graph.scene().add(halo);
+
+            const links = new THREE.LineSegments(
+                new THREE.BufferGeometry(),
+                new THREE.LineBasicMaterial({{ vertexColors: true, transparent: true, opacity: 0.6, depthWrite: false }})
+            );
+            links.frustumCulled = false;
+            graph.scene().add(links);
+
+            instancedLayer = {{
+                nodes,
+                index: new Map(nodes.map((node, i) => [node, i])),
+                radius: new Float32Array(count),
+                visible: new Uint8Array(count),
+                matrix, color, highlight, halo, links,
+                meshes: {{}},
+                graphNodes: null, graphLinks: null, linkList: [], linkEnds: [],
+                colorAccessor: null, valAccessor: null, linkColorAccessor: null, highlightKey: null
+            }};
+            console.log(`[Athena] Instanced mode: ${{count}} node instances`);
+        }}
+
+        function instancedMeshFor(geometry) {{
+            const layer = instancedLayer;
+            if (!layer.meshes[geometry]) {{
+                const mesh = new THREE.InstancedMesh(
+                    INSTANCED_GEOMETRIES[geometry](),
+                    new THREE.MeshLambertMaterial({{ transparent: true, opacity: 0.75 }}),
+                    layer.nodes.length
+                );
+                // All geometries share one set of instance buffers
+                mesh.instanceMatrix = layer.matrix;
+                mesh.instanceColor = layer.color;
+                mesh.frustumCulled = false;
+                graph.scene().add(mesh);
+                layer.meshes[geometry] = mesh;
+            }}
+            Object.entries(layer.meshes).forEach(([name, mesh]) => {{ mesh.visible = name === geometry; }});
+            return layer.meshes[geometry];
+        }}
+
+        function updateInstancedLayer() {{
+            const graphNodes = getGraphNodes();
+            const graphLinks = getGraphLinks();
+            if (!instancedLayer || (graphNodes !== instancedLayer.graphNodes && graphNodes.some(n => !instancedLayer.index.has(n)))) {{
+                buildInstancedLayer();  // LOD expansion added nodes
+            }}
+            const layer = instancedLayer;
+            instancedMeshFor(currentGeometry);
+
+            // Visibility and size: on filter changes and nodeVal changes
+            const nodesChanged = graphNodes !== layer.graphNodes;
+            if (nodesChanged) {{
+                layer.visible.fill(0);
+                graphNodes.forEach(node => {{ layer.visible[layer.index.get(node)] = 1; }});
+                layer.graphNodes = graphNodes;
+            }}
+            const valAccessor = graph.nodeVal();
+            if (nodesChanged || valAccessor !== layer.valAccessor) {{
+                const relSize = graph.nodeRelSize();
+                layer.nodes.forEach((node, i) => {{
+                    layer.radius[i] = Math.cbrt(accessorValue(valAccessor, node) || 1) * relSize;
+                }});
+                layer.valAccessor = valAccessor;
+            }}
+
+            // Color: on highlight/heat map changes
+            const colorAccessor = graph.nodeColor();
+            if (colorAccessor !== layer.colorAccessor) {{
+                const colors = layer.color.array;
+                layer.nodes.forEach((node, i) => {{
+                    colors.set(instancedColor(accessorValue(colorAccessor, node)), i * 3);
+                }});
+                layer.color.needsUpdate = true;
+                layer.colorAccessor = colorAccessor;
+            }}
+
+            // Halo strength: selection, hover, multi-select and the glow toggle
+            const highlightKey = [selectedNode, instancedHoverNode, glowEnabled, multiSelectedNodes.size, colorAccessor];
+            if (!layer.highlightKey || highlightKey.some((value, i) => value !== layer.highlightKey[i])) {{
+                const strength = layer.highlight.array;
+                strength.fill(glowEnabled ? HALO_GLOW_STRENGTH : 0);
+                multiSelectedNodes.forEach(id => {{
+                    const i = layer.index.get(nodeMap[id]);
+                    if (i !== undefined) strength[i] = 0.8;
+                }});
+                if (instancedHoverNode && layer.index.has(instancedHoverNode)) strength[layer.index.get(instancedHoverNode)] = 0.8;
+                if (selectedNode && layer.index.has(selectedNode)) strength[layer.index.get(selectedNode)] = 1;
+                layer.highlight.needsUpdate = true;
+                layer.highlightKey = highlightKey;
+            }}
+
+            // Positions every frame (the simulation moves nodes in place)
+            const m = layer.matrix.array;
+            const nodes = layer.nodes;
+            for (let i = 0, o = 0; i < nodes.length; i++, o += 16) {{
+                const node = nodes[i];
+                const r = layer.visible[i] ? layer.radius[i] : 0;
+                m[o] = r;
+                m[o + 5] = r;
+                m[o + 10] = r;
+                m[o + 12] = node.x || 0;
+                m[o + 13] = node.y || 0;
+                m[o + 14] = node.z || 0;
+            }}
+            layer.matrix.needsUpdate = true;
+
+            updateInstancedLinks(graphLinks);
+        }}
+
+        function updateInstancedLinks(graphLinks) {{
+            const layer = instancedLayer;
+            const geometry = layer.links.geometry;
+            const linkColorAccessor = graph.linkColor();
+            if (graphLinks !== layer.graphLinks) {{
+                layer.linkList = graphLinks;
+                layer.linkEnds = [];
+                geometry.setAttribute('position', new THREE.BufferAttribute(new Float32Array(graphLinks.length * 6), 3).setUsage(THREE.DynamicDrawUsage));
+                geometry.setAttribute('color', new THREE.BufferAttribute(new Float32Array(graphLinks.length * 6), 3));
+                layer.graphLinks = graphLinks;
+                layer.linkColorAccessor = null;
+            }}
+            if (linkColorAccessor !== layer.linkColorAccessor) {{
+                const colors = geometry.getAttribute('color').array;
+                layer.linkList.forEach((link, i) => {{
+                    const rgb = instancedColor(accessorValue(linkColorAccessor, link));
+                    colors.set(rgb, i * 6);
+                    colors.set(rgb, i * 6 + 3);
+                }});
+                geometry.getAttribute('color').needsUpdate = true;
+                layer.linkColorAccessor = linkColorAccessor;
+            }}
+            // Endpoints resolved once: the force engine swaps ids for node
+            // objects on its first tick, nodeMap covers the frames before that
+            if (!layer.linkEnds.length && layer.linkList.length) {{
+                layer.linkEnds = layer.linkList.map(link => [
+                    typeof link.source === 'object' ? link.source : nodeMap[link.source],
+                    typeof link.target === 'object' ? link.target : nodeMap[link.target]
+                ]);
+            }}
+            const positions = geometry.getAttribute('position').array;
+            const ends = layer.linkEnds;
+            for (let i = 0, o = 0; i < ends.length; i++, o += 6) {{
+                const [source, target] = ends[i];
+                if (!source || !target) continue;
+                positions[o] = source.x || 0;
+                positions[o + 1] = source.y || 0;
+                positions[o + 2] = source.z || 0;
+                positions[o + 3] = target.x || 0;
+                positions[o + 4] = target.y || 0;
+                positions[o + 5] = target.z || 0;
+            }}
+            geometry.getAttribute('position').needsUpdate = true;
+        }}
+
         // --- Node geometry ---
         function setNodeGeometry(geometry) {{
             currentGeometry = geometry;
@@ -3293,6 +4463,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             document.querySelectorAll('.geometry-chip').forEach(chip => {{
                 chip.classList.toggle('active', chip.dataset.geometry === geometry);
             }});
+            if (instancedMode) return;  // updateInstancedLayer switches meshes
 
             // Apply custom geometry via nodeThreeObject
             if (geometry === 'sphere') {{
@@ -3310,6 +4481,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
         function toggleGlow() {{
             glowEnabled = !glowEnabled;
             document.getElementById('glow-toggle').classList.toggle('active', glowEnabled);
+            if (instancedMode) return;  // Halo strength lives in the instance buffers
 
             if (glowEnabled) {{
                 // Simulate glow with sprites around nodes
@@ -3417,6 +4589,10 @@ def generate_html(data: dict[str, Any], title: str) -> str:
 
         // --- Logo + Label node rendering ---
         function toggleLogoLabels() {{
+            if (instancedMode) {{
+                console.warn('Logo labels are not available in instanced mode');
+                return;
+            }}
             logoLabelsEnabled = !logoLabelsEnabled;
             const toggle = document.getElementById('logo-labels-toggle');
             if (toggle) toggle.classList.toggle('active', logoLabelsEnabled);
@@ -3436,64 +4612,43 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                 return;
             }}
 
-            // Create a sprite that contains both logo and label
-            // Using extend=false to REPLACE the default sphere with our custom sprite
+            if (logoAtlas) {{
+                // Logos and labels are drawn by the instanced layer; each node only
+                // gets an invisible pick proxy. extend=false replaces the default sphere.
+                graph.nodeThreeObject(logoProxyObject);
+                graph.nodeThreeObjectExtend(false);
+                startLogoLayer();
+                return;
+            }}
+
+            // No atlas (generated without --logo-dir): one sprite per node with
+            // its logo and label. extend=false replaces the default sphere.
             graph.nodeThreeObject(node => {{
                 const size = Math.max(node.val / 5, 3) * 2;
-
-                // Create a combined sprite with logo (if available) and label
-                const sprite = createLogoLabelSprite(node.name, node.color, node.logo, size, node.group);
-                return sprite;
+                return createLogoLabelSprite(node.name, node.color, node.logo, size);
             }});
-
-            // extend=false replaces the default sphere entirely
             graph.nodeThreeObjectExtend(false);
         }}
 
         // Create a single sprite with logo and label combined
-        // Default icons for nodes without logos (by group/category)
-        // Default icons using Google Material Icons (reliable, consistent style)
-        // These are base64 SVG data URIs for guaranteed loading
-        const defaultIcons = {{
-            'hub': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><linearGradient id="g" x1="0%" y1="0%" x2="100%" y2="100%"><stop offset="0%" stop-color="#dd6b20"/><stop offset="100%" stop-color="#c05621"/></linearGradient></defs><circle cx="50" cy="50" r="48" fill="url(#g)"/><path d="M25 30h50v8H35v12h35v8H35v12h40v8H25z" fill="white"/></svg>'),
-            'output': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M19 3H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zM9 17H7v-7h2v7zm4 0h-2V7h2v10zm4 0h-2v-4h2v4z"/></svg>'),
-            'account': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M16 11c1.66 0 2.99-1.34 2.99-3S17.66 5 16 5c-1.66 0-3 1.34-3 3s1.34 3 3 3zm-8 0c1.66 0 2.99-1.34 2.99-3S9.66 5 8 5C6.34 5 5 6.34 5 8s1.34 3 3 3zm0 2c-2.33 0-7 1.17-7 3.5V19h14v-2.5c0-2.33-4.67-3.5-7-3.5zm8 0c-.29 0-.62.02-.97.05 1.16.84 1.97 1.97 1.97 3.45V19h6v-2.5c0-2.33-4.67-3.5-7-3.5z"/></svg>'),
-            'client_data': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M12 3C7.58 3 4 4.79 4 7v10c0 2.21 3.58 4 8 4s8-1.79 8-4V7c0-2.21-3.58-4-8-4zm0 2c3.87 0 6 1.5 6 2s-2.13 2-6 2-6-1.5-6-2 2.13-2 6-2zm6 12c0 .5-2.13 2-6 2s-6-1.5-6-2v-2.23c1.61.78 3.72 1.23 6 1.23s4.39-.45 6-1.23V17zm0-5c0 .5-2.13 2-6 2s-6-1.5-6-2V9.77c1.61.78 3.72 1.23 6 1.23s4.39-.45 6-1.23V12z"/></svg>'),
-            'audience': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M12 12.75c1.63 0 3.07.39 4.24.9 1.08.48 1.76 1.56 1.76 2.73V18H6v-1.61c0-1.18.68-2.26 1.76-2.73 1.17-.52 2.61-.91 4.24-.91zM4 13c1.1 0 2-.9 2-2s-.9-2-2-2-2 .9-2 2 .9 2 2 2zm1.13 1.1c-.37-.06-.74-.1-1.13-.1-.99 0-1.93.21-2.78.58C.48 14.9 0 15.62 0 16.43V18h4.5v-1.61c0-.83.23-1.61.63-2.29zM20 13c1.1 0 2-.9 2-2s-.9-2-2-2-2 .9-2 2 .9 2 2 2zm4 3.43c0-.81-.48-1.53-1.22-1.85-.85-.37-1.79-.58-2.78-.58-.39 0-.76.04-1.13.1.4.68.63 1.46.63 2.29V18H24v-1.57zM12 6c1.66 0 3 1.34 3 3s-1.34 3-3 3-3-1.34-3-3 1.34-3 3-3z"/></svg>'),
-            'consumer_data': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-1 17.93c-3.95-.49-7-3.85-7-7.93 0-.62.08-1.21.21-1.79L9 15v1c0 1.1.9 2 2 2v1.93zm6.9-2.54c-.26-.81-1-1.39-1.9-1.39h-1v-3c0-.55-.45-1-1-1H8v-2h2c.55 0 1-.45 1-1V7h2c1.1 0 2-.9 2-2v-.41c2.93 1.19 5 4.06 5 7.41 0 2.08-.8 3.97-2.1 5.39z"/></svg>'),
-            'media_planning': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M19 4h-1V2h-2v2H8V2H6v2H5c-1.11 0-1.99.9-1.99 2L3 20c0 1.1.89 2 2 2h14c1.1 0 2-.9 2-2V6c0-1.1-.9-2-2-2zm0 16H5V9h14v11zM9 11H7v2h2v-2zm4 0h-2v2h2v-2zm4 0h-2v2h2v-2zm-8 4H7v2h2v-2zm4 0h-2v2h2v-2zm4 0h-2v2h2v-2z"/></svg>'),
-            'activation': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M13 2.05v3.03c3.39.49 6 3.39 6 6.92 0 .9-.18 1.75-.48 2.54l2.6 1.53c.56-1.24.88-2.62.88-4.07 0-5.18-3.95-9.45-9-9.95zM12 19c-3.87 0-7-3.13-7-7 0-3.53 2.61-6.43 6-6.92V2.05c-5.06.5-9 4.76-9 9.95 0 5.52 4.47 10 9.99 10 3.31 0 6.24-1.61 8.06-4.09l-2.6-1.53C16.17 17.98 14.21 19 12 19z"/></svg>'),
-            'dsp': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M4 6h18V4H4c-1.1 0-2 .9-2 2v11H0v3h14v-3H4V6zm19 2h-6c-.55 0-1 .45-1 1v10c0 .55.45 1 1 1h6c.55 0 1-.45 1-1V9c0-.55-.45-1-1-1zm-1 9h-4v-7h4v7z"/></svg>'),
-            'digital_media': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M21 3H3c-1.1 0-2 .9-2 2v12c0 1.1.9 2 2 2h5v2h8v-2h5c1.1 0 1.99-.9 1.99-2L23 5c0-1.1-.9-2-2-2zm0 14H3V5h18v12zm-5-6l-7 4V7z"/></svg>'),
-            'flight': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-2 15l-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8l-9 9z"/></svg>'),
-            'finance': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M11.8 10.9c-2.27-.59-3-1.2-3-2.15 0-1.09 1.01-1.85 2.7-1.85 1.78 0 2.44.85 2.5 2.1h2.21c-.07-1.72-1.12-3.3-3.21-3.81V3h-3v2.16c-1.94.42-3.5 1.68-3.5 3.61 0 2.31 1.91 3.46 4.7 4.13 2.5.6 3 1.48 3 2.41 0 .69-.49 1.79-2.7 1.79-2.06 0-2.87-.92-2.98-2.1h-2.2c.12 2.19 1.76 3.42 3.68 3.83V21h3v-2.15c1.95-.37 3.5-1.5 3.5-3.55 0-2.84-2.43-3.81-4.7-4.4z"/></svg>'),
-            'default': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><circle cx="12" cy="12" r="8"/></svg>')
-        }};
-
-        function createLogoLabelSprite(name, color, logoUrl, nodeSize, group) {{
+        function createLogoLabelSprite(name, color, logoUrl, nodeSize) {{
             const canvas = document.createElement('canvas');
             const ctx = canvas.getContext('2d');
             // Higher resolution for crisp logos
             canvas.width = 256;
             canvas.height = 320;
 
-            // Start with fully transparent background
-            ctx.clearRect(0, 0, canvas.width, canvas.height);
-
             // Draw label below (scaled for higher res canvas)
             ctx.font = 'bold 28px -apple-system, BlinkMacSystemFont, sans-serif';
             ctx.fillStyle = '#ffffff';
             ctx.textAlign = 'center';
             ctx.textBaseline = 'top';
-
-            // Truncate text if too long
             let displayText = name;
             while (ctx.measureText(displayText).width > 240 && displayText.length > 3) {{
                 displayText = displayText.slice(0, -4) + '...';
             }}
             ctx.fillText(displayText, 128, 240);
 
-            // If logo URL provided, load it and update the sprite
             const texture = new THREE.CanvasTexture(canvas);
             const spriteMat = new THREE.SpriteMaterial({{
                 map: texture,
@@ -3505,102 +4660,319 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             sprite.scale.set(nodeSize * 3, nodeSize * 3.75, 1);
             sprite.renderOrder = 1000;  // High render order ensures sprites render after edges
 
-            // Draw colored circle as fallback (will be covered by logo if loaded)
-            // Scaled for 256x320 canvas (center at 128, 120)
+            // Colored circle with initials as fallback (covered by the logo once loaded)
             ctx.beginPath();
             ctx.arc(128, 120, 96, 0, Math.PI * 2);
             ctx.fillStyle = color;
             ctx.fill();
-
-            // Draw initials as fallback
             const initials = name.split(/[\\s\\-\\/]+/).filter(w => w.length > 0).slice(0, 2).map(w => w[0]).join('').toUpperCase();
             ctx.font = 'bold 64px -apple-system, BlinkMacSystemFont, sans-serif';
             ctx.fillStyle = '#ffffff';
-            ctx.textAlign = 'center';
             ctx.textBaseline = 'middle';
             ctx.fillText(initials, 128, 120);
+            texture.needsUpdate = true;
 
             // Only use logo if explicitly provided - no default icons
-            // This ensures only Zeus Memory hub and management team get logos
-            let finalLogoUrl = logoUrl || null;
-
-            // If we have a logo URL, try to load and overlay it
-            if (finalLogoUrl) {{
-                const img = new Image();
-                img.crossOrigin = 'anonymous';
-
-                // Use weserv.nl image proxy for CORS support (but not for data URIs)
-                let proxiedUrl = finalLogoUrl;
-                if (!finalLogoUrl.startsWith('data:')) {{
-                    try {{
-                        const urlObj = new URL(finalLogoUrl);
-                        // Remove protocol and use weserv.nl proxy
-                        const urlWithoutProtocol = urlObj.host + urlObj.pathname + urlObj.search;
-                        proxiedUrl = 'https://images.weserv.nl/?url=' + encodeURIComponent(urlWithoutProtocol);
-                    }} catch (e) {{
-                        console.warn('Invalid logo URL:', finalLogoUrl);
-                    }}
-                }}
-
-                img.onload = () => {{
-                    // Clear the logo area for transparent background
+            if (logoUrl) {{
+                loadLightenedLogo(logoUrl).then(logoCanvas => {{
+                    if (!logoCanvas) return;
                     ctx.clearRect(0, 0, 256, 220);
-
-                    // Draw image to temp canvas first to analyze and optionally invert
-                    const tmpCanvas = document.createElement('canvas');
-                    tmpCanvas.width = 192;
-                    tmpCanvas.height = 192;
-                    const tmpCtx = tmpCanvas.getContext('2d');
-                    tmpCtx.drawImage(img, 0, 0, 192, 192);
-
-                    // Sample pixel brightness of non-transparent areas
-                    const imgData = tmpCtx.getImageData(0, 0, 192, 192);
-                    const px = imgData.data;
-                    let totalBrightness = 0;
-                    let opaqueCount = 0;
-                    for (let i = 0; i < px.length; i += 16) {{  // Sample every 4th pixel
-                        if (px[i + 3] > 50) {{
-                            totalBrightness += (px[i] + px[i+1] + px[i+2]) / 3;
-                            opaqueCount++;
-                        }}
-                    }}
-                    const avgBright = opaqueCount > 0 ? totalBrightness / opaqueCount : 128;
-
-                    // If dark icon, invert pixels to make them light grey
-                    if (avgBright < 80) {{
-                        for (let i = 0; i < px.length; i += 4) {{
-                            if (px[i + 3] > 0) {{
-                                px[i]     = Math.min(255, 255 - px[i] + 40);     // R
-                                px[i + 1] = Math.min(255, 255 - px[i+1] + 40);   // G
-                                px[i + 2] = Math.min(255, 255 - px[i+2] + 40);   // B
-                            }}
-                        }}
-                        tmpCtx.putImageData(imgData, 0, 0);
-                        console.log('Brightened dark icon for:', name, 'avg:', Math.round(avgBright));
-                    }}
-
-                    // Draw processed logo with circular clip
                     ctx.save();
                     ctx.beginPath();
                     ctx.arc(128, 120, 96, 0, Math.PI * 2);
                     ctx.clip();
-                    ctx.drawImage(tmpCanvas, 32, 24, 192, 192);
+                    ctx.drawImage(logoCanvas, 32, 24, 192, 192);
                     ctx.restore();
-
-                    texture.needsUpdate = true;
-                    console.log('Logo loaded for:', name);
-                }};
-                img.onerror = (e) => {{
-                    console.warn('Failed to load logo for', name, ':', proxiedUrl, e);
-                    // Initials already drawn, just update texture
                     texture.needsUpdate = true;
-                }};
-                img.src = proxiedUrl;
+                }});
+            }}
+            return sprite;
+        }}
+
+        // Default icons for nodes without logos (by group/category)
+        // Default icons using Google Material Icons (reliable, consistent style)
+        // These are base64 SVG data URIs for guaranteed loading
+        const defaultIcons = {{
+            'hub': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100"><defs><linearGradient id="g" x1="0%" y1="0%" x2="100%" y2="100%"><stop offset="0%" stop-color="#dd6b20"/><stop offset="100%" stop-color="#c05621"/></linearGradient></defs><circle cx="50" cy="50" r="48" fill="url(#g)"/><path d="M25 30h50v8H35v12h35v8H35v12h40v8H25z" fill="white"/></svg>'),
+            'output': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M19 3H5c-1.1 0-2 .9-2 2v14c0 1.1.9 2 2 2h14c1.1 0 2-.9 2-2V5c0-1.1-.9-2-2-2zM9 17H7v-7h2v7zm4 0h-2V7h2v10zm4 0h-2v-4h2v4z"/></svg>'),
+            'account': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M16 11c1.66 0 2.99-1.34 2.99-3S17.66 5 16 5c-1.66 0-3 1.34-3 3s1.34 3 3 3zm-8 0c1.66 0 2.99-1.34 2.99-3S9.66 5 8 5C6.34 5 5 6.34 5 8s1.34 3 3 3zm0 2c-2.33 0-7 1.17-7 3.5V19h14v-2.5c0-2.33-4.67-3.5-7-3.5zm8 0c-.29 0-.62.02-.97.05 1.16.84 1.97 1.97 1.97 3.45V19h6v-2.5c0-2.33-4.67-3.5-7-3.5z"/></svg>'),
+            'client_data': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M12 3C7.58 3 4 4.79 4 7v10c0 2.21 3.58 4 8 4s8-1.79 8-4V7c0-2.21-3.58-4-8-4zm0 2c3.87 0 6 1.5 6 2s-2.13 2-6 2-6-1.5-6-2 2.13-2 6-2zm6 12c0 .5-2.13 2-6 2s-6-1.5-6-2v-2.23c1.61.78 3.72 1.23 6 1.23s4.39-.45 6-1.23V17zm0-5c0 .5-2.13 2-6 2s-6-1.5-6-2V9.77c1.61.78 3.72 1.23 6 1.23s4.39-.45 6-1.23V12z"/></svg>'),
+            'audience': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M12 12.75c1.63 0 3.07.39 4.24.9 1.08.48 1.76 1.56 1.76 2.73V18H6v-1.61c0-1.18.68-2.26 1.76-2.73 1.17-.52 2.61-.91 4.24-.91zM4 13c1.1 0 2-.9 2-2s-.9-2-2-2-2 .9-2 2 .9 2 2 2zm1.13 1.1c-.37-.06-.74-.1-1.13-.1-.99 0-1.93.21-2.78.58C.48 14.9 0 15.62 0 16.43V18h4.5v-1.61c0-.83.23-1.61.63-2.29zM20 13c1.1 0 2-.9 2-2s-.9-2-2-2-2 .9-2 2 .9 2 2 2zm4 3.43c0-.81-.48-1.53-1.22-1.85-.85-.37-1.79-.58-2.78-.58-.39 0-.76.04-1.13.1.4.68.63 1.46.63 2.29V18H24v-1.57zM12 6c1.66 0 3 1.34 3 3s-1.34 3-3 3-3-1.34-3-3 1.34-3 3-3z"/></svg>'),
+            'consumer_data': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-1 17.93c-3.95-.49-7-3.85-7-7.93 0-.62.08-1.21.21-1.79L9 15v1c0 1.1.9 2 2 2v1.93zm6.9-2.54c-.26-.81-1-1.39-1.9-1.39h-1v-3c0-.55-.45-1-1-1H8v-2h2c.55 0 1-.45 1-1V7h2c1.1 0 2-.9 2-2v-.41c2.93 1.19 5 4.06 5 7.41 0 2.08-.8 3.97-2.1 5.39z"/></svg>'),
+            'media_planning': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M19 4h-1V2h-2v2H8V2H6v2H5c-1.11 0-1.99.9-1.99 2L3 20c0 1.1.89 2 2 2h14c1.1 0 2-.9 2-2V6c0-1.1-.9-2-2-2zm0 16H5V9h14v11zM9 11H7v2h2v-2zm4 0h-2v2h2v-2zm4 0h-2v2h2v-2zm-8 4H7v2h2v-2zm4 0h-2v2h2v-2zm4 0h-2v2h2v-2z"/></svg>'),
+            'activation': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M13 2.05v3.03c3.39.49 6 3.39 6 6.92 0 .9-.18 1.75-.48 2.54l2.6 1.53c.56-1.24.88-2.62.88-4.07 0-5.18-3.95-9.45-9-9.95zM12 19c-3.87 0-7-3.13-7-7 0-3.53 2.61-6.43 6-6.92V2.05c-5.06.5-9 4.76-9 9.95 0 5.52 4.47 10 9.99 10 3.31 0 6.24-1.61 8.06-4.09l-2.6-1.53C16.17 17.98 14.21 19 12 19z"/></svg>'),
+            'dsp': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M4 6h18V4H4c-1.1 0-2 .9-2 2v11H0v3h14v-3H4V6zm19 2h-6c-.55 0-1 .45-1 1v10c0 .55.45 1 1 1h6c.55 0 1-.45 1-1V9c0-.55-.45-1-1-1zm-1 9h-4v-7h4v7z"/></svg>'),
+            'digital_media': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M21 3H3c-1.1 0-2 .9-2 2v12c0 1.1.9 2 2 2h5v2h8v-2h5c1.1 0 1.99-.9 1.99-2L23 5c0-1.1-.9-2-2-2zm0 14H3V5h18v12zm-5-6l-7 4V7z"/></svg>'),
+            'flight': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M12 2C6.48 2 2 6.48 2 12s4.48 10 10 10 10-4.48 10-10S17.52 2 12 2zm-2 15l-5-5 1.41-1.41L10 14.17l7.59-7.59L19 8l-9 9z"/></svg>'),
+            'finance': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><path d="M11.8 10.9c-2.27-.59-3-1.2-3-2.15 0-1.09 1.01-1.85 2.7-1.85 1.78 0 2.44.85 2.5 2.1h2.21c-.07-1.72-1.12-3.3-3.21-3.81V3h-3v2.16c-1.94.42-3.5 1.68-3.5 3.61 0 2.31 1.91 3.46 4.7 4.13 2.5.6 3 1.48 3 2.41 0 .69-.49 1.79-2.7 1.79-2.06 0-2.87-.92-2.98-2.1h-2.2c.12 2.19 1.76 3.42 3.68 3.83V21h3v-2.15c1.95-.37 3.5-1.5 3.5-3.55 0-2.84-2.43-3.81-4.7-4.4z"/></svg>'),
+            'default': 'data:image/svg+xml,' + encodeURIComponent('<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 24 24" fill="#9E9E9E"><circle cx="12" cy="12" r="8"/></svg>')
+        }};
+
+        // --- Instanced logo + label layer ---
+        // Each node's logo (or initials) circle and label is drawn once into a
+        // cell of a shared canvas page, and every page renders as one
+        // InstancedMesh of camera-facing quads: one texture upload and one
+        // draw call per page instead of per node. Used when the generator
+        // built a logo atlas (--logo-dir); logos missing from the atlas are
+        // fetched once per distinct URL.
+        const LOGO_CELL_WIDTH = 128;
+        const LOGO_CELL_HEIGHT = 160;
+        const LOGO_PAGE_SIZE = 2048;
+        const LOGO_PAGE_COLUMNS = LOGO_PAGE_SIZE / LOGO_CELL_WIDTH;
+        const LOGO_PAGE_ROWS = Math.floor(LOGO_PAGE_SIZE / LOGO_CELL_HEIGHT);
+        let logoLayer = null;
+        let logoLayerRunning = false;
+        let logoPickGeometry = null;
+        let logoPickMaterial = null;
+        const logoAtlasPages = new Map();
+        const lightenedLogos = new Map();
+
+        // Invisible (no draw call) but raycastable stand-in, so hover and
+        // click keep working through 3d-force-graph
+        function logoProxyObject(node) {{
+            if (!logoPickGeometry) {{
+                logoPickGeometry = new THREE.SphereGeometry(1, 8, 8);
+                logoPickMaterial = new THREE.MeshBasicMaterial({{ visible: false }});
+            }}
+            const mesh = new THREE.Mesh(logoPickGeometry, logoPickMaterial);
+            mesh.scale.setScalar(Math.max(node.val / 5, 3) * 2 * 1.4);
+            return mesh;
+        }}
+
+        function createLogoPageMaterial(texture) {{
+            return new THREE.ShaderMaterial({{
+                uniforms: {{ map: {{ value: texture }} }},
+                vertexShader: `
+                    attribute vec4 uvRect;
+                    varying vec2 vUv;
+                    void main() {{
+                        vUv = mix(uvRect.xy, uvRect.zw, uv);
+                        vec4 center = modelViewMatrix * instanceMatrix * vec4(0.0, 0.0, 0.0, 1.0);
+                        center.xy += position.xy * vec2(length(instanceMatrix[0].xyz), length(instanceMatrix[1].xyz));
+                        gl_Position = projectionMatrix * center;
+                    }}`,
+                fragmentShader: `
+                    uniform sampler2D map;
+                    varying vec2 vUv;
+                    void main() {{
+                        vec4 color = texture2D(map, vUv);
+                        if (color.a < 0.02) discard;
+                        gl_FragColor = color;
+                    }}`,
+                transparent: true,
+                depthTest: false,  // Always on top of edges, like the old sprites
+                depthWrite: false
+            }});
+        }}
+
+        function disposeLogoLayer() {{
+            if (!logoLayer) return;
+            logoLayer.pages.forEach(page => {{
+                graph.scene().remove(page.mesh);
+                page.mesh.geometry.dispose();
+                page.mesh.material.dispose();
+                page.texture.dispose();
+            }});
+            logoLayer = null;
+        }}
+
+        function buildLogoLayer(nodes) {{
+            disposeLogoLayer();
+            const perPage = LOGO_PAGE_COLUMNS * LOGO_PAGE_ROWS;
+            const pages = [];
+            for (let start = 0; start < nodes.length; start += perPage) {{
+                const pageNodes = nodes.slice(start, start + perPage);
+                const canvas = document.createElement('canvas');
+                canvas.width = LOGO_PAGE_SIZE;
+                canvas.height = Math.ceil(pageNodes.length / LOGO_PAGE_COLUMNS) * LOGO_CELL_HEIGHT;
+                const ctx = canvas.getContext('2d');
+                const texture = new THREE.CanvasTexture(canvas);
+
+                const uvRects = new Float32Array(pageNodes.length * 4);
+                const geometry = new THREE.PlaneGeometry(1, 1);
+                const mesh = new THREE.InstancedMesh(geometry, createLogoPageMaterial(texture), pageNodes.length);
+                pageNodes.forEach((node, i) => {{
+                    const x = (i % LOGO_PAGE_COLUMNS) * LOGO_CELL_WIDTH;
+                    const y = Math.floor(i / LOGO_PAGE_COLUMNS) * LOGO_CELL_HEIGHT;
+                    drawLogoLabelCell(ctx, x, y, node, () => {{ texture.needsUpdate = true; }});
+                    // Canvas rows grow downwards, texture v upwards
+                    uvRects.set([
+                        x / canvas.width, 1 - (y + LOGO_CELL_HEIGHT) / canvas.height,
+                        (x + LOGO_CELL_WIDTH) / canvas.width, 1 - y / canvas.height
+                    ], i * 4);
+                    const size = Math.max(node.val / 5, 3) * 2;
+                    mesh.instanceMatrix.array.set([size * 3, 0, 0, 0, 0, size * 3.75, 0, 0, 0, 0, 1, 0, 0, 0, 0, 1], i * 16);
+                }});
+                geometry.setAttribute('uvRect', new THREE.InstancedBufferAttribute(uvRects, 4));
+                mesh.frustumCulled = false;
+                mesh.renderOrder = 1000;
+                graph.scene().add(mesh);
+                pages.push({{ mesh, texture, nodes: pageNodes }});
+            }}
+            logoLayer = {{ nodes, pages }};
+            console.log(`[Athena] Logo layer: ${{nodes.length}} nodes in ${{pages.length}} instanced page(s)`);
+            setTimeout(() => {{
+                console.log(`[Athena] Draw calls per frame: ${{graph.renderer().info.render.calls}}`);
+            }}, 1000);
+        }}
+
+        // Follow node positions; rebuild when the visible node set changes
+        function updateLogoLayer() {{
+            const active = logoLabelsEnabled && graph.nodeThreeObject() === logoProxyObject;
+            if (!active) {{
+                disposeLogoLayer();
+                return;
+            }}
+            const nodes = getGraphNodes();
+            if (!logoLayer || logoLayer.nodes !== nodes) buildLogoLayer(nodes);
+            // Only upload pages whose nodes moved since the last frame
+            logoLayer.pages.forEach(page => {{
+                const matrices = page.mesh.instanceMatrix.array;
+                let moved = false;
+                page.nodes.forEach((node, i) => {{
+                    // Stored as float32, so compare rounded values
+                    const x = Math.fround(node.x || 0), y = Math.fround(node.y || 0), z = Math.fround(node.z || 0);
+                    const at = i * 16 + 12;
+                    if (matrices[at] === x && matrices[at + 1] === y && matrices[at + 2] === z) return;
+                    matrices[at] = x;
+                    matrices[at + 1] = y;
+                    matrices[at + 2] = z;
+                    moved = true;
+                }});
+                if (moved) page.mesh.instanceMatrix.needsUpdate = true;
+            }});
+        }}
+
+        function startLogoLayer() {{
+            if (logoLayerRunning) return;
+            logoLayerRunning = true;
+            const loop = () => {{
+                updateLogoLayer();
+                requestAnimationFrame(loop);
+            }};
+            loop();
+        }}
+
+        function drawLogoLabelCell(ctx, x, y, node, onUpdate) {{
+            const cx = x + LOGO_CELL_WIDTH / 2;
+            const cy = y + 60;
+            const radius = 48;
+
+            // Colored circle with initials as fallback (covered by the logo once loaded)
+            ctx.beginPath();
+            ctx.arc(cx, cy, radius, 0, Math.PI * 2);
+            ctx.fillStyle = node.color;
+            ctx.fill();
+            const initials = node.name.split(/[\\s\\-\\/]+/).filter(w => w.length > 0).slice(0, 2).map(w => w[0]).join('').toUpperCase();
+            ctx.font = 'bold 32px -apple-system, BlinkMacSystemFont, sans-serif';
+            ctx.fillStyle = '#ffffff';
+            ctx.textAlign = 'center';
+            ctx.textBaseline = 'middle';
+            ctx.fillText(initials, cx, cy);
+
+            // Label below
+            ctx.font = 'bold 14px -apple-system, BlinkMacSystemFont, sans-serif';
+            ctx.textBaseline = 'top';
+            let displayText = node.name;
+            while (ctx.measureText(displayText).width > LOGO_CELL_WIDTH - 8 && displayText.length > 3) {{
+                displayText = displayText.slice(0, -4) + '...';
+            }}
+            ctx.fillText(displayText, cx, y + 120);
+
+            // Only use logo if explicitly provided - no default icons
+            if (!node.logo) return;
+            const drawLogo = (image, sx, sy, size) => {{
+                ctx.save();
+                ctx.beginPath();
+                ctx.arc(cx, cy, radius, 0, Math.PI * 2);
+                ctx.clip();
+                ctx.clearRect(cx - radius, cy - radius, radius * 2, radius * 2);
+                ctx.drawImage(image, sx, sy, size, size, cx - radius, cy - radius, radius * 2, radius * 2);
+                ctx.restore();
+                onUpdate();
+            }};
+            const entry = logoAtlas && logoAtlas.entries[node.logo];
+            if (entry) {{
+                loadLogoAtlasPage(entry[0]).then(image => {{
+                    if (image) drawLogo(image, entry[1], entry[2], logoAtlas.cell);
+                }});
             }} else {{
-                texture.needsUpdate = true;
+                loadLightenedLogo(node.logo).then(logoCanvas => {{
+                    if (logoCanvas) drawLogo(logoCanvas, 0, 0, logoCanvas.width);
+                }});
             }}
+        }}
 
-            return sprite;
+        function loadLogoAtlasPage(index) {{
+            if (!logoAtlasPages.has(index)) {{
+                logoAtlasPages.set(index, new Promise(resolve => {{
+                    const img = new Image();
+                    img.onload = () => resolve(img);
+                    img.onerror = () => {{
+                        console.warn('Failed to load logo atlas page', index);
+                        resolve(null);
+                    }};
+                    img.src = logoAtlas.images[index];
+                }}));
+            }}
+            return logoAtlasPages.get(index);
+        }}
+
+        // Use weserv.nl image proxy for CORS support (but not for data URIs)
+        function proxiedLogoUrl(logoUrl) {{
+            if (logoUrl.startsWith('data:')) return logoUrl;
+            try {{
+                const urlObj = new URL(logoUrl);
+                return 'https://images.weserv.nl/?url=' + encodeURIComponent(urlObj.host + urlObj.pathname + urlObj.search);
+            }} catch (e) {{
+                console.warn('Invalid logo URL:', logoUrl);
+                return logoUrl;
+            }}
+        }}
+
+        // Remote logo as a 192px canvas; dark icons are inverted to light grey
+        // (generate_3d.py applies the same step to atlas logos offline)
+        function loadLightenedLogo(logoUrl) {{
+            if (lightenedLogos.has(logoUrl)) return lightenedLogos.get(logoUrl);
+            const promise = loadLogoTexture(proxiedLogoUrl(logoUrl)).then(texture => {{
+                if (!texture) {{
+                    console.warn('Failed to load logo:', logoUrl);
+                    return null;
+                }}
+                const tmpCanvas = document.createElement('canvas');
+                tmpCanvas.width = 192;
+                tmpCanvas.height = 192;
+                const tmpCtx = tmpCanvas.getContext('2d');
+                tmpCtx.drawImage(texture.image, 0, 0, 192, 192);
+
+                // Sample pixel brightness of non-transparent areas
+                const imgData = tmpCtx.getImageData(0, 0, 192, 192);
+                const px = imgData.data;
+                let totalBrightness = 0;
+                let opaqueCount = 0;
+                for (let i = 0; i < px.length; i += 16) {{  // Sample every 4th pixel
+                    if (px[i + 3] > 50) {{
+                        totalBrightness += (px[i] + px[i+1] + px[i+2]) / 3;
+                        opaqueCount++;
+                    }}
+                }}
+                const avgBright = opaqueCount > 0 ? totalBrightness / opaqueCount : 128;
+
+                // If dark icon, invert pixels to make them light grey
+                if (avgBright < 80) {{
+                    for (let i = 0; i < px.length; i += 4) {{
+                        if (px[i + 3] > 0) {{
+                            px[i]     = Math.min(255, 255 - px[i] + 40);     // R
+                            px[i + 1] = Math.min(255, 255 - px[i+1] + 40);   // G
+                            px[i + 2] = Math.min(255, 255 - px[i+2] + 40);   // B
+                        }}
+                    }}
+                    tmpCtx.putImageData(imgData, 0, 0);
+                }}
+                return tmpCanvas;
+            }});
+            lightenedLogos.set(logoUrl, promise);
+            return promise;
         }}
 
         function createLabelSprite(text, color, nodeSize) {{
@@ -3811,12 +5183,13 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             // Reset to force-directed (clear fixed positions)
             const nodes = getGraphNodes();
             if (nodes.length === 0) return;
+            if (applyPrecomputedLayout(nodes, 'force', false)) return;
             nodes.forEach(node => {{
                 node.fx = undefined;
                 node.fy = undefined;
                 node.fz = undefined;
             }});
-            graph.d3ReheatSimulation();
+            reheatLayout();
         }}
 
         function applyLayeredLayout() {{
@@ -3824,6 +5197,8 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             const nodes = getGraphNodes();
             if (nodes.length === 0) return;
 
+            if (applyPrecomputedLayout(nodes, 'layered', true)) return;
+
             const tierSpacing = 100;
             const tierCounts = {{}};
 
@@ -3845,7 +5220,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                 tierCounts[tier].count++;
             }});
 
-            graph.d3ReheatSimulation();
+            reheatLayout();
             setTimeout(() => graph.zoomToFit(500), 100);
         }}
 
@@ -3854,6 +5229,8 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             const nodes = getGraphNodes();
             if (nodes.length === 0) return;
 
+            if (applyPrecomputedLayout(nodes, 'spherical', true)) return;
+
             const radius = 200;
             const groups = {{}};
 
@@ -3877,7 +5254,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                 }});
             }});
 
-            graph.d3ReheatSimulation();
+            reheatLayout();
             setTimeout(() => graph.zoomToFit(500), 100);
         }}
 
@@ -4023,6 +5400,8 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                 }});
             }}
 
+            if (applyPrecomputedLayout(nodes, 'cylinder', true)) return;
+
             // Map tiers to stage Y positions for node placement
             const tierToStageY = {{}};
             stageDefinitions.forEach(stage => {{
@@ -4055,7 +5434,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                 }});
             }});
 
-            graph.d3ReheatSimulation();
+            reheatLayout();
             setTimeout(() => graph.zoomToFit(500), 100);
         }}
 
@@ -4115,16 +5494,16 @@ def generate_html(data: dict[str, Any], title: str) -> str:
 
         // --- Time slider ---
         function initTimeSlider() {{
-            const nodesWithDates = nodesData.filter(n => n.createdAt);
-            if (nodesWithDates.length > 0) {{
+            if (graphStats.datedNodes > 0) {{
                 document.getElementById('time-toolbar').style.display = 'flex';
 
-                // Calculate date range
-                const dates = nodesWithDates.map(n => new Date(n.createdAt).getTime()).sort((a, b) => a - b);
-                window.timeRange = {{
-                    min: dates[0],
-                    max: dates[dates.length - 1]
-                }};
+                // Date range precomputed by the generator
+                if (graphStats.dateRange) {{
+                    window.timeRange = {{
+                        min: new Date(graphStats.dateRange[0]).getTime(),
+                        max: new Date(graphStats.dateRange[1]).getTime()
+                    }};
+                }}
             }}
         }}
 
@@ -4214,6 +5593,31 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             statsEl.textContent = `${{nodes.length}} nodes · ${{links.length}} edges`;
         }}
 
+        // --- FPS meter ---
+        function startFpsMeter() {{
+            const fpsEl = document.getElementById('fps-display');
+            let frames = 0;
+            let windowStart = performance.now();
+            let reports = 0;
+            const tick = now => {{
+                frames++;
+                if (now - windowStart >= 1000) {{
+                    const fps = frames * 1000 / (now - windowStart);
+                    const calls = graph.renderer().info.render.calls;
+                    fpsEl.textContent = `${{fps.toFixed(0)}} fps · ${{calls}} draw calls`;
+                    // One console report once the layout has settled a little
+                    if (++reports === 5) {{
+                        console.log(`[Athena] ${{fps.toFixed(1)}} fps, ${{calls}} draw calls, ` +
+                            `${{getGraphNodes().length}} nodes (${{instancedMode ? 'instanced' : 'per-object'}} rendering)`);
+                    }}
+                    frames = 0;
+                    windowStart = now;
+                }}
+                requestAnimationFrame(tick);
+            }};
+            requestAnimationFrame(tick);
+        }}
+
         // --- Path highlighting (find shortest path between multi-selected nodes) ---
         function highlightPath() {{
             if (multiSelectedNodes.size !== 2) {{
@@ -4257,7 +5661,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                 if (visited.has(nodeId)) continue;
                 visited.add(nodeId);
 
-                const connections = linksByNode[nodeId] || [];
+                const connections = getNodeLinks(nodeId);
                 for (const conn of connections) {{
                     if (!visited.has(conn.nodeId)) {{
                         queue.push([...path, conn.nodeId]);
@@ -4274,7 +5678,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
 
             if (metric === 'connections') {{
                 nodesData.forEach(node => {{
-                    values[node.id] = (linksByNode[node.id] || []).length;
+                    values[node.id] = node.degree;
                 }});
             }} else if (metric === 'recency') {{
                 const now = Date.now();
@@ -4328,16 +5732,11 @@ def generate_html(data: dict[str, Any], title: str) -> str:
 
         // --- Size by centrality ---
         function applyCentralitySizing() {{
-            // Simple degree centrality
-            const centrality = {{}};
-            nodesData.forEach(node => {{
-                centrality[node.id] = (linksByNode[node.id] || []).length;
-            }});
-
-            const maxCent = Math.max(...Object.values(centrality));
+            // Degree centrality precomputed by the generator
+            const maxCent = maxDegree || 1;
 
             graph.nodeVal(node => {{
-                const c = centrality[node.id] || 0;
+                const c = node.degree || 0;
                 return Math.max(node.val * (0.5 + (c / maxCent) * 1.5), 2);
             }});
         }}
@@ -4418,7 +5817,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
                     if (!groupReps[node.group]) {{
                         groupReps[node.group] = {{
                             ...node,
-                            name: `${{node.groupLabel || node.group}} (${{nodesData.filter(n => n.group === node.group).length}})`,
+                            name: `${{node.groupLabel || node.group}} (${{graphStats.groupCounts[node.group] || 0}})`,
                             val: 50, // Larger for group node
                             isGroupNode: true
                         }};
@@ -4439,6 +5838,94 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             setGraphData({{ nodes: visibleNodes, links: visibleLinks }});
         }}
 
+        // --- Level-of-detail meta-nodes (generate_3d.py --node-budget) ---
+        const expandedLodNodes = new Set();
+        const lodTopNodes = lodData ? nodesData.slice() : [];
+
+        function lodVisibleCount() {{
+            let count = lodTopNodes.length;
+            expandedLodNodes.forEach(id => {{ count += lodData.members[id].length - 1; }});
+            return count;
+        }}
+
+        function toggleLodNode(metaId) {{
+            if (!lodData || !lodData.members[metaId]) return;
+            if (expandedLodNodes.has(metaId)) {{
+                expandedLodNodes.delete(metaId);
+            }} else {{
+                expandedLodNodes.add(metaId);
+                // Stay within the node budget by folding the oldest expansions back
+                for (const id of expandedLodNodes) {{
+                    if (id === metaId || lodVisibleCount() <= lodData.budget) break;
+                    expandedLodNodes.delete(id);
+                }}
+                // Members without precomputed positions start around the meta-node
+                const meta = nodeMap[metaId];
+                lodData.members[metaId].forEach(node => {{
+                    if (node.x === undefined) {{
+                        node.x = (meta.x || 0) + (Math.random() - 0.5) * 20;
+                        node.y = (meta.y || 0) + (Math.random() - 0.5) * 20;
+                        node.z = (meta.z || 0) + (Math.random() - 0.5) * 20;
+                    }}
+                }});
+            }}
+            applyLodExpansion();
+        }}
+
+        // Expand the meta-node hiding nodeId, if any; returns true if the graph changed
+        function revealLodNode(nodeId) {{
+            const node = nodeMap[nodeId];
+            if (!node || !node.lodParent || expandedLodNodes.has(node.lodParent)) return false;
+            toggleLodNode(node.lodParent);
+            return true;
+        }}
+
+        function applyLodExpansion() {{
+            // Rebuild nodesData/linksData in place from the full link list so
+            // filters, search and group collapse all see the current level of detail
+            nodesData.length = 0;
+            lodTopNodes.forEach(node => {{
+                if (expandedLodNodes.has(node.id)) {{
+                    lodData.members[node.id].forEach(member => nodesData.push(member));
+                }} else {{
+                    nodesData.push(node);
+                }}
+            }});
+
+            const visibleId = id => {{
+                const parent = nodeMap[id] && nodeMap[id].lodParent;
+                return parent && !expandedLodNodes.has(parent) ? parent : id;
+            }};
+            const aggregated = new Map();
+            lodData.links.forEach(link => {{
+                const source = visibleId(link.source);
+                const target = visibleId(link.target);
+                // Links to members folded into an expanded meta-node have nothing to attach to
+                if (source === target || expandedLodNodes.has(source) || expandedLodNodes.has(target)) return;
+                const key = source < target ? `${{source}}|${{target}}|${{link.edgeType}}` : `${{target}}|${{source}}|${{link.edgeType}}`;
+                const existing = aggregated.get(key);
+                if (existing) {{
+                    existing.weight += link.weight || 1;
+                }} else {{
+                    aggregated.set(key, {{ link, source, target, weight: link.weight || 1 }});
+                }}
+            }});
+            // Same link budget as the generator: heaviest aggregated links first
+            const heaviest = [...aggregated.values()].sort((a, b) => b.weight - a.weight).slice(0, lodData.linkBudget);
+            linksData.length = 0;
+            heaviest.forEach(({{ link, source, target, weight }}) => linksData.push({{ ...link, source, target, weight }}));
+            indexLinksByNode();
+
+            if (selectedNode && !nodesData.includes(selectedNode)) {{
+                clearSelection();
+            }} else if (collapsedGroups.size) {{
+                applyGroupCollapse();
+            }} else {{
+                applyFilters();
+            }}
+            console.log(`[Athena] LOD: ${{nodesData.length}} nodes, ${{linksData.length}} links (${{expandedLodNodes.size}} expanded)`);
+        }}
+
         // --- Edge thickness by weight ---
         function applyEdgeThickness() {{
             graph.linkWidth(link => {{
@@ -4452,6 +5939,7 @@ def generate_html(data: dict[str, Any], title: str) -> str:
             initTimeSlider();
             checkVRSupport();
             updateStats();
+            startFpsMeter();
 
             // Update stats when graph data changes
             const originalGraphData = graph.graphData.bind(graph);
@@ -4466,16 +5954,169 @@ def generate_html(data: dict[str, Any], title: str) -> str:
         initGraph();
         checkEmbedMode();
         initExtendedFeatures();
+        prefetchDescriptions();
     </script>
 </body>
 </html>'''
 
-    return html
+    if not split_data:
+        return html
+
+    payload = {
+        "nodes": nodes_list,
+        "links": links_list,
+        "groups": groups,
+        "physicalGroups": physical_groups,
+        "maxDegree": max_degree,
+        "lod": lod,
+        "adjacency": adjacency,
+        "searchIndex": search_index,
+        "stats": graph_stats,
+        "logoAtlas": logo_atlas,
+        "instanced": instanced,
+    }
+    return split_html_assets(html, payload, description_chunks, extra_assets=logo_assets)
+
+
+def gzip_json(value: Any) -> bytes:
+    """Compact JSON, gzip-compressed deterministically (no timestamp)."""
+    raw = json.dumps(value, separators=(",", ":")).encode("utf-8")
+    return gzip.compress(raw, compresslevel=9, mtime=0)
+
+
+def content_hash(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()[:12]
+
+
+# Shell loader: fetch the data file and viewer script in parallel, then run the
+# viewer once the data is in place. .gz files are decompressed in the browser
+# unless the server already applied Content-Encoding.
+SPLIT_LOADER_TEMPLATE = """    <link rel="preload" href="{app_url}" as="script">
+    <script>
+        (function() {{
+            const loadStart = performance.now();
+
+            async function athenaFetchJson(url) {{
+                const response = await fetch(url);
+                if (!response.ok) throw new Error(`${{url}}: HTTP ${{response.status}}`);
+                const bytes = new Uint8Array(await response.arrayBuffer());
+                if (bytes[0] === 0x1f && bytes[1] === 0x8b) {{
+                    const stream = new Blob([bytes]).stream().pipeThrough(new DecompressionStream('gzip'));
+                    return JSON.parse(await new Response(stream).text());
+                }}
+                return JSON.parse(new TextDecoder().decode(bytes));
+            }}
+            window.athenaFetchJson = athenaFetchJson;
+
+            athenaFetchJson('{data_url}').then(data => {{
+                window.athenaData = data;
+                const script = document.createElement('script');
+                script.src = '{app_url}';
+                script.onload = () => requestAnimationFrame(() => {{
+                    console.log(`[Athena] First render after ${{(performance.now() - loadStart).toFixed(0)}} ms`);
+                }});
+                document.body.appendChild(script);
+            }}).catch(err => console.error('[Athena] Failed to load graph data:', err));
+        }})();
+    </script>"""
+
+
+def split_html_assets(html: str, payload: dict[str, Any], description_chunks: list[dict[str, str]],
+                      extra_assets: Optional[dict[str, bytes]] = None):
+    """Split a generated page into a small shell and content-hashed assets.
+
+    The viewer script only depends on the template, so its hashed file is
+    shared by every graph and stays cached across regenerations; only the
+    data file (and description chunks) change when the graph does.
+
+    Returns:
+        (shell_html, assets) where assets maps file name -> bytes, to be
+        written into SPLIT_DATA_DIR next to the shell (including any
+        extra_assets the payload already refers to, e.g. logo atlas pages)
+    """
+    script_open = "    <script>\n        // Data\n"
+    script_close = "    </script>\n</body>"
+    start = html.index(script_open)
+    end = html.rindex(script_close)
+    app_js = html[start + len(script_open):end].encode("utf-8")
+
+    assets = dict(extra_assets or {})
+    app_name = f"athena-3d.{content_hash(app_js)}.js"
+    assets[app_name] = app_js
+
+    chunk_urls = []
+    for chunk in description_chunks:
+        chunk_bytes = gzip_json(chunk)
+        chunk_name = f"desc.{content_hash(chunk_bytes)}.json.gz"
+        assets[chunk_name] = chunk_bytes
+        chunk_urls.append(f"{SPLIT_DATA_DIR}/{chunk_name}")
+
+    payload = dict(payload, descriptionChunks=chunk_urls)
+    data_bytes = gzip_json(payload)
+    data_name = f"graph.{content_hash(data_bytes)}.json.gz"
+    assets[data_name] = data_bytes
+
+    loader = SPLIT_LOADER_TEMPLATE.format(
+        app_url=f"{SPLIT_DATA_DIR}/{app_name}",
+        data_url=f"{SPLIT_DATA_DIR}/{data_name}",
+    )
+    shell = html[:start] + loader + "\n</body>" + html[end + len(script_close):]
+    return shell, assets
+
+
+def split_assets_missing(output_path: str) -> bool:
+    """Whether a --split-data output lacks its asset list or any asset on it."""
+    asset_dir = Path(output_path).parent / SPLIT_DATA_DIR
+    try:
+        names = json.loads((asset_dir / f"{Path(output_path).name}.assets.json").read_text())
+    except (OSError, ValueError):
+        return True
+    return not all((asset_dir / name).is_file() for name in names)
+
+
+def prune_split_assets(asset_dir: Path, output_name: str, names: list[str]) -> list[str]:
+    """Record the assets an output references and delete the ones it stopped using.
+
+    Each output lists its asset names in "<output name>.assets.json" in
+    asset_dir. Names in the previous list but not the new one are deleted,
+    unless another output's list still has them (the viewer script is
+    shared). Call after the new HTML is written.
+
+    Returns:
+        names of the deleted files
+    """
+    manifest_path = asset_dir / f"{output_name}.assets.json"
+    try:
+        previous = set(json.loads(manifest_path.read_text()))
+    except (OSError, ValueError):
+        previous = set()
+    tmp_path = manifest_path.with_suffix(".tmp")
+    tmp_path.write_text(json.dumps(sorted(names)))
+    tmp_path.replace(manifest_path)
+
+    in_use = set(names)
+    for other in asset_dir.glob("*.assets.json"):
+        if other != manifest_path:
+            try:
+                in_use.update(json.loads(other.read_text()))
+            except (OSError, ValueError):
+                continue
+    removed = sorted(previous - in_use)
+    for name in removed:
+        (asset_dir / name).unlink(missing_ok=True)
+    return removed
 
 
 def generate_visualization(
     input_path: str,
     output_path: str,
+    split_data: bool = False,
+    precompute_layout: bool = False,
+    layout_iterations: int = FORCE_ITERATIONS,
+    node_budget: Optional[int] = None,
+    logo_dir: Optional[str] = None,
+    fetch_logos: bool = False,
+    instanced: Optional[bool] = None,
 ) -> str:
     """Generate a 3D network visualization from JSON data."""
     # Load data
@@ -4488,16 +6129,37 @@ def generate_visualization(
     print(f"Loaded graph: {len(data['nodes'])} nodes, {len(data['edges'])} edges")
 
     # Generate HTML
-    html = generate_html(data, title)
+    html = generate_html(data, title, split_data=split_data,
+                         precompute_layout=precompute_layout, layout_iterations=layout_iterations,
+                         node_budget=node_budget, logo_dir=logo_dir, fetch_logos=fetch_logos,
+                         instanced=instanced)
 
     # Ensure output directory exists
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
 
+    if split_data:
+        html, assets = html
+        asset_dir = output_file.parent / SPLIT_DATA_DIR
+        asset_dir.mkdir(parents=True, exist_ok=True)
+        for name, content in assets.items():
+            asset_path = asset_dir / name
+            if not asset_path.exists():
+                asset_path.write_bytes(content)
+        asset_bytes = sum(len(c) for n, c in assets.items() if not n.startswith("desc."))
+        print(f"Wrote {len(assets)} assets to {asset_dir} "
+              f"({asset_bytes:,} bytes before descriptions, "
+              f"{sum(n.startswith('desc.') for n in assets)} description chunks)")
+
     # Write HTML
     with open(output_file, 'w') as f:
         f.write(html)
 
+    if split_data:
+        removed = prune_split_assets(asset_dir, output_file.name, list(assets))
+        if removed:
+            print(f"Removed {len(removed)} superseded assets from {asset_dir}")
+
     print(f"Generated 3D visualization: {output_file}")
     return str(output_file)
 
@@ -4517,11 +6179,66 @@ def main():
         help="Path for output HTML file"
     )
 
+    parser.add_argument(
+        "--split-data",
+        action="store_true",
+        help="Write a small HTML shell plus content-hashed viewer script, gzip data file "
+             "and lazily loaded description chunks (in a data/ directory next to the output)"
+    )
+
+    parser.add_argument(
+        "--precompute-layout",
+        action="store_true",
+        help="Compute force/layered/spherical/cylinder positions offline (NumPy) so the viewer "
+             "renders without simulation warm-up"
+    )
+    parser.add_argument(
+        "--layout-iterations",
+        type=int,
+        default=FORCE_ITERATIONS,
+        help="Force simulation iterations for --precompute-layout"
+    )
+
+    parser.add_argument(
+        "--node-budget",
+        type=int,
+        default=None,
+        help="Level of detail: above this many nodes, open the graph collapsed into group/tier "
+             "meta-nodes that expand on click"
+    )
+
+    parser.add_argument(
+        "--logo-dir",
+        default=None,
+        help="Pack node logos found in this directory (e.g. output/static) into texture atlas "
+             "pages; requires Pillow"
+    )
+    parser.add_argument(
+        "--fetch-logos",
+        action="store_true",
+        help="With --logo-dir, first download remote logos missing from that directory"
+    )
+
+    parser.add_argument(
+        "--instanced",
+        action=argparse.BooleanOptionalAction,
+        default=None,
+        help="Draw nodes and links as instanced meshes instead of one object each "
+             f"(default: on above {INSTANCED_NODE_THRESHOLD:,} visible nodes)"
+    )
+
     args = parser.parse_args()
 
     generate_visualization(
         input_path=args.input,
         output_path=args.output,
+        split_data=args.split_data,
+        precompute_layout=args.precompute_layout,
+        layout_iterations=args.layout_iterations,
+        node_budget=args.node_budget,
+        logo_dir=args.logo_dir,
+        fetch_logos=args.fetch_logos,
+        instanced=args.instanced,
     )
 
 
@@ -5,7 +5,7 @@ Radial/Concentric Ring Knowledge Graph Visualization Generator
 World-class visualization following best practices:
 - Concentric ring layout with tier-based positioning
 - Visual hierarchy through size, opacity, and glow
-- Curved edge bundling for reduced visual clutter
+- Hierarchical edge bundling along the tier/group tree, precomputed offline
 - Smooth polar coordinate animations
 - Progressive disclosure on interaction
 - Human-centered design principles (J5 philosophy)
@@ -15,11 +15,25 @@ Usage:
 """
 
 import argparse
+import base64
+import hashlib
 import json
 import math
 from pathlib import Path
 from typing import Any
 
+# Ring layout, computed here and embedded as each node's radialPos
+RING_SPACING = 120  # Distance between concentric rings
+RING_Z_JITTER = 30  # Depth variation of nodes on a ring
+
+# Edge bundling: polylines through the tier/group/sector hierarchy
+BUNDLE_STRENGTH = 0.85  # 0 = straight edges, 1 = follow the hierarchy exactly
+BUNDLE_SEGMENTS = 16  # Polyline segments per edge
+BUNDLE_SECTORS_PER_RING = 8  # A group's run of nodes splits into arcs of at most 1/8 ring
+BUNDLE_SECTOR_RADIUS = 0.8  # Sector control points, as a fraction of the ring radius
+BUNDLE_GROUP_RADIUS = 0.5  # Group control points, before scaling by how spread the group is
+BUNDLE_QUANTUM = 0.1  # Polyline coordinates ship as Int16 multiples of this, or coarser beyond +-3276.7
+
 
 def load_json_data(filepath: str) -> dict[str, Any]:
     """Load graph data from JSON file."""
@@ -27,8 +41,153 @@ def load_json_data(filepath: str) -> dict[str, Any]:
         return json.load(f)
 
 
-def generate_radial_html(data: dict[str, Any], title: str) -> str:
-    """Generate radial/concentric ring visualization HTML."""
+def radial_positions(tier_nodes: dict[int, list[str]]) -> dict[str, list[float]]:
+    """Ring positions: hub tier at the centre, other tiers evenly spaced on a
+    ring of radius tier * RING_SPACING, with a small depth offset derived
+    from the node id so every build lays out the same."""
+    positions = {}
+    for tier, node_ids in tier_nodes.items():
+        radius = tier * RING_SPACING
+        for index, node_id in enumerate(node_ids):
+            if tier == 0:
+                positions[node_id] = [0.0, 0.0, 0.0]
+                continue
+            angle = 2 * math.pi * index / len(node_ids) - math.pi / 2
+            jitter = int(hashlib.md5(node_id.encode()).hexdigest()[:8], 16) / 0xFFFFFFFF - 0.5
+            positions[node_id] = [round(radius * math.cos(angle), 2), round(radius * math.sin(angle), 2),
+                                  round(jitter * RING_Z_JITTER, 2)]
+    return positions
+
+
+def _bspline_basis(n_control: int, samples: int):
+    """(samples, n_control) clamped B-spline basis (cubic, or lower for few points)."""
+    import numpy as np
+
+    degree = min(3, n_control - 1)
+    spans = n_control - degree
+    knots = np.concatenate([np.zeros(degree), np.arange(spans + 1), np.full(degree, spans)]).astype(float)
+    t = np.linspace(0, spans, samples)
+    t[-1] -= 1e-9  # Keep the last sample inside the final span
+    basis = ((knots[:-1] <= t[:, None]) & (t[:, None] < knots[1:])).astype(float)
+    for d in range(1, degree + 1):
+        nxt = np.zeros((samples, basis.shape[1] - 1))
+        for i in range(nxt.shape[1]):
+            left = knots[i + d] - knots[i]
+            right = knots[i + d + 1] - knots[i + 1]
+            if left:
+                nxt[:, i] += (t - knots[i]) / left * basis[:, i]
+            if right:
+                nxt[:, i] += (knots[i + d + 1] - t) / right * basis[:, i + 1]
+        basis = nxt
+    return basis
+
+
+def bundle_edges(nodes_list: list[dict[str, Any]], links_list: list[dict[str, Any]],
+                 tier_nodes: dict[int, list[str]], positions: dict[str, list[float]],
+                 strength: float = BUNDLE_STRENGTH, segments: int = BUNDLE_SEGMENTS) -> dict[str, Any]:
+    """Hierarchical edge bundling (Holten 2006) over the ring layout.
+
+    The hierarchy is centre -> (tier, group) -> sector -> node, where a
+    sector is a run of up to 1/BUNDLE_SECTORS_PER_RING of a ring's nodes
+    of one group. Sector control points sit just inside the ring; group
+    control points sit further in, closer to the centre the more of the
+    ring the group covers. Each edge follows the tree path between its
+    endpoints as a B-spline, straightened by (1 - strength), and is
+    sampled into segments + 1 points. Links get a "bundle" index into the
+    packed Int16 polylines; z is interpolated between the endpoints.
+    Nodes without a group share a "default" sector per run.
+    """
+    import numpy as np
+
+    ring_index = {node_id: (tier, index) for tier, node_ids in tier_nodes.items()
+                  for index, node_id in enumerate(node_ids)}
+    node_info = {node["id"]: node for node in nodes_list}
+
+    # Sectors: consecutive ring positions of one group, capped in length
+    sector_of = {}
+    sector_members = []
+    for tier, node_ids in tier_nodes.items():
+        cap = max(1, math.ceil(len(node_ids) / BUNDLE_SECTORS_PER_RING))
+        previous_group = None
+        for node_id in node_ids:
+            group = node_info[node_id].get("group") or "default"
+            if group != previous_group or len(sector_members[-1][2]) >= cap:
+                sector_members.append((tier, group, []))
+            sector_members[-1][2].append(node_id)
+            sector_of[node_id] = len(sector_members) - 1
+            previous_group = group
+
+    def arc_point(node_ids, tier, factor, spread_scaled):
+        xy = np.array([positions[node_id][:2] for node_id in node_ids])
+        radius = tier * RING_SPACING
+        if radius == 0:
+            return np.zeros(2)
+        mean = (xy / radius).mean(axis=0)  # Resultant of unit vectors: length 1 = one point, 0 = full ring
+        length = np.linalg.norm(mean)
+        if length < 1e-9:
+            return np.zeros(2)
+        scale = factor * radius * (length if spread_scaled else 1.0)
+        return mean / length * scale
+
+    sector_pos = np.array([arc_point(ids, tier, BUNDLE_SECTOR_RADIUS, False) for tier, _, ids in sector_members])
+    group_key = {}
+    for tier, group, ids in sector_members:
+        group_key.setdefault((tier, group), []).extend(ids)
+    group_ids = {key: i for i, key in enumerate(group_key)}
+    group_pos = np.array([arc_point(ids, key[0], BUNDLE_GROUP_RADIUS, True) for key, ids in group_key.items()])
+
+    samples = segments + 1
+    points = np.zeros((len(links_list), samples, 3))
+    by_length = {3: [], 5: [], 7: []}
+    for i, link in enumerate(links_list):
+        source, target = link["source"], link["target"]
+        if source not in ring_index or target not in ring_index:
+            continue
+        s_sector, t_sector = sector_of[source], sector_of[target]
+        s_group = group_ids[sector_members[s_sector][:2]]
+        t_group = group_ids[sector_members[t_sector][:2]]
+        if s_sector == t_sector:
+            path = [sector_pos[s_sector]]
+        elif s_group == t_group:
+            path = [sector_pos[s_sector], group_pos[s_group], sector_pos[t_sector]]
+        else:
+            path = [sector_pos[s_sector], group_pos[s_group], np.zeros(2), group_pos[t_group], sector_pos[t_sector]]
+        by_length[len(path) + 2].append((i, path))
+        link["bundle"] = i
+
+    for n_control, edges in by_length.items():
+        if not edges:
+            continue
+        rows = [i for i, _ in edges]
+        start = np.array([positions[links_list[i]["source"]] for i in rows])
+        end = np.array([positions[links_list[i]["target"]] for i in rows])
+        control = np.empty((len(rows), n_control, 2))
+        control[:, 0] = start[:, :2]
+        control[:, -1] = end[:, :2]
+        control[:, 1:-1] = np.array([path for _, path in edges])
+        # Straighten towards the chord so strength 0 gives straight edges
+        chord = start[:, None, :2] + np.linspace(0, 1, n_control)[None, :, None] * (end - start)[:, None, :2]
+        control = strength * control + (1 - strength) * chord
+        curve = np.einsum("sk,ekd->esd", _bspline_basis(n_control, samples), control)
+        z = start[:, None, 2] + np.linspace(0, 1, samples)[None, :] * (end - start)[:, None, 2]
+        points[rows] = np.concatenate([curve, z[..., None]], axis=2)
+
+    scale = max(BUNDLE_QUANTUM, float(np.abs(points).max(initial=0.0)) / np.iinfo(np.int16).max)
+    quantised = np.round(points / scale).astype("<i2")
+    return {
+        "segments": segments,
+        "scale": scale,
+        "points": {"type": "Int16Array", "data": base64.b64encode(quantised.tobytes()).decode("ascii")},
+    }
+
+
+def generate_radial_html(data: dict[str, Any], title: str, bundle_strength: float = BUNDLE_STRENGTH) -> str:
+    """Generate radial/concentric ring visualization HTML.
+
+    Node ring positions and bundled edge polylines (see bundle_edges) are
+    computed here, so the viewer draws bundled edges without per-frame
+    curve math.
+    """
 
     groups = data.get("groups", {})
 
@@ -83,10 +242,16 @@ def generate_radial_html(data: dict[str, Any], title: str) -> str:
             "edgeType": edge_type,
         })
 
+    positions = radial_positions(tier_nodes)
+    for node in nodes_list:
+        node["radialPos"] = positions[node["id"]]
+    edge_bundles = bundle_edges(nodes_list, links_list, tier_nodes, positions, strength=bundle_strength)
+
     nodes_json = json.dumps(nodes_list)
     links_json = json.dumps(links_list)
     groups_json = json.dumps(groups)
     tier_nodes_json = json.dumps(tier_nodes)
+    edge_bundles_json = json.dumps(edge_bundles)
 
     description = data.get("metadata", {}).get("description", "Interactive knowledge graph")
 
@@ -96,7 +261,8 @@ def generate_radial_html(data: dict[str, Any], title: str) -> str:
     <meta charset="utf-8">
     <title>{title}</title>
     <link rel="icon" href="data:,">
-    <script src="//unpkg.com/3d-force-graph"></script>
+    <script src="//unpkg.com/three@0.160.0/build/three.min.js"></script>
+    <script src="//unpkg.com/3d-force-graph@1.73.4/dist/3d-force-graph.min.js"></script>
     <style>
         * {{
             margin: 0;
@@ -519,10 +685,7 @@ def generate_radial_html(data: dict[str, Any], title: str) -> str:
         const linksData = {links_json};
         const groupsData = {groups_json};
         const tierNodes = {tier_nodes_json};
-
-        // Configuration
-        const RING_SPACING = 120;  // Distance between concentric rings
-        const HUB_RADIUS = 0;      // Center position for hub
+        const edgeBundles = {edge_bundles_json};
 
         // Create lookups
         const nodeMap = {{}};
@@ -545,35 +708,81 @@ def generate_radial_html(data: dict[str, Any], title: str) -> str:
         let currentDimension = 3;
         let sidebarVisible = true;
 
-        // Calculate radial positions for nodes
+        // Radial positions for nodes, computed by generate_radial.py so the
+        // bundled edge polylines line up with them
         function calculateRadialPositions() {{
             const positions = {{}};
-            const maxTier = Math.max(...Object.keys(tierNodes).map(Number));
-
-            for (const [tier, nodeIds] of Object.entries(tierNodes)) {{
-                const tierNum = parseInt(tier);
-                const radius = tierNum === 0 ? HUB_RADIUS : tierNum * RING_SPACING;
-                const count = nodeIds.length;
-
-                nodeIds.forEach((nodeId, index) => {{
-                    if (tierNum === 0) {{
-                        // Hub at center
-                        positions[nodeId] = {{ x: 0, y: 0, z: 0 }};
-                    }} else {{
-                        // Distribute evenly on ring with slight randomization for 3D depth
-                        const angle = (2 * Math.PI * index) / count - Math.PI / 2;
-                        const zOffset = (Math.random() - 0.5) * 30; // Slight 3D variation
-                        positions[nodeId] = {{
-                            x: radius * Math.cos(angle),
-                            y: radius * Math.sin(angle),
-                            z: zOffset
-                        }};
-                    }}
-                }});
-            }}
+            nodesData.forEach(node => {{
+                const [x, y, z] = node.radialPos;
+                positions[node.id] = {{ x, y, z }};
+            }});
             return positions;
         }}
 
+        // Bundled edges: polylines precomputed by generate_radial.py
+        // (edgeBundles.points holds segments + 1 points per link, indexed by
+        // link.bundle). Each becomes a static tube built once, so the radial
+        // view does no per-frame curve math; the force layout moves nodes and
+        // falls back to the default curved links.
+        function decodeTypedArray(packed) {{
+            const binary = atob(packed.data);
+            const bytes = new Uint8Array(binary.length);
+            for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+            return new window[packed.type](bytes.buffer);
+        }}
+        const bundlePoints = decodeTypedArray(edgeBundles.points);
+        let currentLinkOpacity = 0.6;
+
+        function bundledLinkObject(link) {{
+            if (link.bundle === undefined) return null;
+            const count = edgeBundles.segments + 1;
+            const offset = link.bundle * count * 3;
+            const points = [];
+            for (let i = 0; i < count; i++) {{
+                const o = offset + i * 3;
+                points.push(new THREE.Vector3(
+                    bundlePoints[o] * edgeBundles.scale,
+                    bundlePoints[o + 1] * edgeBundles.scale,
+                    bundlePoints[o + 2] * edgeBundles.scale
+                ));
+            }}
+            const geometry = new THREE.TubeGeometry(new THREE.CatmullRomCurve3(points), edgeBundles.segments, link.width / 2, 4, false);
+            const material = new THREE.MeshLambertMaterial({{
+                color: link.color,
+                transparent: true,
+                opacity: linkOpacityFor(link)
+            }});
+            link.__bundleMesh = new THREE.Mesh(geometry, material);
+            return link.__bundleMesh;
+        }}
+
+        function setEdgeBundling(enabled) {{
+            if (typeof THREE === 'undefined') return;
+            graph
+                .linkThreeObject(enabled ? bundledLinkObject : null)
+                // Returning true skips the library's per-frame update of bundled links
+                .linkPositionUpdate(enabled ? (obj, ends, link) => link.bundle !== undefined : null)
+                .linkDirectionalParticles(enabled ? 0 : linkParticles);
+        }}
+
+        function linkOpacityFor(link) {{
+            return typeof currentLinkOpacity === 'function' ? currentLinkOpacity(link) : currentLinkOpacity;
+        }}
+
+        // Bundled tubes are our objects, so per-link opacity is applied here
+        function setLinkOpacity(opacity) {{
+            currentLinkOpacity = opacity;
+            graph.linkOpacity(typeof opacity === 'function' ? 0.6 : opacity);
+            linksData.forEach(link => {{
+                if (link.__bundleMesh) link.__bundleMesh.material.opacity = linkOpacityFor(link);
+            }});
+        }}
+
+        function linkParticles(link) {{
+            // Particles on important connections
+            return link.edgeType === 'strategic_partner' ? 2 : 0;
+        }}
+
         // Apply radial layout
         function applyRadialLayout() {{
             const positions = calculateRadialPositions();
@@ -593,6 +802,8 @@ def generate_radial_html(data: dict[str, Any], title: str) -> str:
                 }}
             }});
 
+            setEdgeBundling(true);
+
             // Re-set the graph data to apply positions
             graph.graphData({{ nodes: [...nodes], links: [...links] }});
 
@@ -610,6 +821,7 @@ def generate_radial_html(data: dict[str, Any], title: str) -> str:
                 node.fy = undefined;
                 node.fz = undefined;
             }});
+            setEdgeBundling(false);
             graph.graphData({{ nodes, links: graph.graphData().links }});
             graph.d3ReheatSimulation();
         }}
@@ -760,12 +972,12 @@ def generate_radial_html(data: dict[str, Any], title: str) -> str:
                     if (n.id === focusNode.id) return 1;
                     if (connectedIds.has(n.id)) return 0.9;
                     return 0.3;
-                }})
-                .linkOpacity(link => {{
-                    const sId = typeof link.source === 'object' ? link.source.id : link.source;
-                    const tId = typeof link.target === 'object' ? link.target.id : link.target;
-                    return (sId === focusNode.id || tId === focusNode.id) ? 0.8 : 0.1;
                 }});
+            setLinkOpacity(link => {{
+                const sId = typeof link.source === 'object' ? link.source.id : link.source;
+                const tId = typeof link.target === 'object' ? link.target.id : link.target;
+                return (sId === focusNode.id || tId === focusNode.id) ? 0.8 : 0.1;
+            }});
         }}
 
         function focusOnNode(node) {{
@@ -806,8 +1018,8 @@ def generate_radial_html(data: dict[str, Any], title: str) -> str:
             // Reset colors
             graph
                 .nodeColor(n => n.color)
-                .nodeOpacity(1)
-                .linkOpacity(0.6);
+                .nodeOpacity(1);
+            setLinkOpacity(0.6);
         }}
 
         function navigateToNode(nodeId) {{
@@ -836,8 +1048,8 @@ def generate_radial_html(data: dict[str, Any], title: str) -> str:
             // Reset colors
             graph
                 .nodeColor(n => n.color)
-                .nodeOpacity(1)
-                .linkOpacity(0.6);
+                .nodeOpacity(1);
+            setLinkOpacity(0.6);
         }}
 
         // Initialize
@@ -863,10 +1075,7 @@ def generate_radial_html(data: dict[str, Any], title: str) -> str:
                 .linkWidth(link => link.width)
                 .linkOpacity(0.6)
                 .linkCurvature(0.2)  // Curved edges for better readability
-                .linkDirectionalParticles(link => {{
-                    // Particles on important connections
-                    return link.edgeType === 'strategic_partner' ? 2 : 0;
-                }})
+                .linkDirectionalParticles(linkParticles)
                 .linkDirectionalParticleWidth(2)
                 .linkDirectionalParticleSpeed(0.005)
                 .onNodeClick(handleNodeClick)
@@ -909,7 +1118,7 @@ def generate_radial_html(data: dict[str, Any], title: str) -> str:
     return html
 
 
-def generate_visualization(input_path: str, output_path: str) -> str:
+def generate_visualization(input_path: str, output_path: str, bundle_strength: float = BUNDLE_STRENGTH) -> str:
     """Generate a radial visualization from JSON data."""
     data = load_json_data(input_path)
     metadata = data.get("metadata", {})
@@ -917,7 +1126,7 @@ def generate_visualization(input_path: str, output_path: str) -> str:
 
     print(f"Loaded graph: {len(data['nodes'])} nodes, {len(data['edges'])} edges")
 
-    html = generate_radial_html(data, title)
+    html = generate_radial_html(data, title, bundle_strength=bundle_strength)
 
     output_file = Path(output_path)
     output_file.parent.mkdir(parents=True, exist_ok=True)
@@ -933,8 +1142,10 @@ def main():
     parser = argparse.ArgumentParser(description="Generate radial knowledge graph visualization")
     parser.add_argument("--input", "-i", required=True, help="Input JSON file")
     parser.add_argument("--output", "-o", required=True, help="Output HTML file")
+    parser.add_argument("--bundle-strength", type=float, default=BUNDLE_STRENGTH,
+                        help="Edge bundling strength, 0 (straight) to 1 (tightly bundled)")
     args = parser.parse_args()
-    generate_visualization(args.input, args.output)
+    generate_visualization(args.input, args.output, bundle_strength=args.bundle_strength)
 
 
 if __name__ == "__main__":
@@ -2,12 +2,20 @@
 """
 Generate schema relationship graphs from Zeus Memory data.
 Creates JSON visualization data showing table/column relationships.
+
+All schemas are fetched over one connection in a single query; chunk
+decoding and graph building then run per schema in a process pool.
 """
 
 import json
-import psycopg2
+import os
+import re
+import time
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
+import psycopg2
+
 conn_params = {
     'host': 'psql-zeus-memory-dev.postgres.database.azure.com',
     'port': 5432,
@@ -24,65 +32,162 @@ TABLE_COLORS = {
     "date": "#805ad5",      # Purple - date tables
     "measure": "#e53e3e",   # Red - measures
     "column": "#3182ce",    # Blue - columns
+    "key": "#d69e2e",       # Yellow - key columns (inferred references)
     "hub": "#dd6b20",       # Orange - hub/center
 }
 
+# Navigator zoom levels (see /api/navigator/graph)
+SCHEMA_LEVELS = [
+    {"id": "schema", "name": "Schema View", "description": "Tables and inferred references"},
+    {"id": "element", "name": "Element View", "description": "Columns and measures of one table"},
+]
 
-def get_schema_data(source_prefix):
-    """Get all schema chunks from Zeus Memory."""
-    conn = psycopg2.connect(**conn_params)
-    cur = conn.cursor()
 
-    # Get main schema record
-    cur.execute("""
-        SELECT content FROM zeus_core.memories
-        WHERE source = %s LIMIT 1
-    """, (source_prefix,))
+# Chunk records stored under "<prefix><suffix><n>" next to the main "<prefix>" record
+CHUNK_SUFFIXES = {'columns': '_CHUNK_', 'measures': '_MEASURES_'}
 
-    main_row = cur.fetchone()
-    if not main_row:
-        return None
 
-    main_data = json.loads(main_row[0])
+def like_prefix(prefix):
+    """LIKE pattern matching sources that start with prefix (with _ and % escaped)."""
+    return prefix.replace('\\', '\\\\').replace('_', '\\_').replace('%', '\\%') + '%'
 
-    # Get column chunks
-    columns = []
+
+def fetch_schema_rows(cur, source_prefixes):
+    """Raw (source, content) rows for every prefix, in one query.
+
+    Only the main records and their _CHUNK_ / _MEASURES_ chunks match, so
+    other sources sharing a prefix are filtered by the database.
+
+    Returns {prefix: {'main': content or None, 'columns': [...], 'measures': [...]}}
+    with chunk contents still JSON-encoded, in source order.
+    """
     cur.execute("""
-        SELECT content FROM zeus_core.memories
-        WHERE source LIKE %s
+        SELECT source, content FROM zeus_core.memories
+        WHERE source = ANY(%s) OR source LIKE ANY(%s)
         ORDER BY source
-    """, (f"{source_prefix}_CHUNK_%",))
+    """, (list(source_prefixes),
+          [like_prefix(prefix + suffix) for prefix in source_prefixes for suffix in CHUNK_SUFFIXES.values()]))
+
+    rows = {prefix: {'main': None, 'columns': [], 'measures': []} for prefix in source_prefixes}
+    # Longest prefix first, in case one requested prefix extends another
+    by_length = sorted(source_prefixes, key=len, reverse=True)
+    for source, content in cur:
+        prefix = next((p for p in by_length if source.startswith(p)), None)
+        if prefix is None:
+            continue
+        if source == prefix:
+            if rows[prefix]['main'] is None:
+                rows[prefix]['main'] = content
+        else:
+            for kind, suffix in CHUNK_SUFFIXES.items():
+                if source.startswith(prefix + suffix):
+                    rows[prefix][kind].append(content)
+    return rows
+
+
+def decode_schema_rows(schema_rows):
+    """Decode one schema's raw rows into {'main', 'columns', 'measures'}."""
+    if schema_rows['main'] is None:
+        return None
 
-    for row in cur.fetchall():
-        chunk_data = json.loads(row[0])
+    columns = []
+    for content in schema_rows['columns']:
+        chunk_data = json.loads(content)
         if 'columns' in chunk_data:
             columns.extend(chunk_data['columns'])
 
-    # Get measure chunks
     measures = []
-    cur.execute("""
-        SELECT content FROM zeus_core.memories
-        WHERE source LIKE %s
-        ORDER BY source
-    """, (f"{source_prefix}_MEASURES_%",))
-
-    for row in cur.fetchall():
-        chunk_data = json.loads(row[0])
+    for content in schema_rows['measures']:
+        chunk_data = json.loads(content)
         if 'measures' in chunk_data:
             measures.extend(chunk_data['measures'])
 
-    cur.close()
-    conn.close()
-
     return {
-        'main': main_data,
+        'main': json.loads(schema_rows['main']),
         'columns': columns,
         'measures': measures
     }
 
 
-def create_graph_json(schema_data, client_name):
-    """Convert schema data to visualization JSON format."""
+def get_schema_data(source_prefix):
+    """Get all schema chunks from Zeus Memory."""
+    conn = psycopg2.connect(**conn_params)
+    try:
+        with conn.cursor() as cur:
+            return decode_schema_rows(fetch_schema_rows(cur, [source_prefix])[source_prefix])
+    finally:
+        conn.close()
+
+
+def table_id_for(table_name):
+    return table_name.lower().replace(' ', '_').replace('(', '').replace(')', '')
+
+
+def build_reference_index(tables):
+    """Lowercased table name (spaces as _) -> indices in tables, plus the name lengths."""
+    index = {}
+    for i, table_name in enumerate(tables):
+        index.setdefault(table_name.lower().replace(' ', '_'), []).append(i)
+    return index, sorted({len(name) for name in index})
+
+
+def referenced_tables(col_name, reference_index):
+    """Indices of tables whose name appears in col_name as '<table>_id' or '<table>id'.
+
+    Equivalent to testing every table with a substring search, but only the
+    text just before each 'id' in the column name is looked up, so the cost
+    does not grow with the number of tables.
+    """
+    index, lengths = reference_index
+    matches = set()
+    start = col_name.find('id')
+    while start != -1:
+        # '<table>id': table is a suffix of the text before 'id';
+        # '<table>_id': a suffix of the text before '_id'
+        ends = [start, start - 1] if start > 0 and col_name[start - 1] == '_' else [start]
+        for end in ends:
+            for length in lengths:
+                if length > end:
+                    break
+                matches.update(index.get(col_name[end - length:end], ()))
+        start = col_name.find('id', start + 1)
+    return sorted(matches)
+
+
+def column_references(tables, columns):
+    """(column, source table, referenced table names) for every column with a table locator.
+
+    References are foreign key-like name matches ('<table>_id' / '<table>id'),
+    excluding the column's own table.
+    """
+    reference_index = build_reference_index(tables)
+    for col in columns:
+        locator = col.get('column_locator', '')
+        if "'" not in locator:
+            continue
+        source_table = locator.split("'")[1]
+        source_id = table_id_for(source_table)
+        refs = []
+        for table_index in referenced_tables(col.get('column_name', '').lower(), reference_index):
+            target = tables[table_index]
+            # Compared as node ids, so differently-cased duplicates don't self-reference
+            if table_id_for(target) != source_id:
+                refs.append(target)
+        yield col, source_table, refs
+
+
+def table_graph_file(tables_dir, table_name):
+    """Path of a table's column-level sub-graph, relative to the schema graph."""
+    return f"{tables_dir}/{re.sub(r'[^A-Za-z0-9_-]', '_', table_id_for(table_name))}.json"
+
+
+def create_graph_json(schema_data, client_name, tables_dir=None):
+    """Convert schema data to visualization JSON format.
+
+    Columns are summarised on their table nodes. With tables_dir, table
+    nodes are expandable: each links to the column-level sub-graph written
+    by create_table_graphs, listed under navigation.zoom_targets.
+    """
     main = schema_data['main']
     columns = schema_data['columns']
     measures = schema_data['measures']
@@ -117,7 +222,7 @@ def create_graph_json(schema_data, client_name):
 
     # Determine table types based on naming conventions
     for table_name in tables:
-        table_id = table_name.lower().replace(' ', '_').replace('(', '').replace(')', '')
+        table_id = table_id_for(table_name)
 
         # Classify table type
         if 'date' in table_name.lower():
@@ -132,14 +237,19 @@ def create_graph_json(schema_data, client_name):
 
         col_count = len(table_columns.get(table_name, []))
 
-        nodes.append({
+        node = {
             "id": f"table_{table_id}",
             "label": table_name,
             "tier": tier,
             "group": group,
             "title": f"{table_name}\n{col_count} columns",
             "size": 20 + min(col_count * 2, 20)
-        })
+        }
+        if tables_dir:
+            node["expandable"] = True
+            node["zoom_target"] = table_graph_file(tables_dir, table_name)
+            node["children_preview"] = {"columns": col_count}
+        nodes.append(node)
 
         # Connect table to hub
         edges.append({
@@ -161,7 +271,7 @@ def create_graph_json(schema_data, client_name):
                 measure_tables[table_name].append(measure)
 
         for table_name, table_measures in measure_tables.items():
-            table_id = table_name.lower().replace(' ', '_').replace('(', '').replace(')', '')
+            table_id = table_id_for(table_name)
             measure_node_id = f"measures_{table_id}"
 
             nodes.append({
@@ -182,25 +292,13 @@ def create_graph_json(schema_data, client_name):
 
     # Create edges between related tables (based on common column patterns)
     # Look for foreign key-like relationships
-    for col in columns:
-        col_name = col.get('column_name', '').lower()
-        locator = col.get('column_locator', '')
-
-        if "'" in locator:
-            source_table = locator.split("'")[1]
-            source_id = f"table_{source_table.lower().replace(' ', '_').replace('(', '').replace(')', '')}"
-
-            # Look for ID columns that might reference other tables
-            for table_name in tables:
-                table_lower = table_name.lower().replace(' ', '_')
-                if f"{table_lower}_id" in col_name or f"{table_lower}id" in col_name:
-                    target_id = f"table_{table_lower.replace('(', '').replace(')', '')}"
-                    if source_id != target_id:
-                        edges.append({
-                            "source": source_id,
-                            "target": target_id,
-                            "type": "references"
-                        })
+    for _, source_table, refs in column_references(tables, columns):
+        for target_table in refs:
+            edges.append({
+                "source": f"table_{table_id_for(source_table)}",
+                "target": f"table_{table_id_for(target_table)}",
+                "type": "references"
+            })
 
     # Build final JSON structure
     groups = {
@@ -217,7 +315,7 @@ def create_graph_json(schema_data, client_name):
         "references": {"color": "#3182ce", "width": 2, "label": "References"},
     }
 
-    return {
+    graph_json = {
         "metadata": {
             "title": f"{client_name} Data Schema",
             "description": f"Schema visualization for {dataset_name} - {len(tables)} tables, {len(columns)} columns, {len(measures)} measures",
@@ -230,6 +328,185 @@ def create_graph_json(schema_data, client_name):
         "nodes": nodes,
         "edges": edges
     }
+    if tables_dir:
+        graph_json["navigation"] = {
+            "levels": SCHEMA_LEVELS,
+            "zoom_targets": {
+                node["id"]: {
+                    "target_graph": node["zoom_target"],
+                    "level": "element",
+                    "description": f"Columns and measures of {node['label']}",
+                }
+                for node in nodes if node.get("expandable")
+            },
+        }
+    return graph_json
+
+
+def column_title(col):
+    """Tooltip text for a column or measure record."""
+    lines = [col.get('column_locator', '')]
+    for key in ('data_type', 'format', 'description', 'expression'):
+        if col.get(key):
+            lines.append(f"{key.replace('_', ' ').title()}: {col[key]}")
+    return "\n".join(line for line in lines if line)
+
+
+def create_table_graphs(schema_data, client_name, tables_dir):
+    """Column-level sub-graph per table, keyed by file path (see table_graph_file).
+
+    Each is a standalone navigator graph: the table at the centre, its
+    columns (key columns highlighted) and measures, and the tables it
+    references or is referenced by as expandable stubs that open their
+    own sub-graphs.
+    """
+    tables = schema_data['main'].get('schema', {}).get('definition', {}).get('tables', [])
+    table_set = set(tables)
+
+    columns_by_table = {}
+    referenced_by = {}
+    for col, source_table, refs in column_references(tables, schema_data['columns']):
+        columns_by_table.setdefault(source_table, []).append((col, refs))
+        for target_table in refs:
+            referenced_by.setdefault(target_table, {}).setdefault(source_table, None)
+
+    measures_by_table = {}
+    for measure in schema_data['measures']:
+        locator = measure.get('column_locator', '')
+        if "'" in locator:
+            measures_by_table.setdefault(locator.split("'")[1], []).append(measure)
+
+    groups = {
+        "hub": {"color": TABLE_COLORS["hub"], "label": "Table"},
+        "column": {"color": TABLE_COLORS["column"], "label": "Columns"},
+        "key": {"color": TABLE_COLORS["key"], "label": "Key Columns"},
+        "measure": {"color": TABLE_COLORS["measure"], "label": "Measures"},
+        "dimension": {"color": TABLE_COLORS["dimension"], "label": "Related Tables"},
+    }
+    edge_types = {
+        "has_column": {"color": "#718096", "width": 1, "label": "Has Column"},
+        "has_measure": {"color": "#e53e3e", "width": 1, "label": "Has Measure"},
+        "references": {"color": "#3182ce", "width": 2, "label": "References"},
+    }
+
+    graphs = {}
+    for table_name in sorted(table_set | set(columns_by_table) | set(measures_by_table)):
+        table_node_id = f"table_{table_id_for(table_name)}"
+        table_columns = columns_by_table.get(table_name, [])
+        table_measures = measures_by_table.get(table_name, [])
+        nodes = [{
+            "id": table_node_id,
+            "label": table_name,
+            "tier": 0,
+            "group": "hub",
+            "title": f"{table_name}\n{len(table_columns)} columns\n{len(table_measures)} measures",
+            "size": 40
+        }]
+        edges = []
+        related = {}
+
+        def related_node(other_table):
+            node_id = f"table_{table_id_for(other_table)}"
+            if node_id not in related:
+                related[node_id] = {
+                    "id": node_id,
+                    "label": other_table,
+                    "tier": 3,
+                    "group": "dimension",
+                    "title": f"{other_table} (open to see its columns)",
+                    "size": 20,
+                    "expandable": other_table in table_set,
+                    "zoom_target": table_graph_file(tables_dir, other_table),
+                }
+            return node_id
+
+        for i, (col, refs) in enumerate(table_columns):
+            col_node_id = f"{table_node_id}__col_{i}"
+            nodes.append({
+                "id": col_node_id,
+                "label": col.get('column_name', ''),
+                "tier": 1,
+                "group": "key" if refs else "column",
+                "title": column_title(col),
+                "size": 14 if refs else 10
+            })
+            edges.append({"source": table_node_id, "target": col_node_id, "type": "has_column"})
+            for target_table in refs:
+                edges.append({"source": col_node_id, "target": related_node(target_table), "type": "references"})
+
+        for i, measure in enumerate(table_measures):
+            measure_node_id = f"{table_node_id}__measure_{i}"
+            locator = measure.get('column_locator', '')
+            nodes.append({
+                "id": measure_node_id,
+                "label": locator.split('[', 1)[1].rstrip(']') if '[' in locator else locator,
+                "tier": 2,
+                "group": "measure",
+                "title": column_title(measure),
+                "size": 10
+            })
+            edges.append({"source": table_node_id, "target": measure_node_id, "type": "has_measure"})
+
+        for source_table in referenced_by.get(table_name, {}):
+            edges.append({"source": related_node(source_table), "target": table_node_id, "type": "references"})
+
+        nodes.extend(related.values())
+        graphs[table_graph_file(tables_dir, table_name)] = {
+            "metadata": {
+                "title": f"{client_name}: {table_name}",
+                "description": f"{table_name} - {len(table_columns)} columns, {len(table_measures)} measures, "
+                               f"{len(related)} related tables",
+                "source": "Zeus Memory / Eclipse API",
+                "created": datetime.now().strftime("%Y-%m-%d"),
+                "updated": datetime.now().strftime("%Y-%m-%d")
+            },
+            "navigation": {"levels": SCHEMA_LEVELS, "level": "element"},
+            "groups": groups,
+            "edge_types": edge_types,
+            "nodes": nodes,
+            "edges": edges
+        }
+    return graphs
+
+
+def build_schema_graph(schema_rows, client_name, output_file):
+    """Worker: decode one schema's rows, build its graph and table sub-graphs, and write them.
+
+    Sub-graphs go to <output name without _graph.json>_tables/ next to the
+    schema graph; files for tables that no longer exist are removed.
+    """
+    start = time.perf_counter()
+    schema_data = decode_schema_rows(schema_rows)
+    if not schema_data:
+        return None
+
+    output_dir, output_name = os.path.split(output_file)
+    tables_dir = output_name.replace('_graph.json', '') + '_tables'
+    graph_json = create_graph_json(schema_data, client_name, tables_dir=tables_dir)
+    table_graphs = create_table_graphs(schema_data, client_name, tables_dir)
+
+    tables_path = os.path.join(output_dir, tables_dir)
+    os.makedirs(tables_path, exist_ok=True)
+    written = set()
+    for relative_path, table_graph in table_graphs.items():
+        with open(os.path.join(output_dir, relative_path), 'w') as f:
+            json.dump(table_graph, f, indent=2)
+        written.add(os.path.basename(relative_path))
+    for stale in set(os.listdir(tables_path)) - written:
+        if stale.endswith('.json'):
+            os.remove(os.path.join(tables_path, stale))
+
+    with open(output_file, 'w') as f:
+        json.dump(graph_json, f, indent=2)
+
+    return {
+        'columns': len(schema_data['columns']),
+        'nodes': len(graph_json['nodes']),
+        'edges': len(graph_json['edges']),
+        'tables_dir': tables_path,
+        'table_graphs': len(table_graphs),
+        'seconds': time.perf_counter() - start,
+    }
 
 
 def main():
@@ -241,23 +518,35 @@ def main():
 
     output_dir = "data/examples"
 
-    for source_prefix, client_name in schemas:
-        print(f"\nProcessing {client_name}...")
-
-        schema_data = get_schema_data(source_prefix)
-        if not schema_data:
-            print(f"  No data found for {source_prefix}")
-            continue
-
-        graph_json = create_graph_json(schema_data, client_name)
-
-        output_file = f"{output_dir}/{source_prefix.lower()}_graph.json"
-        with open(output_file, 'w') as f:
-            json.dump(graph_json, f, indent=2)
-
-        print(f"  Generated {output_file}")
-        print(f"  - Nodes: {len(graph_json['nodes'])}")
-        print(f"  - Edges: {len(graph_json['edges'])}")
+    start = time.perf_counter()
+    conn = psycopg2.connect(**conn_params)
+    try:
+        with conn.cursor() as cur:
+            rows = fetch_schema_rows(cur, [prefix for prefix, _ in schemas])
+    finally:
+        conn.close()
+    print(f"Fetched {sum(len(r['columns']) + len(r['measures']) for r in rows.values())} chunks "
+          f"for {len(schemas)} schemas in {time.perf_counter() - start:.2f}s")
+
+    with ProcessPoolExecutor(max_workers=min(len(schemas), os.cpu_count() or 1)) as pool:
+        futures = {}
+        for source_prefix, client_name in schemas:
+            output_file = f"{output_dir}/{source_prefix.lower()}_graph.json"
+            futures[source_prefix] = (client_name, output_file,
+                                      pool.submit(build_schema_graph, rows[source_prefix], client_name, output_file))
+
+        for source_prefix, (client_name, output_file, future) in futures.items():
+            print(f"\nProcessing {client_name}...")
+            summary = future.result()
+            if not summary:
+                print(f"  No data found for {source_prefix}")
+                continue
+
+            print(f"  Generated {output_file} in {summary['seconds']:.2f}s")
+            print(f"  - Columns: {summary['columns']}")
+            print(f"  - Nodes: {summary['nodes']}")
+            print(f"  - Edges: {summary['edges']}")
+            print(f"  - Table sub-graphs: {summary['table_graphs']} in {summary['tables_dir']}")
 
 
 if __name__ == "__main__":
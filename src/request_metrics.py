@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+"""
+Request-level performance metrics for the Athena API.
+
+MetricsMiddleware times every request under its route template (never the
+raw path, so ids don't multiply series) and records status, response size
+and time to first byte. Code inside a request adds what happened on the
+way: cache hits and misses, database queries and snapshot loads. Queries
+and other named stages timed during a request are also kept per request,
+so requests slower than a threshold are sampled with their route,
+parameters and stage breakdown.
+
+api_server exposes a RequestMetrics as Prometheus text on /metrics and as
+a JSON summary on /metrics/summary.
+"""
+
+import bisect
+import contextvars
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from urllib.parse import parse_qsl
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+SIZE_BUCKETS = (100, 1_000, 10_000, 100_000, 1_000_000, 10_000_000, 100_000_000)
+
+# Stage name -> seconds for the request being handled; threadpool calls
+# inherit the context, so they add to the same dict
+_request_stages = contextvars.ContextVar("request_stages", default=None)
+
+
+class Histogram:
+    """Bucketed observations in Prometheus' layout (upper bounds, plus +Inf)."""
+
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float):
+        """Estimate, interpolating within the bucket the quantile falls in."""
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, n in enumerate(self.counts):
+            if n and seen + n >= rank:
+                lower = self.buckets[i - 1] if i else 0.0
+                if i == len(self.buckets):
+                    return lower  # beyond the last bound: all we know is "more than"
+                return lower + (self.buckets[i] - lower) * (rank - seen) / n
+            seen += n
+        return self.buckets[-1]
+
+
+def _labels(**labels) -> str:
+    """Prometheus label set with escaped values."""
+    return "{" + ",".join(
+        f'{key}="' + str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") + '"'
+        for key, value in labels.items()
+    ) + "}"
+
+
+class RequestMetrics:
+    """Counters and histograms for requests, caches, queries and snapshot loads."""
+
+    def __init__(self, slow_seconds: float = 1.0, slow_samples: int = 100):
+        self.slow_seconds = slow_seconds  # requests at least this slow are sampled
+        self.slow_requests = deque(maxlen=slow_samples)
+        self.started = time.time()
+        self._lock = threading.Lock()
+        self._requests = {}  # (method, route, status) -> count
+        self._latency = {}  # (method, route) -> Histogram of seconds
+        self._sizes = {}  # (method, route) -> Histogram of response bytes
+        self._cache = {}  # (cache, "hit" | "miss") -> count
+        self._queries = {}  # query name -> Histogram of seconds
+        self._query_errors = {}  # query name -> count
+        self._snapshot_loads = {}  # scope -> Histogram of seconds
+
+    @staticmethod
+    def _observe(table: dict, key, buckets: tuple, value: float):
+        histogram = table.get(key)
+        if histogram is None:
+            histogram = table[key] = Histogram(buckets)
+        histogram.observe(value)
+
+    def observe_request(self, scope: dict, status: int, seconds: float, size: int,
+                        first_byte: float, stages: dict):
+        method = scope.get("method", "")
+        route = request_route(scope)
+        with self._lock:
+            key = (method, route, status)
+            self._requests[key] = self._requests.get(key, 0) + 1
+            self._observe(self._latency, (method, route), LATENCY_BUCKETS, seconds)
+            self._observe(self._sizes, (method, route), SIZE_BUCKETS, size)
+            if seconds >= self.slow_seconds:
+                self.slow_requests.append({
+                    "time": time.time(),
+                    "method": method,
+                    "route": route,
+                    "path_params": dict(scope.get("path_params") or {}),
+                    "query": dict(parse_qsl(scope.get("query_string", b"").decode("latin-1"))),
+                    "status": status,
+                    "duration_ms": round(seconds * 1e3, 2),
+                    "first_byte_ms": round(first_byte * 1e3, 2) if first_byte is not None else None,
+                    "bytes": size,
+                    "stages_ms": {name: round(value * 1e3, 2) for name, value in stages.items()},
+                })
+
+    def cache_result(self, cache: str, hit: bool):
+        key = (cache, "hit" if hit else "miss")
+        with self._lock:
+            self._cache[key] = self._cache.get(key, 0) + 1
+
+    def observe_snapshot_load(self, scope: str, seconds: float):
+        with self._lock:
+            self._observe(self._snapshot_loads, scope, LATENCY_BUCKETS, seconds)
+
+    @contextmanager
+    def stage(self, name: str):
+        """Time a block as a named stage of the current request (no-op outside one)."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            stages = _request_stages.get()
+            if stages is not None:
+                stages[name] = stages.get(name, 0.0) + time.perf_counter() - start
+
+    @contextmanager
+    def query(self, name: str):
+        """Time a database call; also a "db:<name>" stage of the current request."""
+        start = time.perf_counter()
+        failed = False
+        try:
+            with self.stage(f"db:{name}"):
+                yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._observe(self._queries, name, LATENCY_BUCKETS, time.perf_counter() - start)
+                if failed:
+                    self._query_errors[name] = self._query_errors.get(name, 0) + 1
+
+    def render_prometheus(self, gauges: dict = None) -> str:
+        """Prometheus text exposition; gauges maps "name{labels}" -> value for point-in-time values."""
+        lines = []
+
+        def histogram(name: str, help_text: str, table: dict, label_names: tuple):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} histogram")
+            for key, h in table.items():
+                labels = dict(zip(label_names, key if isinstance(key, tuple) else (key,)))
+                cumulative = 0
+                for bound, n in zip(h.buckets + ("+Inf",), h.counts):
+                    cumulative += n
+                    lines.append(f"{name}_bucket{_labels(**labels, le=bound)} {cumulative}")
+                lines.append(f"{name}_sum{_labels(**labels)} {h.sum}")
+                lines.append(f"{name}_count{_labels(**labels)} {h.count}")
+
+        def counter(name: str, help_text: str, table: dict, label_names: tuple):
+            lines.append(f"# HELP {name} {help_text}")
+            lines.append(f"# TYPE {name} counter")
+            for key, n in table.items():
+                labels = dict(zip(label_names, key if isinstance(key, tuple) else (key,)))
+                lines.append(f"{name}{_labels(**labels)} {n}")
+
+        with self._lock:
+            counter("athena_http_requests_total", "Requests by route template and status.",
+                    self._requests, ("method", "route", "status"))
+            histogram("athena_http_request_duration_seconds", "Time from request to last body byte.",
+                      self._latency, ("method", "route"))
+            histogram("athena_http_response_size_bytes", "Response body bytes as sent (after compression).",
+                      self._sizes, ("method", "route"))
+            counter("athena_cache_requests_total", "Cache lookups by cache and result.",
+                    self._cache, ("cache", "result"))
+            histogram("athena_db_query_duration_seconds", "Database calls by query name.",
+                      self._queries, ("query",))
+            counter("athena_db_query_errors_total", "Database calls that raised.",
+                    self._query_errors, ("query",))
+            histogram("athena_snapshot_load_duration_seconds", "Snapshot parse + index + precompile time.",
+                      self._snapshot_loads, ("scope",))
+        for name, value in (gauges or {}).items():
+            lines.append(f"{name} {value}")
+        return "\n".join(lines) + "\n"
+
+    def summary(self) -> dict:
+        """JSON-friendly view: per-route latency percentiles, cache hit rates, query timings."""
+
+        def timings(h: Histogram) -> dict:
+            return {
+                "count": h.count,
+                "mean_ms": round(h.sum / h.count * 1e3, 2) if h.count else None,
+                "p50_ms": round(h.quantile(0.5) * 1e3, 2) if h.count else None,
+                "p99_ms": round(h.quantile(0.99) * 1e3, 2) if h.count else None,
+            }
+
+        with self._lock:
+            routes = {}
+            for (method, route), h in sorted(self._latency.items(), key=lambda item: -item[1].sum):
+                sizes = self._sizes[(method, route)]
+                routes[f"{method} {route}"] = {
+                    **timings(h),
+                    "mean_bytes": round(sizes.sum / sizes.count) if sizes.count else None,
+                    "statuses": {str(status): n for (m, r, status), n in self._requests.items()
+                                 if (m, r) == (method, route)},
+                }
+            caches = {}
+            for (cache, result), n in self._cache.items():
+                caches.setdefault(cache, {"hit": 0, "miss": 0})[result] = n
+            for counts in caches.values():
+                counts["hit_rate"] = round(counts["hit"] / (counts["hit"] + counts["miss"]), 4)
+            return {
+                "uptime_seconds": round(time.time() - self.started, 1),
+                "routes": routes,
+                "caches": caches,
+                "db_queries": {name: {**timings(h), "errors": self._query_errors.get(name, 0)}
+                               for name, h in self._queries.items()},
+                "snapshot_loads": {scope: timings(h) for scope, h in self._snapshot_loads.items()},
+                "slow_request_ms": self.slow_seconds * 1e3,
+                "slow_requests": list(self.slow_requests),
+            }
+
+
+def request_route(scope: dict) -> str:
+    """Route template the router matched ("/api/l1/{cluster_id}"), or "unmatched"."""
+    route = scope.get("route")
+    if route is not None and getattr(route, "path", None) is not None:
+        return route.path
+    endpoint = scope.get("endpoint")  # routers that don't record the route
+    return getattr(endpoint, "__name__", None) or "unmatched"
+
+
+class MetricsMiddleware:
+    """ASGI middleware feeding RequestMetrics; add it last so it wraps everything else."""
+
+    def __init__(self, app, metrics: RequestMetrics):
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        stages = {}
+        token = _request_stages.set(stages)
+        status, size, first_byte = 500, 0, None
+
+        async def send_timed(message):
+            nonlocal status, size, first_byte
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                first_byte = time.perf_counter() - start
+            elif message["type"] == "http.response.body":
+                size += len(message.get("body", b""))
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_timed)
+        finally:
+            _request_stages.reset(token)
+            self.metrics.observe_request(scope, status, time.perf_counter() - start, size, first_byte, stages)
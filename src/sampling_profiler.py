@@ -0,0 +1,218 @@
+#!/usr/bin/env python3
+"""
+Opt-in stack-sampling profiler for live API workers.
+
+A StackSampler thread wakes every interval, reads every other thread's
+current frame (sys._current_frames()) and counts the call stacks it sees.
+Nothing is installed into the interpreter (no sys.setprofile / settrace),
+so code runs at full speed between samples and there is no cost at all
+while no sampler is running. The sampler needs the GIL to read frames, so
+busy Python code is sampled about once per switch interval (5 ms) however
+small the interval: profile requests long enough to collect a few dozen
+samples.
+
+Profiles render as collapsed stacks ("thread;outer;...;inner count", the
+input of flamegraph.pl and speedscope's import) or as speedscope JSON with
+one sampled profile per thread.
+
+api_server uses it two ways, both behind the admin token:
+- POST /admin/profile?seconds=N samples the whole worker for N seconds
+- a request sent with "X-Profile: collapsed" (or "speedscope") is sampled
+  while it runs, and ProfileMiddleware answers with the profile in place
+  of the response body. The profile never has to be fetched from the
+  worker that took the request, so it works behind any number of workers.
+"""
+
+import asyncio
+import json
+import os
+import sys
+import threading
+import time
+from collections import Counter
+
+PROFILE_FORMATS = ("collapsed", "speedscope")
+MAX_STACK_DEPTH = 128
+
+
+class Profile:
+    """Counted stacks from one sampling run."""
+
+    def __init__(self, stacks: Counter, interval: float, duration: float, samples: int):
+        self.stacks = stacks  # (thread name, (frame, ...) outermost first) -> times seen
+        self.interval = interval
+        self.duration = duration
+        self.samples = samples  # sampling passes (each sees every thread once)
+
+    def collapsed(self) -> str:
+        lines = [";".join((thread,) + frames) + f" {count}"
+                 for (thread, frames), count in self.stacks.most_common()]
+        return "\n".join(lines) + "\n"
+
+    def speedscope(self, name: str = "athena") -> dict:
+        frames = []
+        frame_index = {}
+        profiles = {}
+        for (thread, stack), count in self.stacks.items():
+            indices = []
+            for frame in stack:
+                if frame not in frame_index:
+                    frame_index[frame] = len(frames)
+                    frames.append({"name": frame})
+                indices.append(frame_index[frame])
+            profile = profiles.setdefault(thread, {
+                "type": "sampled",
+                "name": thread,
+                "unit": "seconds",
+                "startValue": 0,
+                "endValue": round(self.duration, 6),
+                "samples": [],
+                "weights": [],
+            })
+            profile["samples"].append(indices)
+            profile["weights"].append(round(count * self.interval, 6))
+        return {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "name": name,
+            "exporter": "athena sampling_profiler",
+            "shared": {"frames": frames},
+            "profiles": list(profiles.values()),
+        }
+
+    def render(self, fmt: str) -> tuple[bytes, str]:
+        """(body, content type) in one of PROFILE_FORMATS."""
+        if fmt == "speedscope":
+            return json.dumps(self.speedscope()).encode(), "application/json"
+        return self.collapsed().encode(), "text/plain; charset=utf-8"
+
+
+def frame_label(code) -> str:
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Samples the stacks of all other threads on start, then every interval
+    until stopped or until max_seconds have passed.
+
+    stop() joins the sampling thread, which can take up to an interval:
+    from async code, call it through a thread (asyncio.to_thread).
+    """
+
+    def __init__(self, interval: float = 0.005, max_seconds: float = None):
+        self.interval = interval
+        self.max_seconds = max_seconds
+        self._stacks = Counter()
+        self._samples = 0
+        self._stop = threading.Event()
+        self._thread = None
+        self._started = None
+        self._ended = None
+
+    def start(self) -> "StackSampler":
+        self._started = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="stack-sampler", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> Profile:
+        self._stop.set()
+        self._thread.join()
+        return Profile(self._stacks, self.interval, (self._ended or time.perf_counter()) - self._started,
+                       self._samples)
+
+    def _run(self):
+        own = threading.get_ident()
+        labels = {}  # code object -> frame label, so each is formatted once
+        names = {}
+        deadline = self._started + self.max_seconds if self.max_seconds else None
+        # Sample straight away, so requests shorter than an interval still get one
+        while True:
+            frames = sys._current_frames()
+            if frames.keys() - names.keys():
+                names = {thread.ident: thread.name for thread in threading.enumerate()}
+            for ident, frame in frames.items():
+                if ident == own:
+                    continue
+                stack = []
+                while frame is not None and len(stack) < MAX_STACK_DEPTH:
+                    code = frame.f_code
+                    label = labels.get(code)
+                    if label is None:
+                        label = labels[code] = frame_label(code)
+                    stack.append(label)
+                    frame = frame.f_back
+                self._stacks[(names.get(ident, str(ident)), tuple(reversed(stack)))] += 1
+            self._samples += 1
+            if self._stop.wait(self.interval):
+                break
+            if deadline is not None and time.perf_counter() >= deadline:
+                break
+        self._ended = time.perf_counter()
+
+
+class ProfileMiddleware:
+    """Profiles single requests sent with an X-Profile header by an authorized caller.
+
+    The request runs as usual, but its response body is discarded and the
+    profile is sent instead, with the original status in X-Profile-Status.
+    Sampling stops after max_seconds even if the request is still running.
+    Without the header a request costs one scan of its header list. The
+    sampler sees every thread of the worker, so concurrent requests show
+    up in the profile too; in the event loop thread, look for the route's
+    handler.
+    """
+
+    # Describe the discarded body, not the profile that replaces it
+    DROPPED_HEADERS = {b"content-length", b"content-type", b"content-encoding", b"etag", b"transfer-encoding"}
+
+    def __init__(self, app, authorized, interval: float = 0.001, max_seconds: float = 60):
+        self.app = app
+        self.authorized = authorized  # Authorization header value -> bool
+        self.interval = interval
+        self.max_seconds = max_seconds
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        mode = authorization = None
+        for name, value in scope["headers"]:
+            if name == b"x-profile":
+                mode = value.decode("latin-1").strip().lower()
+            elif name == b"authorization":
+                authorization = value.decode("latin-1")
+        if mode is None or not self.authorized(authorization or ""):
+            await self.app(scope, receive, send)
+            return
+
+        fmt = mode if mode in PROFILE_FORMATS else "collapsed"
+        start = None
+        discarded = 0
+
+        async def capture(message):
+            nonlocal start, discarded
+            if message["type"] == "http.response.start":
+                start = message
+            elif message["type"] == "http.response.body":
+                discarded += len(message.get("body", b""))
+
+        sampler = StackSampler(self.interval, self.max_seconds).start()
+        try:
+            await self.app(scope, receive, capture)
+        finally:
+            # Joining the sampler thread blocks; keep it off the event loop
+            profile = await asyncio.to_thread(sampler.stop)
+
+        body, content_type = await asyncio.to_thread(profile.render, fmt)
+        headers = [(name, value) for name, value in (start or {}).get("headers", [])
+                   if name.lower() not in self.DROPPED_HEADERS]
+        headers += [
+            (b"content-type", content_type.encode()),
+            (b"content-length", str(len(body)).encode()),
+            (b"x-profile-status", str(start["status"] if start else 500).encode()),
+            (b"x-profile-response-bytes", str(discarded).encode()),
+            (b"x-profile-samples", str(profile.samples).encode()),
+            (b"x-profile-seconds", f"{profile.duration:.3f}".encode()),
+        ]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+Generate a synthetic Zeus memory fixture for running the pipeline offline.
+
+Memories come from a hierarchy like the one clustering should recover:
+domains (future L2 clusters) made of topics (future L1 clusters) of
+Zipf-sized memories. Embeddings are 1024-dim unit vectors scattered around
+their topic's direction, which is scattered around its domain's, with
+spreads chosen so memories of one topic sit above cluster_memories' 0.7
+k-NN similarity threshold and topic centroids of one domain above its 0.6
+L2 threshold. Each topic has its own category mix, sources and keywords,
+so labels and filters have something to work with. Timestamps grow denser
+towards the present, and a few texts carry secrets for the redaction step.
+
+A fixture is a directory of:
+- memories.jsonl: id, content, source, category, created_at, metadata per line
+- embeddings.npy: float32 (count, 1024), row i for line i (memory-mappable)
+- manifest.json: count, dims, seed, domains, topics
+
+cluster_memories.py --fixture <dir> reads it instead of the database.
+
+Usage:
+    python src/synthetic_memories.py --memories 100000 --output data/fixtures/synthetic_100k
+    python src/synthetic_memories.py --memories 1000000 --output data/fixtures/synthetic_1m --seed 7
+"""
+
+import argparse
+import json
+import os
+import random
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+
+import numpy as np
+
+DIMS = 1024  # voyage embeddings, as cluster_memories expects
+MEMORIES_PER_TOPIC = 150  # Mean topic size; topic count scales with the corpus
+TOPICS_PER_DOMAIN = 12
+MEMORY_SPREAD = 0.5  # Noise norm around a topic: same-topic cosine ~ 1 / (1 + 0.5^2) = 0.8
+TOPIC_SPREAD = 0.7  # Noise norm around a domain: same-domain topic cosine ~ 0.67
+HISTORY_DAYS = 730
+SECRET_RATE = 0.005
+CHUNK_ROWS = 20000  # Embedding rows generated and written at a time
+
+CATEGORIES = ["decision", "cce_decision_log", "cce_research", "cce_failed_approach",
+              "cce_success_log", "cce_system", "cce", "architecture", "technical", "general"]
+SOURCES = ["slack", "email", "ms_graph", "api", "cce", "claude", "rss", "arxiv", "nextcloud", "web"]
+TEMPLATES = [
+    "Decision: {team} will {verb} the {a} {b} before {month}. {c} latency reached {n}ms at p99 "
+    "and {m}% of {b} requests retried.",
+    "Research log: compared {a} and {c} for {b} workloads. {a} handled {n} req/s on {m} cores; "
+    "{c} stalled after {k} minutes.",
+    "Failed approach: tried to {verb} {b} in {a} with {c}. Rolled back after {n} errors on day {k}.",
+    "Success log: {team} shipped {a} {b} v{k}.{m}, {n} records migrated with no incidents.",
+    "Meeting notes ({team}): {a} {b} review. Action items: {verb} {c}, measure {b} cost, report in {k} days.",
+]
+TEAMS = ["platform", "data", "growth", "infra", "search", "billing", "research", "ops"]
+VERBS = ["migrate", "shard", "cache", "deprecate", "rewrite", "batch", "index", "backfill"]
+MONTHS = ["January", "March", "May", "July", "September", "November"]
+SYLLABLES = ["zen", "ath", "kor", "vex", "lum", "dra", "pol", "tri", "nov", "cal", "mir", "sol",
+             "qua", "bel", "tor", "gin", "ray", "fen", "hal", "ost"]
+SECRETS = ["sk-{}", "xoxb-{}", "password='{}'", "api_key: '{}'", "ghp_{}"]
+
+
+def unit_rows(rows: np.ndarray) -> np.ndarray:
+    return rows / np.linalg.norm(rows, axis=1, keepdims=True)
+
+
+def scatter(centers: np.ndarray, spread: float, rng: np.random.Generator) -> np.ndarray:
+    """Unit vectors around unit centers, at noise norm ~spread."""
+    noise = rng.standard_normal(centers.shape, dtype=np.float32) * np.float32(spread / np.sqrt(DIMS))
+    return unit_rows(centers + noise)
+
+
+def build_topics(n_memories: int, rng: np.random.Generator, prng: random.Random) -> list[dict]:
+    """Topic directions, sizes, categories and vocabulary."""
+    n_topics = max(1, n_memories // MEMORIES_PER_TOPIC)
+    n_domains = max(1, n_topics // TOPICS_PER_DOMAIN)
+    domains = unit_rows(rng.standard_normal((n_domains, DIMS), dtype=np.float32))
+    topic_domain = rng.integers(0, n_domains, n_topics)
+    centers = scatter(domains[topic_domain], TOPIC_SPREAD, rng)
+
+    # Zipf-ish sizes: a few big topics, a long tail of small ones
+    weights = rng.lognormal(0, 1.0, n_topics)
+    sizes = np.maximum(1, np.round(weights / weights.sum() * n_memories)).astype(int)
+    sizes[np.argmax(sizes)] += n_memories - sizes.sum()
+
+    topics = []
+    for t in range(n_topics):
+        keywords = ["".join(prng.choices(SYLLABLES, k=prng.randint(2, 3))).title() for _ in range(4)]
+        topics.append({
+            "domain": int(topic_domain[t]),
+            "center": centers[t],
+            "size": int(sizes[t]),
+            "categories": prng.sample(CATEGORIES, 3),
+            "sources": prng.sample(SOURCES, 2),
+            "keywords": keywords,
+        })
+    return topics
+
+
+def memory_text(topic: dict, prng: random.Random) -> str:
+    a, b, c, d = topic["keywords"]
+    parts = [prng.choice(TEMPLATES).format(
+        team=prng.choice(TEAMS), verb=prng.choice(VERBS), month=prng.choice(MONTHS),
+        a=a, b=b.lower(), c=prng.choice((c, d)), n=prng.randint(10, 20000), m=prng.randint(1, 99),
+        k=prng.randint(1, 60)) for _ in range(prng.randint(1, 5))]
+    if prng.random() < SECRET_RATE:
+        token = "".join(prng.choices("abcdefghijklmnopqrstuvwxyz0123456789", k=40))
+        parts.insert(prng.randrange(len(parts) + 1), prng.choice(SECRETS).format(token))
+    return " ".join(parts)
+
+
+def created_at(now: datetime, prng: random.Random) -> str:
+    # sqrt skews towards the present: the corpus grows over time
+    days = HISTORY_DAYS * (1 - prng.random() ** 0.5)
+    return (now - timedelta(days=days)).isoformat()
+
+
+def generate_fixture(output_dir: str, n_memories: int, seed: int = 0) -> dict:
+    """Write a fixture of n_memories to output_dir; returns its manifest."""
+    os.makedirs(output_dir, exist_ok=True)
+    rng = np.random.default_rng(seed)
+    prng = random.Random(seed)
+    topics = build_topics(n_memories, rng, prng)
+    # Topic of each memory, shuffled so topics interleave in file order
+    assignment = np.repeat(np.arange(len(topics)), [t["size"] for t in topics])
+    rng.shuffle(assignment)
+    centers = np.stack([t["center"] for t in topics])
+    now = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+    embeddings = np.lib.format.open_memmap(os.path.join(output_dir, "embeddings.npy"), mode="w+",
+                                           dtype=np.float32, shape=(n_memories, DIMS))
+    with open(os.path.join(output_dir, "memories.jsonl"), "w") as f:
+        for start in range(0, n_memories, CHUNK_ROWS):
+            chunk = assignment[start:start + CHUNK_ROWS]
+            embeddings[start:start + len(chunk)] = scatter(centers[chunk], MEMORY_SPREAD, rng)
+            for t in chunk:
+                topic = topics[t]
+                category = prng.choice(topic["categories"])
+                f.write(json.dumps({
+                    "id": str(uuid.UUID(int=prng.getrandbits(128), version=4)),
+                    "content": memory_text(topic, prng),
+                    "source": prng.choice(topic["sources"]),
+                    "category": category,
+                    "created_at": created_at(now, prng),
+                    "metadata": {"category": category, "synthetic_topic": int(t)},
+                }) + "\n")
+    embeddings.flush()
+    del embeddings
+
+    manifest = {
+        "count": n_memories,
+        "dims": DIMS,
+        "seed": seed,
+        "domains": len({t["domain"] for t in topics}),
+        "topics": len(topics),
+        "generated_at": datetime.now().isoformat(),
+    }
+    with open(os.path.join(output_dir, "manifest.json"), "w") as f:
+        json.dump(manifest, f, indent=2)
+    return manifest
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a synthetic memory fixture with clustered embeddings")
+    parser.add_argument("--memories", type=int, default=10000)
+    parser.add_argument("--output", required=True, help="Fixture directory to write")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    manifest = generate_fixture(args.output, args.memories, args.seed)
+    print(f"Wrote {manifest['count']:,} memories in {manifest['topics']:,} topics / "
+          f"{manifest['domains']:,} domains to {args.output} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    main()